@@ -0,0 +1,106 @@
+"""Attribute bytes the recorder would write per hour of sensor updates.
+
+Adds all sensors (base meters plus quota) to Home Assistant through an entity
+platform, drives --cycles meter updates (default: one hour at the 5 s update
+interval, each ending with the controller's bundled entity flush) and listens
+to EVENT_STATE_CHANGED like the recorder does. Each state actually written by
+one of the integration's sensors is serialised without the
+_unrecorded_attributes of its entity class, so skipped writes cost nothing.
+Two numbers are reported:
+
+- attribute JSON written: sum over all recorded state writes (what an
+  attribute row per state would cost)
+- new shared attribute rows: only attribute sets not seen before for that
+  entity; the recorder deduplicates identical sets, so this is what grows the
+  state_attributes table
+
+Run it against this checkout and against the commit before "[user-012]":
+
+    python benchmarks/bench_recorder_attributes.py
+    python benchmarks/bench_recorder_attributes.py --components /tmp/pv_before/custom_components
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import timedelta
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from common import BASE_OPTIONS, METERS, FakeEntry, load_integration, parse_args, start_hass
+
+
+async def main() -> None:
+    args = parse_args(__doc__.splitlines()[0], cycles=(int, 720, "meter update cycles"))
+    pm = load_integration(args.components)
+    sensor = __import__("pv_management_fix.sensor", fromlist=["async_setup_entry"])
+
+    hass = await start_hass()
+    options = dict(
+        BASE_OPTIONS,
+        quota_enabled=True, quota_yearly_kwh=3000, quota_start_date="2026-01-01", quota_start_meter=500,
+    )
+    entry = FakeEntry(options)
+    ctrl = pm.PVManagementFixController(hass, entry)
+    ctrl._restored = True
+    hass.data.setdefault(pm.DOMAIN, {})[entry.entry_id] = {pm.DATA_CTRL: ctrl}
+    entities: list = []
+    await sensor.async_setup_entry(hass, entry, lambda new, *_: entities.extend(new))
+    # Without a config entry the platform skips the device registry; states are written as usual
+    platform = EntityPlatform(
+        hass=hass, logger=logging.getLogger(__name__), domain="sensor", platform_name=pm.DOMAIN,
+        platform=None, scan_interval=timedelta(seconds=30), entity_namespace=None,
+    )
+    await platform.async_add_entities(entities)
+    await ctrl.async_start()
+    await hass.async_block_till_done()
+
+    unrecorded = {
+        entity.entity_id: getattr(type(entity), "_unrecorded_attributes", frozenset()) for entity in entities
+    }
+    seen: dict[str, set[str]] = {}
+    counts = {"states": 0, "written": 0, "shared": 0}
+
+    def on_state_changed(event: Event) -> None:
+        new_state = event.data["new_state"]
+        if new_state is None or new_state.entity_id not in unrecorded:
+            return
+        excluded = unrecorded[new_state.entity_id]
+        blob = json.dumps(
+            {k: v for k, v in new_state.attributes.items() if k not in excluded},
+            default=str, separators=(",", ":"),
+        )
+        counts["states"] += 1
+        counts["written"] += len(blob)
+        known = seen.setdefault(new_state.entity_id, set())
+        if blob not in known:
+            known.add(blob)
+            counts["shared"] += len(blob)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, on_state_changed)
+    meters = dict(METERS)
+    for _ in range(args.cycles):
+        # 5 s of a sunny day: some production, part of it exported, a little import
+        meters["sensor.pv"] += 0.007
+        meters["sensor.export"] += 0.003
+        meters["sensor.import"] += 0.0005
+        for entity_id, value in meters.items():
+            hass.states.async_set(entity_id, round(value, 4))
+        await hass.async_block_till_done()
+        # End of the update interval: run the bundled flush the timer would run
+        ctrl._flush_entities()
+        await hass.async_block_till_done()
+
+    print(f"components: {args.components}")
+    print(f"sensors: {len(entities)}, cycles: {args.cycles}, state writes: {counts['states']:,}")
+    print(f"recorded attribute JSON written: {counts['written']:>10,} B")
+    print(f"new shared attribute rows:       {counts['shared']:>10,} B")
+    await ctrl.async_stop()
+    await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Event-loop time spent on state changes of entities the integration does not track.
+
+Fires --events state changes spread over --entities unrelated sensors, once
+without and once with a running controller, and reports the difference per
+event (minimum of --runs). Run it against this checkout and against the commit
+before "[user-001]" to compare the global EVENT_STATE_CHANGED listener with the
+targeted subscription:
+
+    python benchmarks/bench_state_changes.py
+    python benchmarks/bench_state_changes.py --components /tmp/pv_before/custom_components
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from common import BASE_OPTIONS, FakeEntry, load_integration, parse_args, start_hass
+
+
+async def measure(pm, with_controller: bool, events: int, entities: int) -> float:
+    """Seconds of loop time for events foreign state changes."""
+    hass = await start_hass()
+    ctrl = None
+    if with_controller:
+        ctrl = pm.PVManagementFixController(hass, FakeEntry(dict(BASE_OPTIONS)))
+        ctrl._restored = True
+        await ctrl.async_start()
+    await hass.async_block_till_done()
+    # Create the foreign entities first, so only changes are timed
+    for i in range(entities):
+        hass.states.async_set(f"sensor.foreign_{i}", -1)
+    await hass.async_block_till_done()
+
+    start = time.perf_counter()
+    for i in range(events):
+        hass.states.async_set(f"sensor.foreign_{i % entities}", i)
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    if ctrl is not None:
+        await ctrl.async_stop()
+    await hass.async_stop(force=True)
+    return elapsed
+
+
+async def main() -> None:
+    args = parse_args(
+        __doc__.splitlines()[0],
+        events=(int, 20000, "foreign state changes per run"),
+        entities=(int, 1000, "number of distinct foreign entities"),
+        runs=(int, 7, "repetitions (the minimum is reported)"),
+    )
+    pm = load_integration(args.components)
+    without = min([await measure(pm, False, args.events, args.entities) for _ in range(args.runs)])
+    with_ctrl = min([await measure(pm, True, args.events, args.entities) for _ in range(args.runs)])
+    per_event = max(0.0, with_ctrl - without) / args.events
+    print(f"components: {args.components}")
+    print(f"without controller: {without / args.events * 1e6:.2f} us/event")
+    print(f"with controller:    {with_ctrl / args.events * 1e6:.2f} us/event")
+    print(f"controller overhead per foreign event: {per_event * 1e6:.2f} us")
+    for rate in (1000, 5000, 20000):
+        print(f"  {rate:>6} foreign events/min -> {per_event * rate * 1e3:.1f} ms loop time/min")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
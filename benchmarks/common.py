@@ -0,0 +1,91 @@
+"""Shared setup for the benchmark scripts: a bare Home Assistant core and a fake entry.
+
+The scripts import the integration from a components directory given on the
+command line (default: this checkout), so the same script can be run against a
+second checkout of an older commit to get before/after numbers:
+
+    git worktree add /tmp/pv_before <commit>^
+    python benchmarks/<script>.py --components /tmp/pv_before/custom_components
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity, entity_registry as er, restore_state
+
+DEFAULT_COMPONENTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_components")
+
+# Minimal configuration: the three meters, fixed price and an amortisation helper
+BASE_OPTIONS: dict[str, Any] = {
+    "name": "PV",
+    "pv_production_entity": "sensor.pv",
+    "grid_export_entity": "sensor.export",
+    "grid_import_entity": "sensor.import",
+    "fixed_price": 10.0,
+    "markup_factor": 2.0,
+    "feed_in_tariff": 0.08,
+    "installation_cost": 10000.0,
+    "amortisation_helper": "input_number.amort",
+    # Process every sample immediately (no ingest window), where supported
+    "sample_window": 0,
+}
+
+METERS: dict[str, float] = {"sensor.pv": 1000.0, "sensor.export": 400.0, "sensor.import": 800.0}
+
+
+class FakeEntry:
+    """Just enough of a ConfigEntry for the controller and the sensor platform."""
+
+    def __init__(self, data: dict[str, Any], options: dict[str, Any] | None = None) -> None:
+        self.data = data
+        self.options = options or {}
+        self.entry_id = "benchmark"
+        self.title = data.get("name", "PV")
+        self.update_listeners: list = []
+
+    def add_update_listener(self, listener):
+        self.update_listeners.append(listener)
+        return lambda: None
+
+    def async_on_unload(self, func) -> None:
+        pass
+
+
+def parse_args(description: str, **extra: Any) -> argparse.Namespace:
+    """Common arguments (--components) plus script specific ones (name=(type, default, help))."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--components", default=DEFAULT_COMPONENTS,
+        help="directory containing pv_management_fix (default: this checkout)",
+    )
+    for name, (kind, default, help_text) in extra.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=kind, default=default, help=help_text)
+    return parser.parse_args()
+
+
+def load_integration(components: str):
+    """Imports pv_management_fix from the given components directory."""
+    sys.path.insert(0, os.path.abspath(components))
+    return importlib.import_module("pv_management_fix")
+
+
+async def start_hass() -> HomeAssistant:
+    """Started core with registries in a throw-away config directory, meters set."""
+    config_dir = tempfile.mkdtemp(prefix="pv_bench_")
+    os.makedirs(os.path.join(config_dir, ".storage"))
+    hass = HomeAssistant(config_dir)
+    hass.config.set_time_zone("Europe/Vienna")
+    # Done by bootstrap: entity source registry used when entities are added to a platform
+    entity.async_setup(hass)
+    await er.async_load(hass)
+    await restore_state.async_load(hass)
+    await hass.async_start()
+    for entity_id, value in METERS.items():
+        hass.states.async_set(entity_id, value)
+    return hass
@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time
+from bisect import bisect_right
+from collections import deque
+from contextlib import suppress
 from datetime import datetime, date, timedelta
-from typing import Any
+from functools import partial, wraps
+from itertools import islice
+from typing import Any, Callable
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback, Event
-from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, ServiceCall, State, SupportsResponse, callback, Event
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er, restore_state
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import (
-    DOMAIN, DATA_CTRL, PLATFORMS,
+    DOMAIN, DATA_CTRL, DATA_SENSOR_GROUPS, PLATFORMS,
+    STORAGE_VERSION, STORAGE_KEY, CONF_NAME, DEFAULT_NAME,
     CONF_PV_PRODUCTION_ENTITY, CONF_GRID_EXPORT_ENTITY,
     CONF_GRID_IMPORT_ENTITY, CONF_CONSUMPTION_ENTITY,
     CONF_ELECTRICITY_PRICE, CONF_ELECTRICITY_PRICE_ENTITY, CONF_ELECTRICITY_PRICE_UNIT,
@@ -35,13 +55,91 @@ from .const import (
     DEFAULT_QUOTA_START_METER, DEFAULT_QUOTA_MONTHLY_RATE,
     PRICE_UNIT_CENT,
     PV_STRING_CONFIGS,
+    CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL,
+    CONF_DEADBAND_EUR, CONF_DEADBAND_KWH, CONF_DEADBAND_PERCENT,
+    DEFAULT_DEADBAND_EUR, DEFAULT_DEADBAND_KWH, DEFAULT_DEADBAND_PERCENT,
+    CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW,
+    CONF_CHECKPOINT_INTERVAL, DEFAULT_CHECKPOINT_INTERVAL,
+    CHECKPOINT_DELTA_EUR, CHECKPOINT_DELTA_KWH,
+    CONF_HELPER_SYNC_INTERVAL, DEFAULT_HELPER_SYNC_INTERVAL,
+    CONF_PERIODIC_INTERVAL, DEFAULT_PERIODIC_INTERVAL,
+    HISTORY_SLOT_SECONDS, HISTORY_RETENTION_DAYS,
+    ROLLUP_FILE_SUFFIX, ROLLUP_HOURS, ROLLUP_DAYS, ROLLUP_MONTHS, ROLLUP_PROJECTION_DAYS,
+    STATISTICS_CHANNELS,
+    UPDATE_GROUP_ENERGY, UPDATE_GROUP_PRICES, UPDATE_GROUP_BATTERY,
+    UPDATE_GROUP_HEATPUMP, UPDATE_GROUP_STRINGS, UPDATE_GROUP_STRING_POWER,
+    UPDATE_GROUPS_ALL, UPDATE_GROUP_PERIODIC, REFRESH_TIER_GROUPS,
 )
+from .backfill import METER_EXPORT, METER_IMPORT, METER_PV, first_statistics_start, read_hours
+from .history import HISTORY_CHANNELS, EnergyHistory
+from .replay import ACCUMULATORS, TariffPeriod, replay_tariffs, validate_periods
+from .rollup import PERIOD_DAY, PERIOD_HOUR, PERIOD_MONTH, RollupStore, day_key, hour_key, month_key
 
 _LOGGER = logging.getLogger(__name__)
 
 # CO2 Faktor für deutschen Strommix (kg CO2 pro kWh)
 CO2_FACTOR_GRID = 0.4
 
+# Amortisations-Meilensteine in Prozent (Events + sofortiges Entity-Update)
+AMORTISATION_MILESTONES = (25, 50, 75, 100)
+
+# Preis-Historie je Preisart: (Zeitpunkt, €/kWh), nur Änderungen (~10 Tage bei 15-min-Tarifen)
+PRICE_HISTORY_MAXLEN = 1000
+PRICE_KIND_ELECTRICITY = "electricity"
+PRICE_KIND_FEED_IN = "feed_in"
+
+# Sanity-Limit je Zähler-Delta (kWh): größere Sprünge gelten als Zählertausch/Fehler
+MAX_DELTA_KWH = 50.0
+# Downtime-Recovery: Sanity-Limit wächst mit der Länge der Lücke (mittlere Leistung in kW,
+# mindestens MAX_DELTA_KWH); größere Deltas gelten als Zählertausch/Fehler
+MAX_RECOVERY_POWER_KW = 50.0
+# Downtime-Recovery wartet höchstens so lange auf alle Kern-Zähler
+GAP_READY_TIMEOUT = timedelta(minutes=10)
+
+# Statistik-Nachtrag (Erstinstallation): Zeitraum je Recorder-Abfrage und Status
+BACKFILL_PAGE = timedelta(days=30)
+BACKFILL_PENDING = "pending"
+BACKFILL_RUNNING = "running"
+BACKFILL_DONE = "done"
+BACKFILL_NO_STATISTICS = "no_statistics"
+
+# Service replay_tariff: Perioden mit korrigierten Preisen (fehlende Preise bleiben unverändert)
+REPLAY_TARIFF_SCHEMA = vol.Schema({
+    vol.Optional("periods"): vol.All(cv.ensure_list, [vol.Schema({
+        vol.Optional("start"): cv.date,
+        vol.Optional("end"): cv.date,
+        vol.Optional("fixed_price"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("markup_factor"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("feed_in_tariff"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    })]),
+    vol.Optional("dry_run", default=False): cv.boolean,
+})
+
+# Entity-Handler: (vorgebundener Ziel-Slot, numerischer Wert, neuer State)
+_EntityHandler = Callable[[Any, float, State], None]
+
+
+def _cycle_cached(func: Callable[[Any], Any]) -> property:
+    """Abgeleitete Kennzahl, die pro Update-Zyklus höchstens einmal berechnet wird.
+
+    Während eines Flushes liest jeder Sensor aus demselben Snapshot
+    (_metrics_cache); außerhalb eines Flushes wird immer frisch berechnet.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def getter(self):
+        cache = self._metrics_cache
+        if cache is None:
+            return func(self)
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = func(self)
+            return value
+
+    return property(getter)
+
 
 class PVManagementFixController:
     """
@@ -59,6 +157,38 @@ class PVManagementFixController:
         self.hass = hass
         self.entry = entry
 
+        # Persistenter Zustand (.storage/pv_management_fix.<entry_id>)
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}")
+        self._save_pending = False
+        # Stand (€, kWh) beim letzten Checkpoint, Basis für den Delta-Trigger
+        self._checkpoint_ref: tuple[float, float] = (0.0, 0.0)
+        # Aus dem letzten Checkpoint wiederhergestellt (Zählerstände + Zeitpunkt)
+        self._checkpoint_time: datetime | None = None
+        self._checkpoint_meters: dict[str, float | None] = {}
+        self._checkpoint_prices: dict[str, float | None] = {}
+        # Schreibmarke der Rollups (Summen je Kanal) zum Zeitpunkt des Checkpoints
+        self._checkpoint_rollups: dict[str, float] | None = None
+        # Downtime-Recovery: Beginn der offenen Lücke (None = keine) und Statistik
+        self._gap_start: datetime | None = None
+        self._gap_deadline: datetime | None = None
+        # Was die Rollups nach dem Checkpoint schon enthalten (harter Abbruch) und bis wann
+        self._gap_rollup_overlap: dict[str, float] = {}
+        self._gap_rollup_until: float = 0.0
+        self._recovered_kwh = 0.0
+        self._last_gap: dict[str, Any] | None = None
+
+        # State-Change Subscription (nur auf getrackte Entities, wird in _load_options nachgezogen)
+        self._started = False
+        self._subscribed_entity_ids: frozenset[str] = frozenset()
+        self._unsub_state_changes = None
+
+        # Vom Helper abgeleiteter Ersparnis-Offset (_restore_from_helper); übersteht Options-Änderungen
+        self._helper_savings_offset: float | None = None
+
+        # Letzter Reset je Akkumulator (Unix-Zeit, None = seit Beginn); das Tarif-Replay
+        # überträgt nur Differenzen ab diesem Zeitpunkt
+        self._tracked_since: dict[str, float | None] = dict.fromkeys(ACCUMULATORS)
+
         # Konfigurierbare Werte (aus Options, fallback zu data)
         self._load_options()
 
@@ -73,11 +203,16 @@ class PVManagementFixController:
         self._grid_import_kwh = 0.0
         self._consumption_kwh = 0.0
 
-        # Letzte bekannte Preise (für Fallback wenn Sensor temporär nicht verfügbar)
+        # Preis-Cache in €/kWh: wird nur bei State-Changes der Preis-Entities neu geparst,
+        # bleibt bei nicht verfügbarem Sensor als letzter bekannter Wert stehen
         self._last_known_electricity_price: float | None = None
         self._last_known_feed_in_tariff: float | None = None
         self._price_sensor_available = True
         self._tariff_sensor_available = True
+        self._price_history: dict[str, deque[tuple[datetime, float]]] = {
+            PRICE_KIND_ELECTRICITY: deque(maxlen=PRICE_HISTORY_MAXLEN),
+            PRICE_KIND_FEED_IN: deque(maxlen=PRICE_HISTORY_MAXLEN),
+        }
 
         # INKREMENTELL berechnete Werte (werden persistent gespeichert)
         self._total_self_consumption_kwh = 0.0
@@ -89,20 +224,14 @@ class PVManagementFixController:
         self._total_grid_import_cost = 0.0  # Gesamtkosten Netzbezug in €
         self._tracked_grid_import_kwh = 0.0  # Netzbezug für Durchschnittsberechnung
 
-        # Tägliches Strompreis-Tracking
-        self._daily_grid_import_cost = 0.0
-        self._daily_grid_import_kwh = 0.0
-        self._daily_feed_in_earnings = 0.0
-        self._daily_feed_in_kwh = 0.0
+        # Tages-/Monatswechsel (die Werte selbst liegen in den Rollups)
         self._daily_tracking_date: date | None = None
-
-        # Monatliches Strompreis-Tracking
-        self._monthly_grid_import_cost = 0.0
-        self._monthly_grid_import_kwh = 0.0
         self._monthly_tracking_month: int | None = None
 
         # Flag ob Werte aus Restore geladen wurden
         self._restored = False
+        # Bereit = Zustand steht fest (Store, Helper oder erste Zählerwerte); steuert die Verfügbarkeit
+        self._ready = False
         self._first_seen_date: date | None = None
 
         # Notification Tracking (verhindert Spam)
@@ -137,16 +266,79 @@ class PVManagementFixController:
 
         # Listener
         self._remove_listeners = []
-        self._entity_listeners = []
+
+        # Helper-Sync (Hintergrund-Writer): höchstens ein ausstehender Service-Call
+        self._helper_sync_task: asyncio.Task | None = None
+        self._unsub_helper_sync = None
+        self._unsub_hass_stop = None
+        self._helper_sync_dirty = False
+        self._helper_last_sync = 0.0  # time.monotonic() des letzten Schreibvorgangs
+        self.helper_sync_stats: dict[str, int] = {"written": 0, "skipped": 0, "coalesced": 0}
+        # Entity-Listener → Update-Gruppen, die der Sensor liest
+        self._entity_listeners: dict[Callable[[], None], frozenset[str]] = {}
+
+        # Uhr: lokales Datum, wird nur um Mitternacht (async_track_time_change) weitergeschaltet
+        self._today: date = dt_util.now().date()
+
+        # Snapshot der abgeleiteten Kennzahlen, nur während eines Flushes aktiv
+        self._metrics_cache: dict[str, Any] | None = None
+
+        # Gebündelte Entity-Updates (max. 1 Flush pro update_interval)
+        self._dirty_groups: set[str] = set()
+        self._unsub_flush = None
+        # Versionszähler je Update-Gruppe (steigt bei jeder Änderung, Basis für Attribut-Caches)
+        self._group_versions: dict[str, int] = dict.fromkeys(UPDATE_GROUPS_ALL, 0)
+        # Periodischer Refresh-Tier: eigener Takt, nur wenn sich seit dem letzten Tick Daten änderten
+        self._unsub_periodic = None
+        self._periodic_armed_interval: float | None = None
+        self._periodic_dirty = False
+
+        # Ingest-Stufe: neuester Wert je Entity bis zum nächsten Drain (max. 1 Eintrag
+        # pro getrackter Entity, Bursts kumulativer Zähler fallen dabei zusammen)
+        self._ingest_buffer: dict[str, tuple[float, State]] = {}
+        self._pending_meter_slots: set[str] = set()
+        self._unsub_drain = None
+        self.ingest_stats: dict[str, int] = {"received": 0, "collapsed": 0, "processed": 0}
+
+        # Live-Historie: Deltas je 15-Minuten-Intervall (Ringpuffer, siehe history.py)
+        self.energy_history = EnergyHistory(
+            HISTORY_SLOT_SECONDS, HISTORY_RETENTION_DAYS * 86400 // HISTORY_SLOT_SECONDS
+        )
+        # Persistente Stunden-/Tages-/Monatswerte (rollup.py); bis async_load_state
+        # die Datei mappt, nur im Speicher
+        self.rollups = RollupStore(ROLLUP_HOURS, ROLLUP_DAYS, ROLLUP_MONTHS)
+        self._rollup_path = hass.config.path(
+            ".storage", f"{STORAGE_KEY}.{entry.entry_id}.{ROLLUP_FILE_SUFFIX}"
+        )
+        # Nachtrag aus den Recorder-Statistiken (Erstinstallation, siehe backfill.py);
+        # Fortschritt und Cursor werden mit dem Zustand gespeichert
+        self._backfill: dict[str, Any] | None = None
+        self._backfill_task: asyncio.Task | None = None
+        # Laufendes Sichern der gemappten Rollup-Seiten nach einem Checkpoint
+        self._rollup_flush_task: asyncio.Task | None = None
+        # Externe Statistiken: zuletzt übertragene Stunde und laufende Summen je Kanal
+        self._statistics_prefix = f"{DOMAIN}:{slugify(entry.data.get(CONF_NAME, DEFAULT_NAME))}"
+        self._statistics_hour: int | None = None
+        self._statistics_sums: dict[str, float] = {}
+
+        # Preise schon vor dem Start verfügbar machen (Restore der Sensoren)
+        self._refresh_price_cache()
 
     def _load_options(self):
         """Lädt Optionen aus Entry (Options überschreiben Data)."""
         opts = {**self.entry.data, **self.entry.options}
 
         # Sensor-Entities (können nachträglich geändert werden)
+        previous_meters = (
+            getattr(self, "pv_production_entity", None),
+            getattr(self, "grid_export_entity", None),
+            getattr(self, "grid_import_entity", None),
+        )
         self.pv_production_entity = opts.get(CONF_PV_PRODUCTION_ENTITY)
         self.grid_export_entity = opts.get(CONF_GRID_EXPORT_ENTITY)
         self.grid_import_entity = opts.get(CONF_GRID_IMPORT_ENTITY)
+        if self._started:
+            self._rebase_changed_meters(previous_meters)
         self.consumption_entity = opts.get(CONF_CONSUMPTION_ENTITY)
 
         # Preis-Konfiguration
@@ -156,10 +348,14 @@ class PVManagementFixController:
         self.feed_in_tariff = opts.get(CONF_FEED_IN_TARIFF, DEFAULT_FEED_IN_TARIFF)
         self.feed_in_tariff_entity = opts.get(CONF_FEED_IN_TARIFF_ENTITY)
         self.feed_in_tariff_unit = opts.get(CONF_FEED_IN_TARIFF_UNIT, DEFAULT_FEED_IN_TARIFF_UNIT)
+        self._static_feed_in_tariff_eur = self._convert_price_to_eur(
+            self.feed_in_tariff, self.feed_in_tariff_unit, auto_detect=False
+        )
 
         # Kosten und Datum
         self.installation_cost = opts.get(CONF_INSTALLATION_COST, DEFAULT_INSTALLATION_COST)
         self.installation_date = opts.get(CONF_INSTALLATION_DATE)
+        self._installation_date_parsed = self._parse_date(self.installation_date)
         self.savings_offset = opts.get(CONF_SAVINGS_OFFSET, DEFAULT_SAVINGS_OFFSET)
 
         # Energie-Offsets (für historische Daten vor Tracking)
@@ -187,6 +383,27 @@ class PVManagementFixController:
         # Amortisation Helper (Pflicht für Persistenz)
         self.amortisation_helper = opts.get(CONF_AMORTISATION_HELPER)
         self.restore_from_helper = opts.get(CONF_RESTORE_FROM_HELPER, False)
+        # Der beim Start aus dem Helper berechnete Offset ersetzt den konfigurierten,
+        # solange der Restore aktiv ist (sonst schriebe der nächste Sync einen zu kleinen Wert)
+        if self.restore_from_helper and self._helper_savings_offset is not None:
+            self.savings_offset = self._helper_savings_offset
+
+        # Performance: Mindestabstand zwischen zwei Entity-Flushes (s)
+        self.update_interval = float(opts.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+        # Deadbands je Sensor-Familie (Options-Key → Schwelle), siehe BaseEntity
+        self.deadbands: dict[str, float] = {
+            CONF_DEADBAND_EUR: float(opts.get(CONF_DEADBAND_EUR, DEFAULT_DEADBAND_EUR)),
+            CONF_DEADBAND_KWH: float(opts.get(CONF_DEADBAND_KWH, DEFAULT_DEADBAND_KWH)),
+            CONF_DEADBAND_PERCENT: float(opts.get(CONF_DEADBAND_PERCENT, DEFAULT_DEADBAND_PERCENT)),
+        }
+        # Ingest-/Sampling-Fenster (s): Drain-Takt der gepufferten Zustandsänderungen
+        self.sample_window = float(opts.get(CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW))
+        # Checkpoint-Intervall (s): maximaler Abstand zwischen zwei Store-Schreibvorgängen
+        self.checkpoint_interval = float(opts.get(CONF_CHECKPOINT_INTERVAL, DEFAULT_CHECKPOINT_INTERVAL))
+        # Mindestabstand (s) zwischen zwei Helper-Syncs
+        self.helper_sync_interval = float(opts.get(CONF_HELPER_SYNC_INTERVAL, DEFAULT_HELPER_SYNC_INTERVAL))
+        # Takt (min) des periodischen Refresh-Tiers (Hochrechnungen, Prognosen, Scores)
+        self.periodic_interval = float(opts.get(CONF_PERIODIC_INTERVAL, DEFAULT_PERIODIC_INTERVAL))
 
         # Benchmark
         self.benchmark_enabled = opts.get(CONF_BENCHMARK_ENABLED, DEFAULT_BENCHMARK_ENABLED)
@@ -208,8 +425,115 @@ class PVManagementFixController:
                 s_kwp = 0.0
             if s_name and s_entity:
                 self.pv_strings.append((s_name, s_entity, s_power, s_kwp))
-        self._string_entity_ids = {e for _, e, _, _ in self.pv_strings}
-        self._string_power_entity_ids = {p for _, _, p, _ in self.pv_strings if p}
+
+        # Routing-Tabelle für _on_state_changed (entity_id → Handler + Ziel-Slot)
+        self._dispatch = self._build_dispatch_table()
+        # Konfigurierte Kern-Zähler: sind alle eingetroffen, wird sofort gedraint
+        self._core_meter_entity_ids = frozenset(
+            entity_id for entity_id, (handler, _) in self._dispatch.items()
+            if handler == self._handle_meter
+        )
+        # Leistungswerte (Peak-Erkennung) brauchen jedes Sample und umgehen den Puffer
+        self._inline_entity_ids = frozenset(
+            entity_id for entity_id, (handler, _) in self._dispatch.items()
+            if handler == self._handle_string_power
+        )
+
+        # Subscription und Preis-Cache nachziehen, falls sich Entities geändert haben
+        if self._started:
+            self._update_state_subscription()
+            self._refresh_price_cache()
+
+    def _rebase_changed_meters(self, previous: tuple[str | None, str | None, str | None]) -> None:
+        """Setzt die Zähler-Basis getauschter Kern-Zähler auf den Stand des neuen Sensors.
+
+        Sonst würde die Differenz zwischen altem und neuem Zählerstand als Energie gebucht.
+        Ist der neue Sensor nicht verfügbar, legt das nächste Sample die Basis fest.
+        """
+        for old_entity, new_entity, current_attr, last_attr in (
+            (previous[0], self.pv_production_entity, "_pv_production_kwh", "_last_pv_production_kwh"),
+            (previous[1], self.grid_export_entity, "_grid_export_kwh", "_last_grid_export_kwh"),
+            (previous[2], self.grid_import_entity, "_grid_import_kwh", "_last_grid_import_kwh"),
+        ):
+            if old_entity == new_entity:
+                continue
+            self._ingest_buffer.pop(old_entity, None)
+            self._ingest_buffer.pop(new_entity, None)
+            value, available = self._get_entity_value(new_entity)
+            setattr(self, current_attr, value)
+            setattr(self, last_attr, value if available else None)
+            _LOGGER.info(
+                "Zähler %s → %s getauscht, neue Basis %s", old_entity, new_entity, value if available else "offen"
+            )
+
+    @staticmethod
+    def _parse_date(value: Any) -> date | None:
+        """Parst ein Datum aus den Optionen (ISO-String oder date) einmalig beim Laden."""
+        if not value:
+            return None
+        try:
+            if isinstance(value, str):
+                return datetime.fromisoformat(value).date()
+            if isinstance(value, datetime):
+                return value.date()
+            if isinstance(value, date):
+                return value
+        except (ValueError, TypeError):
+            pass
+        return None
+
+    def _build_dispatch_table(self) -> dict[str, tuple[_EntityHandler, Any]]:
+        """Baut die Routing-Tabelle entity_id → (Handler, vorgebundener Ziel-Slot).
+
+        Die Reihenfolge entspricht der Priorität: ist eine Entity mehreren Rollen
+        zugeordnet, gewinnt die erste (wie früher in der if/elif-Kette).
+        """
+        routes: list[tuple[str | None, _EntityHandler, Any]] = [
+            (self.pv_production_entity, self._handle_meter, "_pv_production_kwh"),
+            (self.grid_export_entity, self._handle_meter, "_grid_export_kwh"),
+            (self.grid_import_entity, self._handle_meter, "_grid_import_kwh"),
+            (self.consumption_entity, self._handle_consumption, "_consumption_kwh"),
+            (self.battery_soc_entity, self._handle_battery, None),
+            (self.battery_charge_entity, self._handle_battery, None),
+            (self.battery_discharge_entity, self._handle_battery, None),
+            (self.electricity_price_entity, self._handle_price, PRICE_KIND_ELECTRICITY),
+            (self.feed_in_tariff_entity, self._handle_price, PRICE_KIND_FEED_IN),
+            (self.benchmark_heatpump_entity, self._handle_heatpump, None),
+        ]
+        routes.extend((e, self._handle_string_energy, e) for _, e, _, _ in self.pv_strings)
+        routes.extend((p, self._handle_string_power, p) for _, _, p, _ in self.pv_strings if p)
+
+        table: dict[str, tuple[_EntityHandler, Any]] = {}
+        for entity_id, handler, slot in routes:
+            if entity_id:
+                table.setdefault(entity_id, (handler, slot))
+        return table
+
+    @property
+    def tracked_entity_ids(self) -> frozenset[str]:
+        """Alle Entities, deren Zustandsänderungen der Controller verarbeitet."""
+        return frozenset(self._dispatch)
+
+    @callback
+    def _update_state_subscription(self) -> None:
+        """(Re-)Abonniert State-Changes nur für die getrackten Entities."""
+        entity_ids = self.tracked_entity_ids
+        if entity_ids == self._subscribed_entity_ids and self._unsub_state_changes is not None:
+            return
+        if self._unsub_state_changes is not None:
+            self._unsub_state_changes()
+            self._unsub_state_changes = None
+        self._subscribed_entity_ids = entity_ids
+        if entity_ids:
+            self._unsub_state_changes = async_track_state_change_event(
+                self.hass, entity_ids, self._on_state_changed
+            )
+        _LOGGER.debug("State-Subscription aktualisiert: %d Entities", len(entity_ids))
+
+    @property
+    def today(self) -> date:
+        """Lokales Datum (gecacht, Wechsel um Mitternacht über _on_midnight)."""
+        return self._today
 
     @property
     def fixed_price_ct(self) -> float:
@@ -251,37 +575,62 @@ class PVManagementFixController:
 
     @property
     def current_electricity_price(self) -> float:
-        """Aktueller Netto-Strompreis in €/kWh (aus Sensor oder statischem Fixpreis)."""
-        if self.electricity_price_entity:
-            raw_price, is_available = self._get_entity_value(
-                self.electricity_price_entity, self.fixed_price
-            )
-            self._price_sensor_available = is_available
-            if is_available:
-                # Auto-detect: > 1 = wahrscheinlich ct/kWh
-                price_eur = self._convert_price_to_eur(raw_price, self.electricity_price_unit, auto_detect=True)
-                self._last_known_electricity_price = price_eur
-                return price_eur
-            elif self._last_known_electricity_price is not None:
-                return self._last_known_electricity_price
-        self._price_sensor_available = True
+        """Aktueller Netto-Strompreis in €/kWh (gecachter Sensorwert oder statischer Fixpreis)."""
+        if self.electricity_price_entity and self._last_known_electricity_price is not None:
+            return self._last_known_electricity_price
         return self.fixed_price
 
     @property
     def current_feed_in_tariff(self) -> float:
-        """Aktuelle Einspeisevergütung in €/kWh."""
-        if self.feed_in_tariff_entity:
-            raw_tariff, is_available = self._get_entity_value(
-                self.feed_in_tariff_entity, self.feed_in_tariff
-            )
-            self._tariff_sensor_available = is_available
-            if is_available:
-                self._last_known_feed_in_tariff = raw_tariff
-                return self._convert_price_to_eur(raw_tariff, self.feed_in_tariff_unit, auto_detect=True)
-            elif self._last_known_feed_in_tariff is not None:
-                return self._convert_price_to_eur(self._last_known_feed_in_tariff, self.feed_in_tariff_unit, auto_detect=True)
-        self._tariff_sensor_available = True
-        return self._convert_price_to_eur(self.feed_in_tariff, self.feed_in_tariff_unit, auto_detect=False)
+        """Aktuelle Einspeisevergütung in €/kWh (gecachter Sensorwert oder statischer Tarif)."""
+        if self.feed_in_tariff_entity and self._last_known_feed_in_tariff is not None:
+            return self._last_known_feed_in_tariff
+        return self._static_feed_in_tariff_eur
+
+    def _set_price(self, kind: str, raw: float | None) -> None:
+        """Übernimmt einen Preis-/Tarifwert in den Cache (None = Sensor nicht verfügbar).
+
+        Auto-detect: Werte > 1 sind wahrscheinlich ct/kWh. Bei nicht verfügbarem
+        Sensor bleibt der letzte bekannte Wert stehen.
+        """
+        available = raw is not None
+        if kind == PRICE_KIND_ELECTRICITY:
+            self._price_sensor_available = available
+            if not available:
+                return
+            price_eur = self._convert_price_to_eur(raw, self.electricity_price_unit, auto_detect=True)
+            self._last_known_electricity_price = price_eur
+        else:
+            self._tariff_sensor_available = available
+            if not available:
+                return
+            price_eur = self._convert_price_to_eur(raw, self.feed_in_tariff_unit, auto_detect=True)
+            self._last_known_feed_in_tariff = price_eur
+        history = self._price_history[kind]
+        if not history or history[-1][1] != price_eur:
+            history.append((dt_util.utcnow(), price_eur))
+
+    def _refresh_price_cache(self) -> None:
+        """Liest Preis und Tarif einmalig aus den aktuellen States (Start / Options-Änderung)."""
+        for kind, entity_id in (
+            (PRICE_KIND_ELECTRICITY, self.electricity_price_entity),
+            (PRICE_KIND_FEED_IN, self.feed_in_tariff_entity),
+        ):
+            if not entity_id:
+                continue
+            raw, available = self._get_entity_value(entity_id)
+            self._set_price(kind, raw if available else None)
+
+    def price_at(self, kind: str, when: datetime) -> float | None:
+        """Preis in €/kWh, der zum Zeitpunkt when galt (aus der Preis-Historie).
+
+        None, wenn when vor dem ältesten bekannten Preis liegt.
+        """
+        history = self._price_history[kind]
+        idx = bisect_right(history, when, key=lambda item: item[0])
+        if idx == 0:
+            return None
+        return history[idx - 1][1]
 
     # =========================================================================
     # ENERGIE PROPERTIES
@@ -307,12 +656,12 @@ class PVManagementFixController:
         """Aktueller Verbrauch vom Sensor."""
         return self._consumption_kwh
 
-    @property
+    @_cycle_cached
     def self_consumption_kwh(self) -> float:
         """Gesamter Eigenverbrauch (inkrementell + Offset)."""
         return self._total_self_consumption_kwh + self.energy_offset_self
 
-    @property
+    @_cycle_cached
     def feed_in_kwh(self) -> float:
         """Gesamte Einspeisung (inkrementell + Offset)."""
         return self._total_feed_in_kwh + self.energy_offset_export
@@ -331,14 +680,14 @@ class PVManagementFixController:
     # STROMPREIS-DURCHSCHNITT
     # =========================================================================
 
-    @property
+    @_cycle_cached
     def average_electricity_price(self) -> float | None:
         """Gewichteter durchschnittlicher Strompreis in €/kWh."""
         if self._tracked_grid_import_kwh <= 0:
             return None
         return self._total_grid_import_cost / self._tracked_grid_import_kwh
 
-    @property
+    @_cycle_cached
     def average_electricity_price_ct(self) -> float | None:
         """Gewichteter durchschnittlicher Strompreis in ct/kWh."""
         avg = self.average_electricity_price
@@ -346,60 +695,70 @@ class PVManagementFixController:
             return None
         return avg * 100
 
-    @property
+    def _day_value(self, channel: str) -> float:
+        """Kanal des heutigen Tages-Rollups."""
+        return self.rollups.value(PERIOD_DAY, day_key(self._today), channel)
+
+    def _month_value(self, channel: str) -> float:
+        """Kanal des aktuellen Monats-Rollups."""
+        return self.rollups.value(PERIOD_MONTH, month_key(self._today), channel)
+
+    @_cycle_cached
     def daily_average_price_ct(self) -> float | None:
         """Täglicher gewichteter Durchschnittspreis in ct/kWh."""
-        if self._daily_grid_import_kwh <= 0:
+        kwh = self.daily_grid_import_kwh
+        if kwh <= 0:
             return None
-        return (self._daily_grid_import_cost / self._daily_grid_import_kwh) * 100
+        return (self.daily_grid_import_cost / kwh) * 100
 
-    @property
+    @_cycle_cached
     def monthly_average_price_ct(self) -> float | None:
         """Monatlicher gewichteter Durchschnittspreis in ct/kWh."""
-        if self._monthly_grid_import_kwh <= 0:
+        kwh = self.monthly_grid_import_kwh
+        if kwh <= 0:
             return None
-        return (self._monthly_grid_import_cost / self._monthly_grid_import_kwh) * 100
+        return (self.monthly_grid_import_cost / kwh) * 100
 
     @property
     def daily_grid_import_kwh(self) -> float:
         """Täglicher Netzbezug in kWh."""
-        return self._daily_grid_import_kwh
+        return self._day_value("grid_import_kwh")
 
     @property
     def daily_grid_import_cost(self) -> float:
         """Tägliche Netzbezugskosten in €."""
-        return self._daily_grid_import_cost
+        return self._day_value("import_cost_eur")
 
     @property
     def daily_feed_in_earnings(self) -> float:
         """Tägliche Einspeisevergütung in €."""
-        return self._daily_feed_in_earnings
+        return self._day_value("earnings_eur")
 
     @property
     def daily_feed_in_kwh(self) -> float:
         """Tägliche Einspeisung in kWh."""
-        return self._daily_feed_in_kwh
+        return self._day_value("feed_in_kwh")
 
-    @property
+    @_cycle_cached
     def daily_net_electricity_cost(self) -> float:
         """Tägliche Netto-Stromkosten (Einkauf minus Verkauf) in €."""
-        return self._daily_grid_import_cost - self._daily_feed_in_earnings
+        return self.daily_grid_import_cost - self.daily_feed_in_earnings
 
     @property
     def monthly_grid_import_kwh(self) -> float:
         """Monatlicher Netzbezug in kWh."""
-        return self._monthly_grid_import_kwh
+        return self._month_value("grid_import_kwh")
 
     @property
     def monthly_grid_import_cost(self) -> float:
         """Monatliche Netzbezugskosten in €."""
-        return self._monthly_grid_import_cost
+        return self._month_value("import_cost_eur")
 
     # =========================================================================
     # STROMKONTINGENT
     # =========================================================================
 
-    @property
+    @_cycle_cached
     def quota_start_date(self) -> date | None:
         """Startdatum der Kontingent-Periode."""
         if not self.quota_start_date_str:
@@ -411,7 +770,7 @@ class PVManagementFixController:
         except (ValueError, TypeError):
             return None
 
-    @property
+    @_cycle_cached
     def quota_end_date(self) -> date | None:
         """Enddatum der Kontingent-Periode (Start + 1 Jahr)."""
         start = self.quota_start_date
@@ -420,28 +779,28 @@ class PVManagementFixController:
         from datetime import timedelta
         return start + timedelta(days=365)
 
-    @property
+    @_cycle_cached
     def quota_days_total(self) -> int:
         """Gesamttage der Periode (365)."""
         return 365
 
-    @property
+    @_cycle_cached
     def quota_days_elapsed(self) -> int:
         """Vergangene Tage seit Periodenbeginn (Starttag = Tag 1)."""
         start = self.quota_start_date
         if start is None:
             return 0
-        elapsed = (date.today() - start).days
+        elapsed = (self._today - start).days
         if elapsed < 0:
             return 0
         return min(elapsed + 1, self.quota_days_total)
 
-    @property
+    @_cycle_cached
     def quota_days_remaining(self) -> int:
         """Verbleibende Tage in der Periode."""
         return max(0, self.quota_days_total - self.quota_days_elapsed)
 
-    @property
+    @_cycle_cached
     def quota_consumed_kwh(self) -> float:
         """Verbrauchte kWh seit Periodenbeginn (Zählerstand - Startwert)."""
         if not self.quota_enabled or self.quota_start_date is None:
@@ -450,34 +809,34 @@ class PVManagementFixController:
         consumed = current_meter - self.quota_start_meter
         return max(0.0, consumed)
 
-    @property
+    @_cycle_cached
     def quota_remaining_kwh(self) -> float:
         """Verbleibendes Kontingent in kWh."""
         return self.quota_yearly_kwh - self.quota_consumed_kwh
 
-    @property
+    @_cycle_cached
     def quota_consumed_percent(self) -> float:
         """Verbrauchter Anteil des Kontingents in Prozent."""
         if self.quota_yearly_kwh <= 0:
             return 0.0
         return min(100.0, (self.quota_consumed_kwh / self.quota_yearly_kwh) * 100)
 
-    @property
+    @_cycle_cached
     def quota_expected_kwh(self) -> float:
         """Soll-Verbrauch (linear, Starttag = Tag 1)."""
         if self.quota_days_total <= 0:
             return 0.0
         start = self.quota_start_date
-        if start is None or date.today() < start:
+        if start is None or self._today < start:
             return 0.0
         return (self.quota_days_elapsed / self.quota_days_total) * self.quota_yearly_kwh
 
-    @property
+    @_cycle_cached
     def quota_reserve_kwh(self) -> float:
         """Reserve: Soll minus Ist. Positiv = unter Budget, negativ = drüber."""
         return self.quota_expected_kwh - self.quota_consumed_kwh
 
-    @property
+    @_cycle_cached
     def quota_daily_budget_kwh(self) -> float | None:
         """Tagesbudget: Restmenge / Resttage (steigt wenn du sparst, sinkt wenn du mehr verbrauchst)."""
         remaining_days = self.quota_days_remaining
@@ -485,7 +844,7 @@ class PVManagementFixController:
             return None
         return self.quota_remaining_kwh / remaining_days
 
-    @property
+    @_cycle_cached
     def quota_today_consumed_kwh(self) -> float:
         """Heutiger Verbrauch aus Zählerstand (robust gegen Restarts)."""
         if self._grid_import_kwh <= 0:
@@ -494,13 +853,13 @@ class PVManagementFixController:
         day_start = self._quota_day_start_meter
         qs = self.quota_start_date
         if (self.quota_enabled and qs is not None
-                and date.today() == qs and self.quota_start_meter > 0):
+                and self._today == qs and self.quota_start_meter > 0):
             day_start = self.quota_start_meter
         if day_start <= 0:
             return 0.0
         return max(0.0, self._grid_import_kwh - day_start)
 
-    @property
+    @_cycle_cached
     def quota_today_remaining_kwh(self) -> float | None:
         """Verbleibendes Tagesbudget: Budget minus heutiger Verbrauch (zählerstandbasiert)."""
         budget = self.quota_daily_budget_kwh
@@ -508,7 +867,7 @@ class PVManagementFixController:
             return None
         return budget - self.quota_today_consumed_kwh
 
-    @property
+    @_cycle_cached
     def quota_forecast_kwh(self) -> float | None:
         """Hochrechnung: Verbrauch am Periodenende bei aktuellem Tempo."""
         days_elapsed = self.quota_days_elapsed
@@ -516,7 +875,7 @@ class PVManagementFixController:
             return None
         return (self.quota_consumed_kwh / days_elapsed) * self.quota_days_total
 
-    @property
+    @_cycle_cached
     def quota_status_text(self) -> str:
         """Status-Text für Kontingent."""
         if not self.quota_enabled or self.quota_start_date is None:
@@ -531,40 +890,40 @@ class PVManagementFixController:
     # AMORTISATION
     # =========================================================================
 
-    @property
+    @_cycle_cached
     def savings_self_consumption(self) -> float:
         """Ersparnis durch Eigenverbrauch."""
         return self._accumulated_savings_self
 
-    @property
+    @_cycle_cached
     def earnings_feed_in(self) -> float:
         """Einnahmen durch Einspeisung."""
         return self._accumulated_earnings_feed
 
-    @property
+    @_cycle_cached
     def total_savings(self) -> float:
         """Gesamtersparnis inkl. manuellem Offset."""
         base = self.savings_self_consumption + self.earnings_feed_in
         return base + self.savings_offset
 
-    @property
+    @_cycle_cached
     def amortisation_percent(self) -> float:
         """Amortisation in Prozent."""
         if self.installation_cost <= 0:
             return 100.0
         return min(100.0, (self.total_savings / self.installation_cost) * 100)
 
-    @property
+    @_cycle_cached
     def remaining_cost(self) -> float:
         """Restbetrag bis zur Amortisation."""
         return max(0.0, self.installation_cost - self.total_savings)
 
-    @property
+    @_cycle_cached
     def is_amortised(self) -> bool:
         """True wenn vollständig amortisiert."""
         return self.total_savings >= self.installation_cost
 
-    @property
+    @_cycle_cached
     def _current_self_consumption_kwh(self) -> float:
         """Aktueller Eigenverbrauch in kWh (Batterie-kompatibel).
 
@@ -575,14 +934,14 @@ class PVManagementFixController:
             return max(0.0, self._consumption_kwh - self._grid_import_kwh)
         return max(0.0, self._pv_production_kwh - self._grid_export_kwh)
 
-    @property
+    @_cycle_cached
     def self_consumption_ratio(self) -> float:
         """Eigenverbrauchsquote (%) - Anteil der PV-Produktion der selbst verbraucht wird."""
         if self._pv_production_kwh <= 0:
             return 0.0
         return min(100.0, (self._current_self_consumption_kwh / self._pv_production_kwh) * 100)
 
-    @property
+    @_cycle_cached
     def autarky_rate(self) -> float | None:
         """Autarkiegrad (%) - Anteil des Verbrauchs der durch PV gedeckt wird."""
         self_consumption = self._current_self_consumption_kwh
@@ -596,7 +955,7 @@ class PVManagementFixController:
                 return min(100.0, (self_consumption / total_consumption) * 100)
         return None
 
-    @property
+    @_cycle_cached
     def co2_saved_kg(self) -> float:
         """Eingesparte CO2-Emissionen in kg."""
         return self.self_consumption_kwh * CO2_FACTOR_GRID
@@ -605,7 +964,7 @@ class PVManagementFixController:
     # BATTERIE
     # =========================================================================
 
-    @property
+    @_cycle_cached
     def battery_soc(self) -> float | None:
         """Batterie-Ladestand in %."""
         if not self.battery_soc_entity:
@@ -613,7 +972,7 @@ class PVManagementFixController:
         val, ok = self._get_entity_value(self.battery_soc_entity)
         return val if ok else None
 
-    @property
+    @_cycle_cached
     def battery_charge_total(self) -> float | None:
         """Gesamt-Ladung in kWh."""
         if not self.battery_charge_entity:
@@ -621,7 +980,7 @@ class PVManagementFixController:
         val, ok = self._get_entity_value(self.battery_charge_entity)
         return val if ok else None
 
-    @property
+    @_cycle_cached
     def battery_discharge_total(self) -> float | None:
         """Gesamt-Entladung in kWh."""
         if not self.battery_discharge_entity:
@@ -629,7 +988,7 @@ class PVManagementFixController:
         val, ok = self._get_entity_value(self.battery_discharge_entity)
         return val if ok else None
 
-    @property
+    @_cycle_cached
     def battery_efficiency(self) -> float | None:
         """Batterie-Effizienz in % (Entladung / Ladung × 100)."""
         charge = self.battery_charge_total
@@ -638,7 +997,7 @@ class PVManagementFixController:
             return None
         return (discharge / charge) * 100
 
-    @property
+    @_cycle_cached
     def battery_cycles_estimate(self) -> float | None:
         """Geschätzte Zyklen (Gesamt-Ladung / Kapazität)."""
         charge = self.battery_charge_total
@@ -650,14 +1009,14 @@ class PVManagementFixController:
     # ROI
     # =========================================================================
 
-    @property
+    @_cycle_cached
     def roi_percent(self) -> float | None:
         """Return on Investment in % (negativ vor, positiv nach Amortisation)."""
         if self.installation_cost <= 0:
             return None
         return ((self.total_savings - self.installation_cost) / self.installation_cost) * 100
 
-    @property
+    @_cycle_cached
     def annual_roi_percent(self) -> float | None:
         """Jährlicher ROI in %."""
         if self.installation_cost <= 0:
@@ -669,28 +1028,21 @@ class PVManagementFixController:
         annual_savings = self.total_savings / years
         return ((annual_savings - (self.installation_cost / years)) / self.installation_cost) * 100
 
-    @property
+    @_cycle_cached
     def days_since_installation(self) -> int:
         """Tage seit Installation (oder erstem Tracking)."""
-        if self.installation_date:
-            try:
-                if isinstance(self.installation_date, str):
-                    install_date = datetime.fromisoformat(self.installation_date).date()
-                else:
-                    install_date = self.installation_date
-                return (date.today() - install_date).days
-            except (ValueError, TypeError):
-                pass
+        if self._installation_date_parsed is not None:
+            return (self._today - self._installation_date_parsed).days
         return self.days_tracking
 
-    @property
+    @_cycle_cached
     def days_tracking(self) -> int:
         """Tage seit erstem Tracking (unabhängig von Installationsdatum)."""
         if self._first_seen_date:
-            return (date.today() - self._first_seen_date).days
+            return (self._today - self._first_seen_date).days
         return 0
 
-    @property
+    @_cycle_cached
     def average_daily_savings(self) -> float:
         """Durchschnittliche tägliche Ersparnis."""
         days = self.days_since_installation
@@ -698,17 +1050,17 @@ class PVManagementFixController:
             return 0.0
         return self.total_savings / days
 
-    @property
+    @_cycle_cached
     def average_monthly_savings(self) -> float:
         """Durchschnittliche monatliche Ersparnis."""
         return self.average_daily_savings * 30.44
 
-    @property
+    @_cycle_cached
     def average_yearly_savings(self) -> float:
         """Durchschnittliche jährliche Ersparnis."""
         return self.average_daily_savings * 365
 
-    @property
+    @_cycle_cached
     def estimated_remaining_days(self) -> int | None:
         """Geschätzte verbleibende Tage bis Amortisation."""
         if self.is_amortised:
@@ -718,18 +1070,18 @@ class PVManagementFixController:
             return None
         return int(self.remaining_cost / daily_avg)
 
-    @property
+    @_cycle_cached
     def estimated_payback_date(self) -> date | None:
         """Geschätztes Amortisationsdatum."""
         remaining = self.estimated_remaining_days
         if remaining is None:
             return None
         if remaining == 0:
-            return date.today()
+            return self._today
         from datetime import timedelta
-        return date.today() + timedelta(days=remaining)
+        return self._today + timedelta(days=remaining)
 
-    @property
+    @_cycle_cached
     def status_text(self) -> str:
         """Status-Text für Anzeige."""
         if self.is_amortised:
@@ -742,65 +1094,79 @@ class PVManagementFixController:
     # BENCHMARK
     # =========================================================================
 
-    @property
+    @_cycle_cached
     def benchmark_avg_consumption_kwh(self) -> int:
         """Referenz-Haushaltsstrom (OHNE WP) aus Benchmark-Tabelle."""
         country_data = BENCHMARK_CONSUMPTION.get(self.benchmark_country, BENCHMARK_CONSUMPTION["AT"])
         size = max(1, min(6, self.benchmark_household_size))
         return country_data.get(size, country_data[3])
 
-    @property
+    @_cycle_cached
     def benchmark_avg_heatpump_kwh(self) -> int | None:
         """WP-Referenzverbrauch (nur wenn WP aktiv)."""
         if not self.benchmark_heatpump:
             return None
         return BENCHMARK_HEATPUMP_CONSUMPTION.get(self.benchmark_country, BENCHMARK_HEATPUMP_CONSUMPTION["AT"])
 
-    @property
+    def _rollup_annualized(self, *channels: str) -> float | None:
+        """Summe der Kanäle aus den Tages-Rollups seit Benchmark-Start, hochgerechnet auf 1 Jahr.
+
+        Nur abgeschlossene Tage, höchstens das letzte Jahr. None solange die Rollups
+        das Fenster nicht vollständig abdecken (z.B. nach einem Update); dann rechnen
+        die Aufrufer mit den Zähler-Snapshots seit Benchmark-Start.
+        """
+        last = day_key(self._today) - 1
+        first = max(day_key(self._benchmark_start_date), last - ROLLUP_PROJECTION_DAYS + 1)
+        if first > last or not self.rollups.covers_day(first, last):
+            return None
+        total = sum(self.rollups.total(PERIOD_DAY, first, last, channel) for channel in channels)
+        return total / (last - first + 1) * 365
+
+    @_cycle_cached
     def benchmark_own_annual_consumption_kwh(self) -> float | None:
         """Gesamtverbrauch hochgerechnet auf 1 Jahr (inkl. WP).
 
-        Verwendet Differenz seit Benchmark-Start (unabhängig von Amortisation).
+        Aus den Tages-Rollups, sonst Differenz seit Benchmark-Start (unabhängig von Amortisation).
         """
         if self._benchmark_start_date is None:
             return None
-        days = max(1, (date.today() - self._benchmark_start_date).days)
-        consumption = (
-            (self._total_self_consumption_kwh - self._benchmark_start_self_consumption)
-            + (self._tracked_grid_import_kwh - self._benchmark_start_grid_import)
-        )
-        if consumption <= 0:
-            return None
-        total_annual = consumption / days * 365
-        if total_annual > 100_000:
+        total_annual = self._rollup_annualized("self_consumption_kwh", "grid_import_kwh")
+        if total_annual is None:
+            days = max(1, (self._today - self._benchmark_start_date).days)
+            consumption = (
+                (self._total_self_consumption_kwh - self._benchmark_start_self_consumption)
+                + (self._tracked_grid_import_kwh - self._benchmark_start_grid_import)
+            )
+            total_annual = consumption / days * 365
+        if total_annual <= 0 or total_annual > 100_000:
             return None
         return total_annual
 
-    @property
+    @_cycle_cached
     def benchmark_annual_grid_import_kwh(self) -> float | None:
-        """Jährlicher Netzbezug hochgerechnet (seit Benchmark-Start)."""
+        """Jährlicher Netzbezug hochgerechnet (Tages-Rollups bzw. seit Benchmark-Start)."""
         if self._benchmark_start_date is None:
             return None
-        days = max(1, (date.today() - self._benchmark_start_date).days)
-        grid_since_start = self._tracked_grid_import_kwh - self._benchmark_start_grid_import
-        if grid_since_start <= 0:
-            return None
-        annual = grid_since_start / days * 365
-        if annual > 100_000:
+        annual = self._rollup_annualized("grid_import_kwh")
+        if annual is None:
+            days = max(1, (self._today - self._benchmark_start_date).days)
+            grid_since_start = self._tracked_grid_import_kwh - self._benchmark_start_grid_import
+            annual = grid_since_start / days * 365
+        if annual <= 0 or annual > 100_000:
             return None
         return annual
 
-    @property
+    @_cycle_cached
     def benchmark_own_heatpump_kwh(self) -> float | None:
         """WP-Jahresverbrauch (Delta seit erstem Sehen, hochgerechnet auf 1 Jahr)."""
         if not self.benchmark_heatpump or not self.benchmark_heatpump_entity:
             return None
         if self._wp_first_seen_date is None or self._tracked_wp_kwh <= 0:
             return None
-        wp_days = max(1, (date.today() - self._wp_first_seen_date).days)
+        wp_days = max(1, (self._today - self._wp_first_seen_date).days)
         return self._tracked_wp_kwh / wp_days * 365
 
-    @property
+    @_cycle_cached
     def benchmark_household_consumption_kwh(self) -> float | None:
         """Haushaltsverbrauch ohne WP, hochgerechnet auf 1 Jahr."""
         total = self.benchmark_own_annual_consumption_kwh
@@ -809,7 +1175,7 @@ class PVManagementFixController:
         wp = self.benchmark_own_heatpump_kwh or 0.0
         return max(0.0, total - wp)
 
-    @property
+    @_cycle_cached
     def benchmark_consumption_vs_avg(self) -> float | None:
         """Vergleich Haushaltsverbrauch (ohne WP) vs. Durchschnitt in %."""
         household = self.benchmark_household_consumption_kwh
@@ -820,7 +1186,7 @@ class PVManagementFixController:
             return None
         return (household - avg) / avg * 100
 
-    @property
+    @_cycle_cached
     def benchmark_heatpump_vs_avg(self) -> float | None:
         """Vergleich WP-Verbrauch vs. WP-Durchschnitt in %."""
         own_wp = self.benchmark_own_heatpump_kwh
@@ -831,48 +1197,38 @@ class PVManagementFixController:
             return None
         return (own_wp - avg_wp) / avg_wp * 100
 
-    @property
+    @_cycle_cached
     def benchmark_co2_avoided_kg(self) -> float | None:
         """CO2-Einsparung durch PV pro Jahr (kg)."""
-        if self._benchmark_start_date is None:
-            return None
-        days = max(1, (date.today() - self._benchmark_start_date).days)
-        pv_since_start = (
-            (self._total_self_consumption_kwh - self._benchmark_start_self_consumption)
-            + (self._total_feed_in_kwh - self._benchmark_start_feed_in)
-        )
-        if pv_since_start <= 0:
-            return None
-        daily_pv = pv_since_start / days
-        annual_pv = daily_pv * 365
-        if annual_pv > 100_000:
+        annual_pv = self.benchmark_annual_pv_production_kwh
+        if annual_pv is None:
             return None
         co2_factor = BENCHMARK_CO2_FACTORS.get(self.benchmark_country, BENCHMARK_CO2_FACTORS["AT"])
         return annual_pv * co2_factor
 
-    @property
+    @_cycle_cached
     def benchmark_annual_pv_production_kwh(self) -> float | None:
-        """Hochgerechnete PV-Jahresproduktion (snapshot-basiert)."""
+        """Hochgerechnete PV-Jahresproduktion (Tages-Rollups bzw. snapshot-basiert)."""
         if self._benchmark_start_date is None:
             return None
-        days = max(1, (date.today() - self._benchmark_start_date).days)
-        pv_since_start = (
-            (self._total_self_consumption_kwh - self._benchmark_start_self_consumption)
-            + (self._total_feed_in_kwh - self._benchmark_start_feed_in)
-        )
-        if pv_since_start <= 0:
-            return None
-        annual = pv_since_start / days * 365
-        if annual > 100_000:
+        annual = self._rollup_annualized("self_consumption_kwh", "feed_in_kwh")
+        if annual is None:
+            days = max(1, (self._today - self._benchmark_start_date).days)
+            pv_since_start = (
+                (self._total_self_consumption_kwh - self._benchmark_start_self_consumption)
+                + (self._total_feed_in_kwh - self._benchmark_start_feed_in)
+            )
+            annual = pv_since_start / days * 365
+        if annual <= 0 or annual > 100_000:
             return None
         return annual
 
-    @property
+    @_cycle_cached
     def total_installed_kwp(self) -> float:
         """Summe der installierten kWp aller Strings."""
         return sum(kwp for _, _, _, kwp in self.pv_strings if kwp > 0)
 
-    @property
+    @_cycle_cached
     def benchmark_specific_yield(self) -> float | None:
         """Spezifischer Ertrag in kWh/kWp (Jahresproduktion / installierte Leistung).
 
@@ -890,7 +1246,7 @@ class PVManagementFixController:
             return None
         return round(annual / kwp, 0)
 
-    @property
+    @_cycle_cached
     def benchmark_efficiency_score(self) -> int | None:
         """Effizienz-Score 0-100.
 
@@ -932,7 +1288,7 @@ class PVManagementFixController:
 
         return int(autarky_score + yield_score + ratio_score + consumption_score)
 
-    @property
+    @_cycle_cached
     def benchmark_rating(self) -> str | None:
         """Bewertung als Text."""
         score = self.benchmark_efficiency_score
@@ -952,66 +1308,221 @@ class PVManagementFixController:
     # ENTITY MANAGEMENT
     # =========================================================================
 
-    def register_entity_listener(self, cb) -> None:
-        """Sensoren registrieren sich hier für Updates."""
-        if cb not in self._entity_listeners:
-            self._entity_listeners.append(cb)
+    def register_entity_listener(
+        self, cb: Callable[[], None], groups: frozenset[str] = UPDATE_GROUPS_ALL
+    ) -> None:
+        """Sensoren registrieren sich hier für Updates der angegebenen Gruppen."""
+        self._entity_listeners[cb] = frozenset(groups)
 
     def unregister_entity_listener(self, cb) -> None:
         """Entfernt einen Entity-Listener."""
-        try:
-            self._entity_listeners.remove(cb)
-        except ValueError:
-            pass
+        self._entity_listeners.pop(cb, None)
+
+    def groups_version(self, groups: frozenset[str]) -> int:
+        """Gemeinsame Version der Gruppen; ändert sich, sobald eine davon geändert wurde."""
+        versions = self._group_versions
+        return sum(versions[group] for group in groups)
+
+    def _notify_entities(
+        self, groups: frozenset[str] = UPDATE_GROUPS_ALL, immediate: bool = False
+    ) -> None:
+        """Markiert die betroffenen Update-Gruppen und plant einen gebündelten Flush.
+
+        Alle Änderungen innerhalb von update_interval werden zu einem einzigen
+        Schreibvorgang zusammengefasst; geschrieben werden nur Entities, die eine
+        der geänderten Gruppen lesen. Ohne groups werden alle Entities aktualisiert.
+        immediate=True flusht sofort (Tageswechsel, Meilensteine, Benutzeraktionen).
+
+        Sensoren der Refresh-Tiers (periodic/daily) lesen keine Daten-Gruppen; sie
+        werden nur von ihrem Scheduler oder bei vollständigen Updates benachrichtigt.
+        """
+        if UPDATE_GROUP_PERIODIC in groups:
+            self._periodic_dirty = False
+        elif not REFRESH_TIER_GROUPS.issuperset(groups):
+            self._periodic_dirty = True
+        self._dirty_groups.update(groups)
+        versions = self._group_versions
+        for group in groups:
+            versions[group] += 1
+        if immediate or self.update_interval <= 0:
+            self._flush_entities()
+            return
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self.update_interval, self._scheduled_flush
+            )
+
+    @callback
+    def _scheduled_flush(self, _now: datetime) -> None:
+        """Timer-Callback für den gebündelten Flush."""
+        self._unsub_flush = None
+        self._flush_entities()
+
+    def _cancel_scheduled_flush(self) -> None:
+        """Bricht einen geplanten Flush ab."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+    def _start_periodic_refresh(self) -> None:
+        """(Re)startet den Scheduler des periodischen Tiers, wenn sich der Takt geändert hat."""
+        if self._unsub_periodic is not None and self._periodic_armed_interval == self.periodic_interval:
+            return
+        self._cancel_periodic_refresh()
+        self._periodic_armed_interval = self.periodic_interval
+        self._unsub_periodic = async_track_time_interval(
+            self.hass, self._on_periodic_refresh, timedelta(minutes=self.periodic_interval)
+        )
 
-    def _notify_entities(self) -> None:
+    def _cancel_periodic_refresh(self) -> None:
+        """Stoppt den Scheduler des periodischen Tiers."""
+        if self._unsub_periodic is not None:
+            self._unsub_periodic()
+            self._unsub_periodic = None
+        self._periodic_armed_interval = None
+
+    @callback
+    def _on_periodic_refresh(self, _now: datetime) -> None:
+        """Tick des periodischen Tiers: rechnet die Analyse-Sensoren nur bei neuen Daten neu."""
+        if self._periodic_dirty:
+            self._notify_entities({UPDATE_GROUP_PERIODIC})
+
+    def _flush_entities(self) -> None:
         """Informiert alle Entities über Zustandsänderungen."""
-        for cb in list(self._entity_listeners):
-            try:
-                cb()
-            except Exception as e:
-                _LOGGER.debug("Entity-Listener Fehler (ignoriert): %s", e)
+        self._cancel_scheduled_flush()
+        if not self._dirty_groups:
+            return
+        dirty = self._dirty_groups
+        self._dirty_groups = set()
 
-        # Sync to helper after every update
+        # Ein Snapshot für den ganzen Zyklus: jede Kennzahl wird höchstens einmal berechnet
+        self._metrics_cache = {}
+        try:
+            for cb, groups in list(self._entity_listeners.items()):
+                if groups.isdisjoint(dirty):
+                    continue
+                try:
+                    cb()
+                except Exception as e:
+                    _LOGGER.debug("Entity-Listener Fehler (ignoriert): %s", e)
+        finally:
+            self._metrics_cache = None
+
+        # Getrackter Zustand hat sich geändert → gebündeltes Speichern einplanen
+        self._schedule_save()
+
+        # Ersparnis und Benachrichtigungen hängen nur an den Energiezählern
+        if UPDATE_GROUP_ENERGY not in dirty:
+            return
+
+        # Helper-Sync anfordern (gedrosselt und gebündelt, siehe _sync_to_helper)
         self._sync_to_helper()
 
         # Check for notifications
         self._check_milestones()
         self._check_quota_warnings()
-        self._check_monthly_summary()
 
+    def _milestone_due(self) -> bool:
+        """True wenn ein noch nicht gefeuerter Meilenstein erreicht ist."""
+        if self.installation_cost <= 0:
+            return False
+        percent = self.amortisation_percent
+        return any(percent >= m and m not in self._milestones_fired for m in AMORTISATION_MILESTONES)
+
+    @callback
     def _sync_to_helper(self) -> None:
-        """Synchronisiert die Gesamtersparnis zum Helper."""
+        """Fordert einen Sync der Gesamtersparnis zum Helper an.
+
+        Höchstens ein Service-Call ist unterwegs, zwei Syncs liegen mindestens
+        helper_sync_interval auseinander. Anforderungen in der Zwischenzeit werden
+        zu einem Sync mit dem dann aktuellen Wert zusammengefasst (coalesced).
+        """
         if not self.amortisation_helper:
             return
+        if self._helper_sync_task is not None or self._unsub_helper_sync is not None:
+            self.helper_sync_stats["coalesced"] += 1
+            self._helper_sync_dirty = True
+            return
+        wait = self._helper_last_sync + self.helper_sync_interval - time.monotonic()
+        if wait > 0:
+            self._unsub_helper_sync = async_call_later(self.hass, wait, self._scheduled_helper_sync)
+            return
+        self._write_helper()
 
+    @callback
+    def _scheduled_helper_sync(self, _now: datetime) -> None:
+        """Timer-Callback: gebündelten Helper-Sync ausführen."""
+        self._unsub_helper_sync = None
+        self._helper_sync_dirty = False
+        self._write_helper()
+
+    def _cancel_helper_sync(self) -> None:
+        """Bricht einen geplanten Helper-Sync ab."""
+        if self._unsub_helper_sync is not None:
+            self._unsub_helper_sync()
+            self._unsub_helper_sync = None
+
+    def _helper_value_to_write(self) -> float | None:
+        """Neuer Helper-Wert oder None, wenn der Helper schon aktuell (≤ 0.01 EUR) oder nicht lesbar ist."""
+        state = self.hass.states.get(self.amortisation_helper)
+        if not state or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
         try:
-            current_savings = self.total_savings
-            state = self.hass.states.get(self.amortisation_helper)
+            helper_value = float(state.state)
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning("Helper sync error: %s", e)
+            return None
+        current_savings = round(self.total_savings, 2)
+        if abs(helper_value - current_savings) <= 0.01:
+            return None
+        return current_savings
 
-            if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                try:
-                    helper_value = float(state.state)
-                    # Nur updaten wenn sich der Wert signifikant geändert hat (> 0.01 EUR)
-                    if abs(helper_value - current_savings) > 0.01:
-                        self.hass.async_create_task(
-                            self.hass.services.async_call(
-                                "input_number",
-                                "set_value",
-                                {
-                                    "entity_id": self.amortisation_helper,
-                                    "value": round(current_savings, 2),
-                                },
-                            )
-                        )
-                        _LOGGER.debug(
-                            "Amortisation Helper synced: %.2f EUR → %s",
-                            current_savings, self.amortisation_helper
-                        )
-                except (ValueError, TypeError) as e:
-                    _LOGGER.warning("Helper sync error: %s", e)
+    @callback
+    def _write_helper(self) -> None:
+        """Startet den Schreibvorgang im Hintergrund, falls nötig."""
+        value = self._helper_value_to_write()
+        if value is None:
+            self.helper_sync_stats["skipped"] += 1
+            return
+        self._helper_sync_task = self.hass.async_create_task(self._async_write_helper(value))
+
+    async def _async_write_helper(self, value: float) -> None:
+        """Schreibt den Wert in den Helper; danach ggf. den nächsten Sync einplanen."""
+        try:
+            await self.hass.services.async_call(
+                "input_number",
+                "set_value",
+                {"entity_id": self.amortisation_helper, "value": value},
+                blocking=True,
+            )
+            self.helper_sync_stats["written"] += 1
+            _LOGGER.debug("Amortisation Helper synced: %.2f EUR → %s", value, self.amortisation_helper)
         except Exception as e:
             _LOGGER.debug("Helper sync failed (ignoriert): %s", e)
+        finally:
+            self._helper_sync_task = None
+            self._helper_last_sync = time.monotonic()
+            if self._helper_sync_dirty and self._started:
+                self._helper_sync_dirty = False
+                self._sync_to_helper()
+
+    async def _async_on_hass_stop(self, _event: Event) -> None:
+        """HA fährt herunter (ohne Entladen der Integration): Helper final schreiben, Rollups sichern."""
+        self._unsub_hass_stop = None
+        await self._async_final_helper_sync()
+        await self.hass.async_add_executor_job(self.rollups.flush)
+
+    async def _async_final_helper_sync(self) -> None:
+        """Letzter Sync beim Beenden: ausstehenden Call abwarten, dann ungedrosselt schreiben."""
+        self._cancel_helper_sync()
+        self._helper_sync_dirty = False
+        if self._helper_sync_task is not None:
+            await asyncio.shield(self._helper_sync_task)
+        if not self.amortisation_helper:
+            return
+        value = self._helper_value_to_write()
+        if value is not None:
+            await self._async_write_helper(value)
 
     async def _restore_from_helper(self) -> bool:
         """Stellt die Gesamtersparnis vom Helper wieder her."""
@@ -1036,9 +1547,11 @@ class PVManagementFixController:
                     # Also: savings_offset = helper_value - (accumulated_savings_self + accumulated_earnings_feed)
                     current_accumulated = self._accumulated_savings_self + self._accumulated_earnings_feed
                     self.savings_offset = max(0, helper_value - current_accumulated)
+                    self._helper_savings_offset = self.savings_offset
 
                     self._restored = True
-                    self._notify_entities()
+                    self._mark_ready()
+                    self._notify_entities(immediate=True)
                     return True
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Restore from helper failed: %s", e)
@@ -1055,9 +1568,8 @@ class PVManagementFixController:
             return
 
         percent = self.amortisation_percent
-        milestones = [25, 50, 75, 100]
 
-        for milestone in milestones:
+        for milestone in AMORTISATION_MILESTONES:
             if percent >= milestone and milestone not in self._milestones_fired:
                 self._milestones_fired.add(milestone)
 
@@ -1126,8 +1638,8 @@ class PVManagementFixController:
             _LOGGER.warning("Kontingent überschritten: %s", message)
 
     def _check_monthly_summary(self) -> None:
-        """Sendet monatliche Zusammenfassung am 1. des Monats."""
-        today = date.today()
+        """Sendet monatliche Zusammenfassung am 1. des Monats (aus dem Monatswechsel)."""
+        today = self._today
 
         # Nur am 1. des Monats und nur einmal pro Monat
         if today.day != 1:
@@ -1141,9 +1653,9 @@ class PVManagementFixController:
         last_month = today - timedelta(days=1)
         month_name = last_month.strftime("%B %Y")
 
-        # Monatliche Werte (aus dem Tracking)
-        monthly_savings = self._monthly_grid_import_cost  # Ungefähr
-        monthly_kwh = self._monthly_grid_import_kwh
+        # Monatliche Werte (Monats-Rollup des Vormonats)
+        monthly_savings = self.rollups.value(PERIOD_MONTH, month_key(last_month), "import_cost_eur")  # Ungefähr
+        monthly_kwh = self.rollups.value(PERIOD_MONTH, month_key(last_month), "grid_import_kwh")
 
         message = f"PV-Bericht {month_name}: {monthly_kwh:.0f} kWh Netzbezug, {self.amortisation_percent:.1f}% amortisiert"
 
@@ -1173,19 +1685,29 @@ class PVManagementFixController:
 
         self._tracked_grid_import_kwh = safe_float(data.get("tracked_grid_import_kwh"))
         self._total_grid_import_cost = safe_float(data.get("total_grid_import_cost"))
+        tracked_since = data.get("tracked_since")
+        self._tracked_since = {
+            name: safe_float(tracked_since.get(name), None) if isinstance(tracked_since, dict) else None
+            for name in ACCUMULATORS
+        }
 
-        today = date.today()
+        today = self._today
 
-        # Daily tracking restore
+        # Daily tracking restore (Werte in den Rollups; die Store-Felder übernehmen
+        # nur Installationen ohne Rollup-Datei, d.h. beim ersten Start nach dem Update)
         daily_reset_str = data.get("daily_reset_date")
         if daily_reset_str:
             try:
                 daily_reset_date = date.fromisoformat(daily_reset_str)
                 if daily_reset_date == today:
-                    self._daily_grid_import_kwh = safe_float(data.get("daily_grid_import_kwh"))
-                    self._daily_grid_import_cost = safe_float(data.get("daily_grid_import_cost"))
-                    self._daily_feed_in_earnings = safe_float(data.get("daily_feed_in_earnings"))
-                    self._daily_feed_in_kwh = safe_float(data.get("daily_feed_in_kwh"))
+                    self._daily_tracking_date = today
+                    self.rollups.seed(
+                        PERIOD_DAY, day_key(today),
+                        grid_import_kwh=safe_float(data.get("daily_grid_import_kwh")),
+                        import_cost_eur=safe_float(data.get("daily_grid_import_cost")),
+                        earnings_eur=safe_float(data.get("daily_feed_in_earnings")),
+                        feed_in_kwh=safe_float(data.get("daily_feed_in_kwh")),
+                    )
                     # Quota Tages-Zählerstand wiederherstellen
                     qdsm = data.get("quota_day_start_meter")
                     if qdsm is not None:
@@ -1200,8 +1722,12 @@ class PVManagementFixController:
         if monthly_reset_month is not None and monthly_reset_year is not None:
             try:
                 if int(monthly_reset_month) == today.month and int(monthly_reset_year) == today.year:
-                    self._monthly_grid_import_kwh = safe_float(data.get("monthly_grid_import_kwh"))
-                    self._monthly_grid_import_cost = safe_float(data.get("monthly_grid_import_cost"))
+                    self._monthly_tracking_month = today.month
+                    self.rollups.seed(
+                        PERIOD_MONTH, month_key(today),
+                        grid_import_kwh=safe_float(data.get("monthly_grid_import_kwh")),
+                        import_cost_eur=safe_float(data.get("monthly_grid_import_cost")),
+                    )
             except (ValueError, TypeError):
                 pass
 
@@ -1242,7 +1768,7 @@ class PVManagementFixController:
         if dp_date:
             try:
                 dp = date.fromisoformat(dp_date) if isinstance(dp_date, str) else dp_date
-                if dp == date.today():
+                if dp == self._today:
                     raw_dp = data.get("string_daily_peak_w", {})
                     self._string_daily_peak_w = {k: safe_float(v) for k, v in raw_dp.items()} if isinstance(raw_dp, dict) else {}
                     self._string_daily_peak_date = dp
@@ -1260,6 +1786,35 @@ class PVManagementFixController:
         self._benchmark_start_grid_import = safe_float(data.get("benchmark_start_grid_import"))
         self._benchmark_start_feed_in = safe_float(data.get("benchmark_start_feed_in"))
 
+        # Checkpoint: Zählerstände zum Zeitpunkt des letzten Speicherns (ältere Stände haben keine)
+        cp_time = data.get("checkpoint_time")
+        self._checkpoint_time = dt_util.parse_datetime(cp_time) if isinstance(cp_time, str) else None
+        self._checkpoint_meters = {
+            key: safe_float(data.get(key), None)
+            for key in ("last_pv_production_kwh", "last_grid_export_kwh", "last_grid_import_kwh")
+        }
+        self._checkpoint_prices = {
+            PRICE_KIND_ELECTRICITY: safe_float(data.get("last_electricity_price"), None),
+            PRICE_KIND_FEED_IN: safe_float(data.get("last_feed_in_tariff"), None),
+        }
+        rollup_written = data.get("rollup_written")
+        self._checkpoint_rollups = (
+            {k: safe_float(v) for k, v in rollup_written.items()} if isinstance(rollup_written, dict) else None
+        )
+        self._recovered_kwh = safe_float(data.get("recovered_kwh"))
+        backfill = data.get("backfill")
+        self._cancel_backfill()
+        self._backfill = backfill if isinstance(backfill, dict) else None
+        statistics_hour = data.get("statistics_hour")
+        statistics_sums = data.get("statistics_sums")
+        self._statistics_hour = statistics_hour if isinstance(statistics_hour, int) else None
+        self._statistics_sums = (
+            {k: safe_float(v) for k, v in statistics_sums.items()} if isinstance(statistics_sums, dict) else {}
+        )
+        last_gap = data.get("last_gap")
+        self._last_gap = last_gap if isinstance(last_gap, dict) else None
+        self._checkpoint_ref = self._checkpoint_totals()
+
         self._restored = True
         _LOGGER.info(
             "PV Management Fixpreis restored: %.2f kWh self, %.2f kWh feed, %.2f€ savings",
@@ -1267,13 +1822,20 @@ class PVManagementFixController:
             self._total_feed_in_kwh,
             self._accumulated_savings_self + self._accumulated_earnings_feed,
         )
+        self._mark_ready()
 
-        @callback
-        def delayed_restore_notify(_now):
-            self._notify_entities()
+    @property
+    def ready(self) -> bool:
+        """True sobald der Zustand feststeht; bis dahin sind die Sensoren nicht verfügbar."""
+        return self._ready
 
-        from homeassistant.helpers.event import async_call_later
-        async_call_later(self.hass, 5.0, delayed_restore_notify)
+    def _mark_ready(self) -> None:
+        """Markiert den Zustand als feststehend (datengetrieben statt per Timer)."""
+        if self._ready:
+            return
+        self._ready = True
+        if self._started:
+            self._notify_entities(immediate=True)
 
     def _initialize_from_sensors(self) -> None:
         """Initialisiert die Werte mit den aktuellen Sensor-Totals."""
@@ -1296,6 +1858,7 @@ class PVManagementFixController:
                 except (ValueError, TypeError):
                     pass
 
+        self._mark_ready()
         if pv_total <= 0:
             _LOGGER.info("Keine historischen PV-Daten verfügbar, starte bei 0")
             return
@@ -1311,17 +1874,422 @@ class PVManagementFixController:
         self._total_feed_in_kwh = feed_in
         self._accumulated_savings_self = savings_self
         self._accumulated_earnings_feed = earnings_feed
-        self._first_seen_date = date.today()
+        self._first_seen_date = self._today
 
         _LOGGER.info(
             "PV Management Fixpreis initialisiert: Eigenverbrauch=%.2f kWh (%.2f€), Einspeisung=%.2f kWh (%.2f€)",
             self_consumption, savings_self, feed_in, earnings_feed,
         )
-        self._notify_entities()
+        self._plan_backfill(pv_total, export_total)
+        self._notify_entities(immediate=True)
+
+    # -------------------------------------------------------------------------
+    # Statistik-Nachtrag (Erstinstallation)
+    # -------------------------------------------------------------------------
+
+    def _plan_backfill(self, pv_total: float, export_total: float) -> None:
+        """Merkt den Nachtrag für die eben übernommenen Lebensdauer-Zählerstände vor.
+
+        Für alle vollen Stunden vor dem Start liefert der Recorder Stundenwerte; sie
+        werden mit ihrem historischen Preis neu bewertet. Der Rest (vor den
+        Statistiken, angebrochene Stunde) bleibt beim heutigen Preis.
+        """
+        if "recorder" not in self.hass.config.components:
+            return
+        self._backfill = {
+            "status": BACKFILL_PENDING,
+            "start": None,
+            "cursor": None,
+            "end": dt_util.utcnow().replace(minute=0, second=0, microsecond=0).isoformat(),
+            "first_hour": None,
+            "hours": 0,
+            "init_date": self._today.isoformat(),
+            "init_gross_price": self.gross_price,
+            "init_feed_in_tariff": self.current_feed_in_tariff,
+            "init_pv_kwh": pv_total,
+            "init_export_kwh": export_total,
+            "init_grid_import_kwh": self._tracked_grid_import_kwh,
+            # Zuletzt gesehene Stundenmittel der Preis-Sensoren (€/kWh)
+            "price": None,
+            "tariff": None,
+            # Nachgetragene Zähler-Energie und Änderungen der Totals
+            "pv_kwh": 0.0,
+            "export_kwh": 0.0,
+            "self_consumption_kwh": 0.0,
+            "feed_in_kwh": 0.0,
+            "grid_import_kwh": 0.0,
+            "self_consumption_added_kwh": 0.0,
+            "feed_in_added_kwh": 0.0,
+        }
+        self.rollups.reset_backfill()
+        if self._started:
+            self._start_backfill()
+
+    def _start_backfill(self) -> None:
+        """Startet bzw. setzt einen offenen Nachtrag im Hintergrund fort."""
+        backfill = self._backfill
+        if (backfill is None or backfill["status"] not in (BACKFILL_PENDING, BACKFILL_RUNNING)
+                or self._backfill_task is not None or "recorder" not in self.hass.config.components):
+            return
+        self._backfill_task = self.hass.async_create_background_task(
+            self._async_run_backfill(), f"{DOMAIN} statistics backfill"
+        )
+
+    def _cancel_backfill(self) -> None:
+        """Bricht den Nachtrag ab; er läuft beim nächsten Start ab dem Cursor weiter."""
+        if self._backfill_task is not None:
+            self._backfill_task.cancel()
+            self._backfill_task = None
+
+    async def _async_run_backfill(self) -> None:
+        """Liest die Stunden-Statistiken seitenweise im Recorder-Executor und übernimmt sie.
+
+        Nach jeder Seite werden Zustand (inkl. Cursor) und Rollups gespeichert; ein
+        Abbruch (Neustart, Fehler) setzt beim nächsten Start an dieser Stelle fort.
+        """
+        from homeassistant.components.recorder import get_instance
+
+        backfill = self._backfill
+        recorder = get_instance(self.hass)
+        meters = {
+            entity_id: key
+            for key, entity_id in (
+                (METER_PV, self.pv_production_entity),
+                (METER_EXPORT, self.grid_export_entity),
+                (METER_IMPORT, self.grid_import_entity),
+            )
+            if entity_id
+        }
+        prices = {
+            entity_id: kind
+            for kind, entity_id in (
+                (PRICE_KIND_ELECTRICITY, self.electricity_price_entity),
+                (PRICE_KIND_FEED_IN, self.feed_in_tariff_entity),
+            )
+            if entity_id
+        }
+        end = dt_util.parse_datetime(backfill["end"])
+        try:
+            if backfill["cursor"] is None:
+                start = await recorder.async_add_executor_job(
+                    first_statistics_start, self.hass, meters, end
+                )
+                if self._backfill is not backfill:
+                    return
+                if start is None:
+                    _LOGGER.info("Statistik-Nachtrag: keine Langzeit-Statistiken der Zähler vorhanden")
+                    backfill["status"] = BACKFILL_NO_STATISTICS
+                    self._schedule_save()
+                    return
+                backfill.update(status=BACKFILL_RUNNING, start=start.isoformat(), cursor=start.isoformat())
+                _LOGGER.info("Statistik-Nachtrag gestartet: %s bis %s", start, end)
+            cursor = dt_util.parse_datetime(backfill["cursor"])
+            while cursor < end:
+                page_end = min(cursor + BACKFILL_PAGE, end)
+                hours, means = await recorder.async_add_executor_job(
+                    read_hours, self.hass, meters, prices, cursor, page_end
+                )
+                if self._backfill is not backfill:
+                    # Zustand wurde inzwischen ersetzt: Seite gehört nicht zu diesen Totals
+                    return
+                self._apply_backfill_page(hours, means, page_end)
+                cursor = page_end
+                _LOGGER.info(
+                    "Statistik-Nachtrag: %.0f%% (bis %s, %d Stunden)",
+                    self.backfill_progress["percent"], cursor, backfill["hours"],
+                )
+                await self.async_save_state()
+        except Exception as e:
+            _LOGGER.error("Statistik-Nachtrag unterbrochen, wird beim nächsten Start fortgesetzt: %s", e)
+            return
+        finally:
+            self._backfill_task = None
+        self._finish_backfill()
+        await self.async_save_state()
+
+    def _apply_backfill_page(
+        self,
+        hours: dict[float, dict[str, float]],
+        means: dict[str, dict[float, float]],
+        page_end: datetime,
+    ) -> None:
+        """Übernimmt eine Seite Stundenwerte (ohne await: Totals und Cursor bleiben konsistent).
+
+        Energie, die schon im übernommenen Lebensdauer-Zählerstand steckt, wird nur
+        neu bewertet (historischer statt heutiger Preis, Eigenverbrauch je Stunde);
+        darüber hinaus wird sie ergänzt. Netzbezug war nicht enthalten und wird ergänzt.
+        """
+        backfill = self._backfill
+        init_gross = backfill["init_gross_price"]
+        init_tariff = backfill["init_feed_in_tariff"]
+        price_means = means.get(PRICE_KIND_ELECTRICITY, {})
+        tariff_means = means.get(PRICE_KIND_FEED_IN, {})
+        for start in sorted(hours.keys() | price_means.keys() | tariff_means.keys()):
+            if start in price_means:
+                backfill["price"] = self._convert_price_to_eur(
+                    price_means[start], self.electricity_price_unit, auto_detect=True
+                )
+            if start in tariff_means:
+                backfill["tariff"] = self._convert_price_to_eur(
+                    tariff_means[start], self.feed_in_tariff_unit, auto_detect=True
+                )
+            meters = hours.get(start)
+            if not meters:
+                continue
+            delta_pv, delta_export, delta_import = (
+                delta if 0 <= delta <= MAX_DELTA_KWH else 0.0
+                for delta in (meters.get(METER_PV, 0.0), meters.get(METER_EXPORT, 0.0), meters.get(METER_IMPORT, 0.0))
+            )
+            gross_price = backfill["price"] * self.markup_factor if backfill["price"] is not None else init_gross
+            tariff = backfill["tariff"] if backfill["tariff"] is not None else init_tariff
+            delta_self_consumption = max(0.0, delta_pv - delta_export)
+            savings = delta_self_consumption * gross_price
+            earnings = delta_export * tariff
+            import_cost = delta_import * gross_price
+
+            backfill["pv_kwh"] += delta_pv
+            backfill["export_kwh"] += delta_export
+            if backfill["pv_kwh"] <= backfill["init_pv_kwh"] and backfill["export_kwh"] <= backfill["init_export_kwh"]:
+                added_self = delta_self_consumption - (delta_pv - delta_export)
+                added_feed = 0.0
+                savings_change = savings - (delta_pv - delta_export) * init_gross
+                earnings_change = earnings - delta_export * init_tariff
+            else:
+                added_self, added_feed = delta_self_consumption, delta_export
+                savings_change, earnings_change = savings, earnings
+
+            self._total_self_consumption_kwh += added_self
+            self._total_feed_in_kwh += added_feed
+            self._accumulated_savings_self += savings_change
+            self._accumulated_earnings_feed += earnings_change
+            self._tracked_grid_import_kwh += delta_import
+            self._total_grid_import_cost += import_cost
+
+            backfill["self_consumption_kwh"] += delta_self_consumption
+            backfill["feed_in_kwh"] += delta_export
+            backfill["grid_import_kwh"] += delta_import
+            backfill["self_consumption_added_kwh"] += added_self
+            backfill["feed_in_added_kwh"] += added_feed
+            backfill["hours"] += 1
+            if backfill["first_hour"] is None:
+                backfill["first_hour"] = dt_util.utc_from_timestamp(start).isoformat()
+
+            deltas = {
+                "self_consumption_kwh": delta_self_consumption,
+                "feed_in_kwh": delta_export,
+                "grid_import_kwh": delta_import,
+                "savings_eur": savings,
+                "earnings_eur": earnings,
+                "import_cost_eur": import_cost,
+            }
+            # Nach einem Abbruch vor dem Speichern des Cursors stehen Stunden dieser
+            # Seite schon in den Rollups: nur Totals und Live-Historie nachziehen
+            self.rollups.add_backfill(start, **deltas)
+            self.energy_history.add_spread(start, start + 3600, **deltas)
+        backfill["cursor"] = page_end.isoformat()
+        self._notify_entities(immediate=True)
+
+    def _finish_backfill(self) -> None:
+        """Abschluss: Tracking-Beginn und Benchmark-Snapshot auf die erste Statistik-Stunde vorziehen."""
+        backfill = self._backfill
+        backfill["status"] = BACKFILL_DONE
+        # Nachgetragene Stunden liegen vor der bisherigen Übertragung: alles neu übertragen
+        self._reset_statistics()
+        self._publish_statistics()
+        if backfill["first_hour"] is not None:
+            first_day = dt_util.as_local(dt_util.parse_datetime(backfill["first_hour"])).date()
+            if self._first_seen_date is None or first_day < self._first_seen_date:
+                self._first_seen_date = first_day
+            # Snapshot der Erstinstallation (nicht zurückgesetzt): Stand so wählen, dass die
+            # Differenz seit Start genau die nachgetragenen Stunden plus das Live-Tracking umfasst
+            if (self._benchmark_start_date is not None
+                    and self._benchmark_start_date.isoformat() == backfill["init_date"]):
+                init_self = max(0.0, backfill["init_pv_kwh"] - backfill["init_export_kwh"])
+                self._benchmark_start_date = first_day
+                self._benchmark_start_self_consumption = (
+                    init_self + backfill["self_consumption_added_kwh"] - backfill["self_consumption_kwh"]
+                )
+                self._benchmark_start_feed_in = (
+                    backfill["init_export_kwh"] + backfill["feed_in_added_kwh"] - backfill["feed_in_kwh"]
+                )
+                self._benchmark_start_grid_import = backfill["init_grid_import_kwh"]
+        _LOGGER.info(
+            "Statistik-Nachtrag abgeschlossen: %d Stunden, Eigenverbrauch %.1f kWh, "
+            "Einspeisung %.1f kWh, Netzbezug %.1f kWh",
+            backfill["hours"], backfill["self_consumption_kwh"],
+            backfill["feed_in_kwh"], backfill["grid_import_kwh"],
+        )
+        self._notify_entities(immediate=True)
+
+    @property
+    def backfill_progress(self) -> dict[str, Any] | None:
+        """Stand des Statistik-Nachtrags (None wenn keiner vorgesehen war)."""
+        backfill = self._backfill
+        if backfill is None:
+            return None
+        percent = None
+        if backfill["start"] and backfill["cursor"]:
+            start, cursor, end = (
+                dt_util.parse_datetime(backfill[key]) for key in ("start", "cursor", "end")
+            )
+            span = (end - start).total_seconds()
+            percent = 100.0 if span <= 0 else round((cursor - start).total_seconds() / span * 100, 1)
+        return {
+            "status": backfill["status"],
+            "percent": percent,
+            "start": backfill["start"],
+            "cursor": backfill["cursor"],
+            "end": backfill["end"],
+            "hours": backfill["hours"],
+        }
+
+    # -------------------------------------------------------------------------
+    # Persistenz (Store)
+    # -------------------------------------------------------------------------
+
+    async def async_load_state(self) -> bool:
+        """Lädt den gespeicherten Zustand aus dem Store (vor dem Anlegen der Sensoren)."""
+        try:
+            await self.hass.async_add_executor_job(self.rollups.open, self._rollup_path)
+        except OSError as e:
+            _LOGGER.error("Rollup-Datei konnte nicht geöffnet werden, Werte nur im Speicher: %s", e)
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.error("Gespeicherter Zustand konnte nicht geladen werden: %s", e)
+            return False
+        if not isinstance(data, dict):
+            # Noch kein Store: einmalig den Attribut-Snapshot älterer Versionen übernehmen.
+            # Muss vor Helper-Restore und Erstinitialisierung (Nachtrag) feststehen.
+            data = self._legacy_restore_data()
+            if data is None:
+                return False
+            _LOGGER.info("Zustand aus den Attributen der Gesamtersparnis migriert")
+            self.restore_state(data)
+            self._schedule_save()
+            return True
+        self.restore_state(data)
+        return True
+
+    def _legacy_restore_data(self) -> dict[str, Any] | None:
+        """Zustand aus dem letzten State der Gesamtersparnis (Versionen vor dem Store)."""
+        from .sensor import TOTAL_SAVINGS_SENSOR, sensor_unique_id
+
+        entity_id = er.async_get(self.hass).async_get_entity_id(
+            "sensor", DOMAIN,
+            sensor_unique_id(self.entry.data.get(CONF_NAME, DEFAULT_NAME), TOTAL_SAVINGS_SENSOR.key),
+        )
+        if entity_id is None:
+            return None
+        stored = restore_state.async_get(self.hass).last_states.get(entity_id)
+        if stored is None or stored.state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        attrs = stored.state.attributes or {}
+        if "tracked_self_consumption_kwh" not in attrs:
+            return None
+
+        def safe_float(val, default=0.0):
+            try:
+                return float(val) if val is not None else default
+            except (ValueError, TypeError):
+                return default
+
+        return {
+            "total_self_consumption_kwh": safe_float(attrs.get("tracked_self_consumption_kwh")),
+            "total_feed_in_kwh": safe_float(attrs.get("tracked_feed_in_kwh")),
+            "accumulated_savings_self": safe_float(attrs.get("accumulated_savings_self")),
+            "accumulated_earnings_feed": safe_float(attrs.get("accumulated_earnings_feed")),
+            "first_seen_date": attrs.get("first_seen_date"),
+            "tracked_grid_import_kwh": safe_float(attrs.get("tracked_grid_import_kwh")),
+            "total_grid_import_cost": safe_float(attrs.get("total_grid_import_cost")),
+            "tracked_wp_kwh": safe_float(attrs.get("tracked_wp_kwh")),
+            "wp_first_seen_date": attrs.get("wp_first_seen_date"),
+            "string_tracked_kwh": attrs.get("string_tracked_kwh", {}),
+            "string_first_seen_date": attrs.get("string_first_seen_date"),
+            "string_peak_w": attrs.get("string_peak_w", {}),
+            "string_daily_peak_w": attrs.get("string_daily_peak_w", {}),
+            "string_daily_peak_date": attrs.get("string_daily_peak_date"),
+            "daily_grid_import_kwh": safe_float(attrs.get("daily_grid_import_kwh")),
+            "daily_grid_import_cost": safe_float(attrs.get("daily_grid_import_cost")),
+            "daily_feed_in_earnings": safe_float(attrs.get("daily_feed_in_earnings")),
+            "daily_feed_in_kwh": safe_float(attrs.get("daily_feed_in_kwh")),
+            "daily_reset_date": attrs.get("daily_reset_date"),
+            "quota_day_start_meter": safe_float(attrs.get("quota_day_start_meter")),
+            "monthly_grid_import_kwh": safe_float(attrs.get("monthly_grid_import_kwh")),
+            "monthly_grid_import_cost": safe_float(attrs.get("monthly_grid_import_cost")),
+            "monthly_reset_month": attrs.get("monthly_reset_month"),
+            "monthly_reset_year": attrs.get("monthly_reset_year"),
+            "benchmark_start_date": attrs.get("benchmark_start_date"),
+            "benchmark_start_self_consumption": safe_float(attrs.get("benchmark_start_self_consumption")),
+            "benchmark_start_grid_import": safe_float(attrs.get("benchmark_start_grid_import")),
+            "benchmark_start_feed_in": safe_float(attrs.get("benchmark_start_feed_in")),
+        }
+
+    def _checkpoint_totals(self) -> tuple[float, float]:
+        """Summe der persistierten Geld- (€) und Energie-Akkumulatoren (kWh)."""
+        eur = (self._accumulated_savings_self + self._accumulated_earnings_feed
+               + self._total_grid_import_cost)
+        kwh = (self._total_self_consumption_kwh + self._total_feed_in_kwh
+               + self._tracked_grid_import_kwh)
+        return eur, kwh
+
+    def _checkpoint_due(self) -> bool:
+        """True wenn seit dem letzten Checkpoint mehr als die Delta-Schwellen aufgelaufen ist."""
+        eur, kwh = self._checkpoint_totals()
+        ref_eur, ref_kwh = self._checkpoint_ref
+        return abs(eur - ref_eur) >= CHECKPOINT_DELTA_EUR or abs(kwh - ref_kwh) >= CHECKPOINT_DELTA_KWH
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Plant den nächsten Checkpoint; weitere Änderungen bis dahin teilen sich den Schreibvorgang.
+
+        Store.async_delay_save verschiebt den Timer bei jedem Aufruf, daher wird
+        nur einmal pro Intervall geplant (sonst würde bei laufenden Updates nie gespeichert).
+        Überschreiten die ungespeicherten Werte die Delta-Schwellen, wird sofort geschrieben.
+        Der Store schreibt atomar (temporäre Datei + rename) und beim Beenden von HA
+        ausstehende Daten selbst (final write).
+        """
+        if self._save_pending:
+            if self._checkpoint_due():
+                self._store.async_delay_save(self._data_to_save, 0)
+            return
+        self._save_pending = True
+        delay = 0 if self._checkpoint_due() else self.checkpoint_interval
+        self._store.async_delay_save(self._data_to_save, delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Liefert den Zustand zum Schreibzeitpunkt (immer aktuell)."""
+        self._save_pending = False
+        self._checkpoint_ref = self._checkpoint_totals()
+        # Rollups liegen bereits in den gemappten Seiten; mit dem Checkpoint auf die Platte
+        if self._rollup_flush_task is None:
+            self._rollup_flush_task = self.hass.async_create_background_task(
+                self._async_flush_rollups(), f"{DOMAIN} rollup flush"
+            )
+        return self.get_state_for_storage()
+
+    async def _async_flush_rollups(self) -> None:
+        """Sichert die Rollups im Executor (async_save_state wartet darauf)."""
+        try:
+            await self.hass.async_add_executor_job(self.rollups.flush)
+        except OSError as err:
+            _LOGGER.warning("Rollups konnten nicht gesichert werden: %s", err)
+        finally:
+            self._rollup_flush_task = None
+
+    async def async_save_state(self) -> None:
+        """Speichert den Zustand sofort (Entladen der Integration)."""
+        self._save_pending = False
+        self._checkpoint_ref = self._checkpoint_totals()
+        await self._store.async_save(self.get_state_for_storage())
+        if self._rollup_flush_task is not None:
+            await asyncio.wait([self._rollup_flush_task])
+        await self.hass.async_add_executor_job(self.rollups.flush)
 
     def get_state_for_storage(self) -> dict[str, Any]:
         """Gibt den zu speichernden Zustand zurück."""
-        today = date.today()
+        today = self._today
         return {
             "total_self_consumption_kwh": self._total_self_consumption_kwh,
             "total_feed_in_kwh": self._total_feed_in_kwh,
@@ -1330,14 +2298,16 @@ class PVManagementFixController:
             "first_seen_date": self._first_seen_date.isoformat() if self._first_seen_date else None,
             "tracked_grid_import_kwh": self._tracked_grid_import_kwh,
             "total_grid_import_cost": self._total_grid_import_cost,
-            "daily_grid_import_kwh": self._daily_grid_import_kwh,
-            "daily_grid_import_cost": self._daily_grid_import_cost,
-            "daily_feed_in_earnings": self._daily_feed_in_earnings,
-            "daily_feed_in_kwh": self._daily_feed_in_kwh,
+            "tracked_since": self._tracked_since,
+            # Tages-/Monatswerte stehen in den Rollups; hier nur als Kopie für ältere Versionen
+            "daily_grid_import_kwh": self.daily_grid_import_kwh,
+            "daily_grid_import_cost": self.daily_grid_import_cost,
+            "daily_feed_in_earnings": self.daily_feed_in_earnings,
+            "daily_feed_in_kwh": self.daily_feed_in_kwh,
             "quota_day_start_meter": self._quota_day_start_meter,
             "daily_reset_date": today.isoformat(),
-            "monthly_grid_import_kwh": self._monthly_grid_import_kwh,
-            "monthly_grid_import_cost": self._monthly_grid_import_cost,
+            "monthly_grid_import_kwh": self.monthly_grid_import_kwh,
+            "monthly_grid_import_cost": self.monthly_grid_import_cost,
             "monthly_reset_month": today.month,
             "monthly_reset_year": today.year,
             "tracked_wp_kwh": self._tracked_wp_kwh,
@@ -1351,6 +2321,19 @@ class PVManagementFixController:
             "benchmark_start_self_consumption": self._benchmark_start_self_consumption,
             "benchmark_start_grid_import": self._benchmark_start_grid_import,
             "benchmark_start_feed_in": self._benchmark_start_feed_in,
+            # Checkpoint: zuletzt verarbeitete Zählerstände, konsistent zu den Akkumulatoren
+            "checkpoint_time": dt_util.utcnow().isoformat(),
+            "last_pv_production_kwh": self._last_pv_production_kwh,
+            "last_grid_export_kwh": self._last_grid_export_kwh,
+            "last_grid_import_kwh": self._last_grid_import_kwh,
+            "last_electricity_price": self._last_known_electricity_price,
+            "last_feed_in_tariff": self._last_known_feed_in_tariff,
+            "rollup_written": self.rollups.written(),
+            "recovered_kwh": self._recovered_kwh,
+            "last_gap": self._last_gap,
+            "backfill": self._backfill,
+            "statistics_hour": self._statistics_hour,
+            "statistics_sums": self._statistics_sums,
         }
 
     def get_string_production_kwh(self, entity_id: str) -> float:
@@ -1361,7 +2344,7 @@ class PVManagementFixController:
         """Gibt die durchschnittliche Tagesproduktion eines PV-Strings zurück."""
         if not self._string_first_seen_date:
             return None
-        days = max(1, (date.today() - self._string_first_seen_date).days)
+        days = max(1, (self._today - self._string_first_seen_date).days)
         tracked = self._string_tracked_kwh.get(entity_id, 0.0)
         return tracked / days if tracked > 0 else None
 
@@ -1383,7 +2366,7 @@ class PVManagementFixController:
         """Durchschnittliche Tagesproduktion aller Strings zusammen."""
         if not self._string_first_seen_date or not self._string_tracked_kwh:
             return None
-        days = max(1, (date.today() - self._string_first_seen_date).days)
+        days = max(1, (self._today - self._string_first_seen_date).days)
         total = sum(self._string_tracked_kwh.values())
         return round(total / days, 2) if total > 0 else None
 
@@ -1401,7 +2384,7 @@ class PVManagementFixController:
         tracked = self._string_tracked_kwh.get(energy_entity_id, 0.0)
         if tracked <= 0 or self._string_first_seen_date is None:
             return None
-        days = max(1, (date.today() - self._string_first_seen_date).days)
+        days = max(1, (self._today - self._string_first_seen_date).days)
         annual = tracked / days * 365
         return round(annual / installed_kwp, 0)
 
@@ -1428,13 +2411,266 @@ class PVManagementFixController:
         total = sum(self._string_daily_peak_w.values())
         return round(total / 1000, 1) if total > 0 else None
 
+    # -------------------------------------------------------------------------
+    # Downtime-Recovery (Lücke zwischen letztem Checkpoint und Neustart)
+    # -------------------------------------------------------------------------
+
+    async def _async_prepare_gap_recovery(self) -> None:
+        """Setzt die Zähler-Basis auf den Checkpoint und ergänzt die Preis-Historie der Lücke."""
+        meters = self._checkpoint_meters
+        restored = False
+        for attr, key in (
+            ("_last_pv_production_kwh", "last_pv_production_kwh"),
+            ("_last_grid_export_kwh", "last_grid_export_kwh"),
+            ("_last_grid_import_kwh", "last_grid_import_kwh"),
+        ):
+            value = meters.get(key)
+            if value is not None:
+                setattr(self, attr, value)
+                restored = True
+        if not restored:
+            return  # Stand ohne Zählerstände (vor dem Checkpoint-Format)
+
+        start = self._checkpoint_time
+        self._gap_start = start
+        # Vor allen weiteren Schreibzugriffen (Nachtrag, Live-Updates) festhalten
+        self._gap_rollup_overlap = self._rollup_overlap()
+        self._gap_rollup_until = self.rollups.written_until
+        self._gap_deadline = dt_util.utcnow() + GAP_READY_TIMEOUT
+        # Preis zu Beginn der Lücke aus dem Checkpoint, Verlauf aus dem Recorder
+        for kind, price in self._checkpoint_prices.items():
+            if price is not None:
+                self._merge_price_samples(kind, [(start, price)])
+        await self._async_load_recorder_prices(start, dt_util.utcnow())
+
+    def _rollup_overlap(self) -> dict[str, float]:
+        """Deltas, die die Rollups seit dem Checkpoint bereits enthalten.
+
+        Die Rollups schreiben direkt in die gemappte Datei; nach einem harten Abbruch
+        enthalten sie daher auch Energie, die der Checkpoint nicht mehr gesehen hat.
+        """
+        ref = self._checkpoint_rollups
+        if ref is None:
+            return dict.fromkeys(HISTORY_CHANNELS, 0.0)
+        return {
+            channel: max(0.0, value - ref.get(channel, value))
+            for channel, value in self.rollups.written().items()
+        }
+
+    async def _async_load_recorder_prices(self, start: datetime, end: datetime) -> None:
+        """Ergänzt die Preis-Historie aus dem Recorder (nur wenn Recorder geladen)."""
+        entities = {
+            entity_id: kind
+            for kind, entity_id in (
+                (PRICE_KIND_ELECTRICITY, self.electricity_price_entity),
+                (PRICE_KIND_FEED_IN, self.feed_in_tariff_entity),
+            )
+            if entity_id
+        }
+        if not entities or "recorder" not in self.hass.config.components:
+            return
+        from homeassistant.components.recorder import get_instance, history
+
+        try:
+            states = await get_instance(self.hass).async_add_executor_job(
+                partial(
+                    history.get_significant_states,
+                    self.hass, start, end, list(entities),
+                    significant_changes_only=False, no_attributes=True,
+                )
+            )
+        except Exception as e:
+            _LOGGER.debug("Preis-Historie aus dem Recorder nicht verfügbar: %s", e)
+            return
+
+        for entity_id, kind in entities.items():
+            unit = self.electricity_price_unit if kind == PRICE_KIND_ELECTRICITY else self.feed_in_tariff_unit
+            samples = []
+            for state in states.get(entity_id, []):
+                try:
+                    raw = float(state.state)
+                except (ValueError, TypeError):
+                    continue
+                samples.append((state.last_changed, self._convert_price_to_eur(raw, unit, auto_detect=True)))
+            self._merge_price_samples(kind, samples)
+
+    def _merge_price_samples(self, kind: str, samples: list[tuple[datetime, float]]) -> None:
+        """Fügt Preis-Stützpunkte zeitlich sortiert in die Historie ein."""
+        if not samples:
+            return
+        merged = sorted({*self._price_history[kind], *samples}, key=lambda item: item[0])
+        self._price_history[kind] = deque(merged, maxlen=PRICE_HISTORY_MAXLEN)
+
+    def average_price(self, kind: str, start: datetime, end: datetime) -> float | None:
+        """Zeitgewichteter Preis in €/kWh über [start, end] (aus der Preis-Historie).
+
+        Vor dem ältesten bekannten Preis gilt dieser; None ohne jede Historie.
+        """
+        history = self._price_history[kind]
+        if not history:
+            return None
+        idx = bisect_right(history, start, key=lambda item: item[0])
+        price = history[idx - 1][1] if idx > 0 else history[0][1]
+        span = (end - start).total_seconds()
+        if span <= 0:
+            return price
+        weighted = 0.0
+        since = start
+        for when, value in islice(history, idx, None):
+            if when >= end:
+                break
+            weighted += (when - since).total_seconds() * price
+            since, price = when, value
+        weighted += (end - since).total_seconds() * price
+        return weighted / span
+
+    def _gap_meters_ready(self, pv: float, export: float, grid_import: float) -> bool:
+        """True wenn alle konfigurierten Kern-Zähler einen Wert geliefert haben (oder Timeout)."""
+        if self._gap_deadline is not None and dt_util.utcnow() >= self._gap_deadline:
+            return True
+        for entity_id, current, last in (
+            (self.pv_production_entity, pv, self._last_pv_production_kwh),
+            (self.grid_export_entity, export, self._last_grid_export_kwh),
+            (self.grid_import_entity, grid_import, self._last_grid_import_kwh),
+        ):
+            if entity_id and current <= 0 < (last or 0):
+                return False
+        return True
+
+    def _recover_gap(self, current_pv: float, current_export: float, current_import: float) -> None:
+        """Trägt die Zähler-Deltas der Downtime nach.
+
+        Das Sanity-Limit skaliert mit der Dauer der Lücke (MAX_RECOVERY_POWER_KW).
+        Bewertet wird mit dem zeitgewichteten Preis der Lücke; Historie und Rollups
+        verteilen die Deltas zeitanteilig auf die Intervalle der Lücke.
+        """
+        start, end = self._gap_start, dt_util.utcnow()
+        self._gap_start = None
+        max_delta = max(MAX_DELTA_KWH, MAX_RECOVERY_POWER_KW * (end - start).total_seconds() / 3600)
+
+        deltas = []
+        for label, current, last in (
+            ("PV", current_pv, self._last_pv_production_kwh),
+            ("Export", current_export, self._last_grid_export_kwh),
+            ("Import", current_import, self._last_grid_import_kwh),
+        ):
+            delta = current - last if last is not None else 0.0
+            if delta < 0 or delta > max_delta:
+                _LOGGER.warning(
+                    "Downtime-Recovery: %s-Delta %.2f kWh verworfen (Zählertausch/Sanity-Limit %.0f kWh)",
+                    label, delta, max_delta,
+                )
+                delta = 0.0
+            deltas.append(delta)
+        delta_pv, delta_export, delta_import = deltas
+        delta_self_consumption = max(0.0, delta_pv - delta_export)
+
+        self._last_pv_production_kwh = current_pv
+        self._last_grid_export_kwh = current_export
+        self._last_grid_import_kwh = current_import
+
+        recovered = delta_self_consumption + delta_export + delta_import
+        if recovered <= 0:
+            return
+
+        net_price = self.current_electricity_price
+        if self.electricity_price_entity:
+            net_price = self.average_price(PRICE_KIND_ELECTRICITY, start, end) or net_price
+        gross_price = net_price * self.markup_factor
+        tariff = self.current_feed_in_tariff
+        if self.feed_in_tariff_entity:
+            tariff = self.average_price(PRICE_KIND_FEED_IN, start, end) or tariff
+
+        # Der Teil, den die Rollups schon enthalten, wurde live bewertet; nur der Rest
+        # wird mit dem Preis der Lücke bewertet und in die Rollups nachgetragen
+        overlap, self._gap_rollup_overlap = self._gap_rollup_overlap, {}
+        rollup_deltas: dict[str, float] = {}
+        values: list[float] = []
+        for delta, kwh_channel, eur_channel, price in (
+            (delta_self_consumption, "self_consumption_kwh", "savings_eur", gross_price),
+            (delta_export, "feed_in_kwh", "earnings_eur", tariff),
+            (delta_import, "grid_import_kwh", "import_cost_eur", gross_price),
+        ):
+            done_kwh = overlap.get(kwh_channel, 0.0)
+            done = min(delta, done_kwh)
+            done_eur = overlap.get(eur_channel, 0.0) * done / done_kwh if done > 0 else 0.0
+            rest = delta - done
+            rollup_deltas[kwh_channel] = rest
+            rollup_deltas[eur_channel] = rest * price
+            values.append(done_eur + rest * price)
+        savings, earnings, import_cost = values
+
+        self._total_self_consumption_kwh += delta_self_consumption
+        self._total_feed_in_kwh += delta_export
+        self._accumulated_savings_self += savings
+        self._accumulated_earnings_feed += earnings
+        self._tracked_grid_import_kwh += delta_import
+        self._total_grid_import_cost += import_cost
+
+        # Historie: ganze Lücke; Rollups: nur der Rest ab ihrer Schreibmarke (zeitanteilig verteilt)
+        deltas = {
+            "self_consumption_kwh": delta_self_consumption,
+            "feed_in_kwh": delta_export,
+            "grid_import_kwh": delta_import,
+            "savings_eur": savings,
+            "earnings_eur": earnings,
+            "import_cost_eur": import_cost,
+        }
+        self.energy_history.add_spread(start.timestamp(), end.timestamp(), **deltas)
+        rollup_start = min(max(start.timestamp(), self._gap_rollup_until), end.timestamp())
+        self._rewind_statistics(hour_key(rollup_start))
+        self.rollups.add_spread(rollup_start, end.timestamp(), **rollup_deltas)
+
+        self._recovered_kwh += recovered
+        self._last_gap = {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "kwh": round(recovered, 3),
+            "eur": round(savings + earnings, 2),
+        }
+        _LOGGER.info(
+            "Downtime-Recovery %s – %s: %.2f kWh Eigenverbrauch, %.2f kWh Export, "
+            "%.2f kWh Import nachgetragen",
+            start, end, delta_self_consumption, delta_export, delta_import,
+        )
+        self._notify_entities({UPDATE_GROUP_ENERGY})
+        self._schedule_save()
+
+    @property
+    def recovered_kwh(self) -> float:
+        """Summe der nach Downtimes nachgetragenen Energie in kWh."""
+        return self._recovered_kwh
+
+    @property
+    def last_gap(self) -> dict[str, Any] | None:
+        """Details der zuletzt nachgetragenen Lücke (start, end, kwh, eur)."""
+        return self._last_gap
+
     def _process_energy_update(self) -> None:
         """Verarbeitet Energie-Updates INKREMENTELL."""
         current_pv = self._pv_production_kwh
         current_export = self._grid_export_kwh
         current_import = self._grid_import_kwh
 
-        if self._last_pv_production_kwh is None or self._last_grid_import_kwh is None:
+        if not self._ready:
+            # Frische Installation, PV war beim Start noch nicht verfügbar: erstes Sample
+            # legt Totals und Zähler-Basis fest
+            _LOGGER.info("Keine restored Daten, initialisiere von Sensoren")
+            self._initialize_from_sensors()
+            self._last_pv_production_kwh = current_pv
+            self._last_grid_export_kwh = current_export
+            self._last_grid_import_kwh = current_import
+            return
+
+        if self._gap_start is not None:
+            # Erstes Sample nach dem Start: Downtime seit dem Checkpoint nachtragen
+            if not self._gap_meters_ready(current_pv, current_export, current_import):
+                return  # Zähler noch nicht geliefert, Basis bleibt auf dem Checkpoint
+            self._recover_gap(current_pv, current_export, current_import)
+            return
+
+        if (self._last_pv_production_kwh is None or self._last_grid_export_kwh is None
+                or self._last_grid_import_kwh is None):
             self._last_pv_production_kwh = current_pv
             self._last_grid_export_kwh = current_export
             self._last_grid_import_kwh = current_import
@@ -1448,7 +2684,6 @@ class PVManagementFixController:
         delta_export = current_export - self._last_grid_export_kwh
         delta_import = current_import - self._last_grid_import_kwh
 
-        MAX_DELTA_KWH = 50.0
         if delta_pv > MAX_DELTA_KWH:
             self._last_pv_production_kwh = current_pv
             delta_pv = 0
@@ -1470,19 +2705,7 @@ class PVManagementFixController:
             delta_import = 0
 
         delta_self_consumption = max(0.0, delta_pv - delta_export)
-
-        # Tägliches Tracking: Reset bei Tageswechsel
-        today = date.today()
-        if self._daily_tracking_date != today:
-            self._daily_grid_import_cost = 0.0
-            self._daily_grid_import_kwh = 0.0
-            self._daily_feed_in_earnings = 0.0
-            self._daily_feed_in_kwh = 0.0
-            self._daily_tracking_date = today
-            # Quota: Zählerstand für Tagesbeginn merken
-            if self._grid_import_kwh > 0:
-                self._quota_day_start_meter = self._grid_import_kwh
-                self._quota_day_start_date = today
+        savings_delta = earnings_delta = import_cost = 0.0
 
         if delta_self_consumption > 0 or delta_export > 0:
             # Bei Fixpreis: Brutto-Preis für Ersparnis (netto × Aufschlagfaktor)
@@ -1496,8 +2719,6 @@ class PVManagementFixController:
             self._total_feed_in_kwh += delta_export
             self._accumulated_savings_self += savings_delta
             self._accumulated_earnings_feed += earnings_delta
-            self._daily_feed_in_earnings += earnings_delta
-            self._daily_feed_in_kwh += delta_export
 
         # Strompreis-Tracking
         if delta_import > 0:
@@ -1506,29 +2727,38 @@ class PVManagementFixController:
             self._tracked_grid_import_kwh += delta_import
             self._total_grid_import_cost += import_cost
 
-            self._daily_grid_import_kwh += delta_import
-            self._daily_grid_import_cost += import_cost
-
-            current_month = today.month
-            if self._monthly_tracking_month != current_month:
-                self._monthly_grid_import_cost = 0.0
-                self._monthly_grid_import_kwh = 0.0
-                self._monthly_tracking_month = current_month
-            self._monthly_grid_import_kwh += delta_import
-            self._monthly_grid_import_cost += import_cost
+        if delta_self_consumption > 0 or delta_export > 0 or delta_import > 0:
+            # Historie und Rollups (Tages-/Monatswerte der Sensoren)
+            now = time.time()
+            deltas = {
+                "self_consumption_kwh": delta_self_consumption,
+                "feed_in_kwh": delta_export,
+                "grid_import_kwh": delta_import,
+                "savings_eur": savings_delta,
+                "earnings_eur": earnings_delta,
+                "import_cost_eur": import_cost,
+            }
+            self.energy_history.add(now, **deltas)
+            self.rollups.add(now, **deltas)
 
         self._last_pv_production_kwh = current_pv
         self._last_grid_export_kwh = current_export
         self._last_grid_import_kwh = current_import
-        self._notify_entities()
+        # Meilensteine sofort sichtbar machen, sonst gebündelt
+        self._notify_entities({UPDATE_GROUP_ENERGY}, immediate=self._milestone_due())
 
     @callback
     def _on_state_changed(self, event: Event) -> None:
-        """Handler für Zustandsänderungen der überwachten Entities."""
-        entity_id = event.data.get("entity_id")
-        new_state = event.data.get("new_state")
+        """Handler für Zustandsänderungen der überwachten Entities (ein Dict-Lookup pro Event)."""
+        route = self._dispatch.get(event.data.get("entity_id"))
+        if route is None:
+            return
 
+        new_state = event.data.get("new_state")
         if not new_state or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            if route[0] == self._handle_price:
+                # Letzter bekannter Preis bleibt, nur Verfügbarkeit merken
+                self._set_price(route[1], None)
             return
 
         try:
@@ -1537,68 +2767,259 @@ class PVManagementFixController:
             return
 
         if self._first_seen_date is None:
-            self._first_seen_date = date.today()
-
-        changed = False
-
-        if entity_id == self.pv_production_entity:
-            self._pv_production_kwh = value
-            changed = True
-        elif entity_id == self.grid_export_entity:
-            self._grid_export_kwh = value
-            changed = True
-        elif entity_id == self.grid_import_entity:
-            self._grid_import_kwh = value
-            changed = True
-        elif entity_id == self.consumption_entity:
-            self._consumption_kwh = value
-        elif entity_id in (self.battery_soc_entity, self.battery_charge_entity, self.battery_discharge_entity):
-            self._notify_entities()
-        elif entity_id == self.benchmark_heatpump_entity:
-            # Unit-Konvertierung: Wh → kWh falls nötig
-            state_obj = self.hass.states.get(entity_id)
-            uom = state_obj.attributes.get("unit_of_measurement", "") if state_obj else ""
-            if uom in ("Wh", "wh"):
-                value = value / 1000
-            if self._wp_first_seen_date is None:
-                self._wp_first_seen_date = date.today()
-            if self._last_wp_kwh is not None and value >= self._last_wp_kwh:
-                delta = value - self._last_wp_kwh
-                # Sanity check: max 200 kWh pro Update (verhindert Absolutwert als Delta)
-                if delta < 200:
-                    self._tracked_wp_kwh += delta
-            self._last_wp_kwh = value
-            self._notify_entities()
-
-        # PV-Strings (Delta-Tracking)
-        elif entity_id in self._string_entity_ids:
-            if self._string_first_seen_date is None:
-                self._string_first_seen_date = date.today()
-            last = self._string_last_kwh.get(entity_id)
-            if last is not None and value >= last:
-                self._string_tracked_kwh[entity_id] = (
-                    self._string_tracked_kwh.get(entity_id, 0.0) + (value - last)
-                )
-            self._string_last_kwh[entity_id] = value
-            self._notify_entities()
-
-        # PV-String Power Peak-Tracking
-        elif entity_id in self._string_power_entity_ids:
-            current_peak = self._string_peak_w.get(entity_id, 0.0)
-            if value > current_peak:
-                self._string_peak_w[entity_id] = value
-            # Daily Peak: bei neuem Tag resetten
-            today = date.today()
-            if self._string_daily_peak_date != today:
-                self._string_daily_peak_w = {}
-                self._string_daily_peak_date = today
-            daily_peak = self._string_daily_peak_w.get(entity_id, 0.0)
-            if value > daily_peak:
-                self._string_daily_peak_w[entity_id] = value
-            self._notify_entities()
-
-        if changed:
+            self._first_seen_date = self._today
+
+        entity_id = new_state.entity_id
+        if entity_id in self._inline_entity_ids:
+            handler, slot = route
+            handler(slot, value, new_state)
+            return
+        self._ingest(entity_id, value, new_state)
+
+    # -------------------------------------------------------------------------
+    # Ingest-Stufe (Puffer zwischen Event-Callback und Verarbeitung)
+    # -------------------------------------------------------------------------
+
+    def _ingest(self, entity_id: str, value: float, new_state: State) -> None:
+        """Puffert den neuesten Wert einer Entity und plant den nächsten Drain.
+
+        Kumulative Zähler brauchen nur den jüngsten Stand: ein noch nicht
+        verarbeiteter Wert derselben Entity wird überschrieben (collapsed).
+        Gedraint wird nach sample_window oder sofort, sobald alle Kern-Zähler
+        (PV/Export/Import) einen neuen Wert geliefert haben.
+        """
+        stats = self.ingest_stats
+        stats["received"] += 1
+        if entity_id in self._ingest_buffer:
+            stats["collapsed"] += 1
+        self._ingest_buffer[entity_id] = (value, new_state)
+
+        if self.sample_window <= 0 or (
+            self._core_meter_entity_ids and self._core_meter_entity_ids <= self._ingest_buffer.keys()
+        ):
+            self._drain_ingest()
+        elif self._unsub_drain is None:
+            self._unsub_drain = async_call_later(
+                self.hass, self.sample_window, self._scheduled_drain
+            )
+
+    @callback
+    def _scheduled_drain(self, _now: datetime) -> None:
+        """Timer-Callback: Ingest-Fenster abgelaufen."""
+        self._unsub_drain = None
+        self._drain_ingest()
+
+    def _drain_ingest(self) -> None:
+        """Verarbeitet alle gepufferten Werte; Zählerstände als ein gemeinsames Sample."""
+        self._cancel_drain()
+        buffer = self._ingest_buffer
+        if not buffer:
+            return
+        self._ingest_buffer = {}
+        self.ingest_stats["processed"] += len(buffer)
+        dispatch = self._dispatch
+        for entity_id, (value, new_state) in buffer.items():
+            route = dispatch.get(entity_id)
+            if route is None:
+                continue  # Entity wurde zwischenzeitlich aus den Optionen entfernt
+            handler, slot = route
+            handler(slot, value, new_state)
+        if self._pending_meter_slots:
+            self._pending_meter_slots.clear()
             self._process_energy_update()
+            # Checkpoint direkt nach der Verarbeitung planen (Delta-Trigger ohne Flush-Verzug)
+            self._schedule_save()
+
+    def _cancel_drain(self) -> None:
+        """Bricht einen geplanten Drain ab."""
+        if self._unsub_drain is not None:
+            self._unsub_drain()
+            self._unsub_drain = None
+
+    # -------------------------------------------------------------------------
+    # Entity-Handler (über die Dispatch-Tabelle vorgebunden)
+    # -------------------------------------------------------------------------
+
+    def _handle_meter(self, slot: str, value: float, _state: State) -> None:
+        """PV-/Export-/Import-Zähler: Wert setzen, Verarbeitung am Ende des Drains.
+
+        Alle Kern-Zähler eines Drains werden gemeinsam verarbeitet, damit
+        Eigenverbrauch (PV - Export) aus einem konsistenten Snapshot berechnet wird.
+        """
+        setattr(self, slot, value)
+        self._pending_meter_slots.add(slot)
+
+    def _handle_consumption(self, slot: str, value: float, _state: State) -> None:
+        """Hausverbrauch: nur merken (fließt beim nächsten Zähler-Update ein)."""
+        setattr(self, slot, value)
+
+    def _handle_battery(self, _slot: None, _value: float, _state: State) -> None:
+        """Batterie-Sensoren: Werte werden live gelesen, nur Anzeige aktualisieren."""
+        self._notify_entities({UPDATE_GROUP_BATTERY})
+
+    def _handle_price(self, kind: str, value: float, _state: State) -> None:
+        """Preis-/Tarif-Sensoren: Wert einmal parsen und cachen."""
+        self._set_price(kind, value)
+        self._notify_entities({UPDATE_GROUP_PRICES})
+
+    def _handle_heatpump(self, _slot: None, value: float, state: State) -> None:
+        """Wärmepumpe: Delta-Tracking des Verbrauchszählers."""
+        # Unit-Konvertierung: Wh → kWh falls nötig
+        uom = state.attributes.get("unit_of_measurement", "")
+        if uom in ("Wh", "wh"):
+            value = value / 1000
+        if self._wp_first_seen_date is None:
+            self._wp_first_seen_date = self._today
+        if self._last_wp_kwh is not None and value >= self._last_wp_kwh:
+            delta = value - self._last_wp_kwh
+            # Sanity check: max 200 kWh pro Update (verhindert Absolutwert als Delta)
+            if delta < 200:
+                self._tracked_wp_kwh += delta
+        self._last_wp_kwh = value
+        self._notify_entities({UPDATE_GROUP_HEATPUMP})
+
+    def _handle_string_energy(self, entity_id: str, value: float, _state: State) -> None:
+        """PV-String Energiezähler (Delta-Tracking)."""
+        if self._string_first_seen_date is None:
+            self._string_first_seen_date = self._today
+        last = self._string_last_kwh.get(entity_id)
+        if last is not None and value >= last:
+            self._string_tracked_kwh[entity_id] = (
+                self._string_tracked_kwh.get(entity_id, 0.0) + (value - last)
+            )
+        self._string_last_kwh[entity_id] = value
+        self._notify_entities({UPDATE_GROUP_STRINGS})
+
+    def _handle_string_power(self, entity_id: str, value: float, _state: State) -> None:
+        """PV-String Leistung (Peak-Tracking)."""
+        current_peak = self._string_peak_w.get(entity_id, 0.0)
+        if value > current_peak:
+            self._string_peak_w[entity_id] = value
+        # Daily Peak (Reset um Mitternacht in _roll_date)
+        daily_peak = self._string_daily_peak_w.get(entity_id, 0.0)
+        if value > daily_peak:
+            self._string_daily_peak_w[entity_id] = value
+        self._notify_entities({UPDATE_GROUP_STRING_POWER})
+
+    # -------------------------------------------------------------------------
+    # Externe Langzeit-Statistiken (Recorder)
+    # -------------------------------------------------------------------------
+
+    @callback
+    def _on_hour_boundary(self, _now: datetime) -> None:
+        """Zeit-Trigger kurz nach jeder vollen Stunde."""
+        self._publish_statistics()
+
+    @callback
+    def _publish_statistics(self) -> None:
+        """Überträgt alle abgeschlossenen Stunden der Rollups als externe Statistiken.
+
+        Je Kanal ein Aufruf mit allen Stunden seit der letzten Übertragung (normal
+        eine, nach Downtime oder Nachtrag entsprechend mehr). Die Summe läuft ab der
+        ersten Stunde der Rollups; leere Stunden werden mit 0 geschrieben.
+        """
+        if "recorder" not in self.hass.config.components:
+            return
+        last = hour_key(time.time()) - 1
+        cursor = self._statistics_hour
+        if cursor is None:
+            origin = self.rollups.origin_day
+            if origin is None:
+                return
+            cursor = hour_key(dt_util.start_of_local_day(date.fromordinal(origin)).timestamp()) - 1
+        first = max(cursor + 1, last - ROLLUP_HOURS + 1)
+        if first > last:
+            return
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        rows: dict[str, list[dict[str, Any]]] = {channel: [] for channel in STATISTICS_CHANNELS}
+        sums = self._statistics_sums
+        for hour in range(first, last + 1):
+            record = self.rollups.get(PERIOD_HOUR, hour)
+            start = dt_util.utc_from_timestamp(hour * 3600)
+            for channel, channel_rows in rows.items():
+                sums[channel] = sums.get(channel, 0.0) + (record[channel] if record else 0.0)
+                channel_rows.append({"start": start, "sum": sums[channel]})
+        for channel, (suffix, name, unit) in STATISTICS_CHANNELS.items():
+            async_add_external_statistics(
+                self.hass,
+                {
+                    "has_mean": False,
+                    "has_sum": True,
+                    "name": f"{self.entry.data.get(CONF_NAME, DEFAULT_NAME)} {name}",
+                    "source": DOMAIN,
+                    "statistic_id": f"{self._statistics_prefix}_{suffix}",
+                    "unit_of_measurement": unit or self.hass.config.currency,
+                },
+                rows[channel],
+            )
+        self._statistics_hour = last
+        self._schedule_save()
+
+    def _rewind_statistics(self, hour: int) -> None:
+        """Setzt die Übertragung vor hour zurück (die Stunden ab hour werden sich ändern).
+
+        Muss vor dem Ändern der Stunden-Rollups aufgerufen werden: die Summen werden
+        um die bisher übertragenen Werte dieser Stunden reduziert.
+        """
+        cursor = self._statistics_hour
+        if cursor is None or cursor < hour:
+            return
+        for past in range(hour, cursor + 1):
+            record = self.rollups.get(PERIOD_HOUR, past)
+            if record:
+                for channel in STATISTICS_CHANNELS:
+                    self._statistics_sums[channel] = self._statistics_sums.get(channel, 0.0) - record[channel]
+        self._statistics_hour = hour - 1
+
+    def _reset_statistics(self) -> None:
+        """Überträgt beim nächsten Mal alle Stunden der Rollups neu (Summen ab 0)."""
+        self._statistics_hour = None
+        self._statistics_sums = {}
+
+    # -------------------------------------------------------------------------
+    # Uhr: Tages-/Monatswechsel
+    # -------------------------------------------------------------------------
+
+    @callback
+    def _on_midnight(self, now: datetime) -> None:
+        """Zeit-Trigger um 00:00:00 Ortszeit."""
+        self._roll_date(dt_util.as_local(now).date())
+
+    def _roll_date(self, today: date) -> None:
+        """Schaltet das gecachte Datum weiter und führt fällige Rollover aus.
+
+        Wird um Mitternacht und einmal beim Start aufgerufen; so passiert der
+        Wechsel auch ohne eingehende Zähler-Events deterministisch.
+        """
+        self._today = today
+        rolled = False
+        if self._daily_tracking_date != today:
+            self._roll_day(today)
+            rolled = True
+        if self._monthly_tracking_month != today.month:
+            self._roll_month(today)
+            rolled = True
+        if self._string_daily_peak_date != today:
+            self._string_daily_peak_w = {}
+            self._string_daily_peak_date = today
+            rolled = True
+        if rolled:
+            # Tagesdurchschnitte aller Gruppen ändern sich (inkl. Tages-Tier)
+            self._notify_entities(immediate=True)
+
+    def _roll_day(self, today: date) -> None:
+        """Tageswechsel: Quota-Tagesbeginn merken (Tageswerte beginnen mit dem neuen Rollup)."""
+        self._daily_tracking_date = today
+        if self._grid_import_kwh > 0:
+            self._quota_day_start_meter = self._grid_import_kwh
+            self._quota_day_start_date = today
+
+    def _roll_month(self, today: date) -> None:
+        """Monatswechsel: Zusammenfassung des Vormonats senden."""
+        if self._monthly_tracking_month is not None:
+            self._check_monthly_summary()
+        self._monthly_tracking_month = today.month
 
     async def async_start(self) -> None:
         """Startet das Tracking."""
@@ -1620,13 +3041,64 @@ class PVManagementFixController:
         self._last_pv_production_kwh = self._pv_production_kwh
         self._last_grid_export_kwh = self._grid_export_kwh
         self._last_grid_import_kwh = self._grid_import_kwh
+        # Basis auf den Checkpoint legen, damit die Downtime nachgetragen wird
+        if self._checkpoint_time is not None:
+            await self._async_prepare_gap_recovery()
 
+        # Versuche zuerst vom Helper zu restoren (falls konfiguriert). Vor der Downtime-
+        # Recovery: der Helper zeigt den Stand beim Herunterfahren, der Offset darf die
+        # nachgetragene Ersparnis nicht schlucken
+        if self.restore_from_helper and self.amortisation_helper:
+            restored = await self._restore_from_helper()
+            if restored:
+                _LOGGER.info("Amortisation erfolgreich von Helper wiederhergestellt")
+
+        # Uhr: Rollover um Mitternacht (Ortszeit), fällige Rollover jetzt nachholen
+        self._remove_listeners.append(
+            async_track_time_change(self.hass, self._on_midnight, hour=0, minute=0, second=0)
+        )
+        # Externe Statistiken: abgeschlossene Stunde kurz nach dem Stundenwechsel übertragen
+        self._remove_listeners.append(
+            async_track_time_change(self.hass, self._on_hour_boundary, minute=0, second=10)
+        )
+        self._roll_date(dt_util.now().date())
+        # Lücke nach dem Tageswechsel verteilen (Zähler ggf. schon verfügbar)
+        if self._gap_start is not None:
+            self._process_energy_update()
+
+        # Optionale Features (Quota, WP, PV-Strings, Benchmark) initialisieren
+        self._init_features()
+
+        # Frische Installation: Totals aus den Sensoren übernehmen, sobald PV einen Wert liefert
+        if not self._ready and self._pv_production_kwh > 0:
+            _LOGGER.info("Keine restored Daten, initialisiere von Sensoren")
+            self._initialize_from_sensors()
+
+        # Helper beim Herunterfahren von HA noch einmal schreiben
+        self._unsub_hass_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_on_hass_stop
+        )
+
+        # Nur die konfigurierten Entities abonnieren (statt globalem EVENT_STATE_CHANGED)
+        self._started = True
+        self._update_state_subscription()
+        self._start_periodic_refresh()
+        # Offenen Statistik-Nachtrag (Erstinstallation) starten bzw. fortsetzen
+        self._start_backfill()
+
+        self._notify_entities(immediate=True)
+
+    def _init_features(self) -> None:
+        """Initialisiert die optionalen Features (Start und Options-Änderung am laufenden Controller).
+
+        Idempotent: bereits erfasste Zählerstände und Snapshots bleiben erhalten.
+        """
         # Quota: Auto-Capture Zählerstand nur wenn 0 eingetragen
         # Erst am/nach Startdatum erfassen, damit kein Verbrauch von vor der Periode mitgezählt wird
         # Wenn der User einen Wert > 0 manuell eingetragen hat, wird dieser NICHT überschrieben
         quota_start = self.quota_start_date
         if (self.quota_enabled and self.quota_start_meter == 0 and self._grid_import_kwh > 0
-                and quota_start is not None and date.today() >= quota_start):
+                and quota_start is not None and self._today >= quota_start):
             self.quota_start_meter = self._grid_import_kwh
             _LOGGER.info(
                 "Quota: Zählerstand automatisch erfasst: %.2f kWh",
@@ -1637,12 +3109,12 @@ class PVManagementFixController:
 
         # Quota: Tages-Zählerstand initialisieren
         if self._grid_import_kwh > 0:
-            if self._quota_day_start_date != date.today():
+            if self._quota_day_start_date != self._today:
                 self._quota_day_start_meter = self._grid_import_kwh
-            self._quota_day_start_date = date.today()
+            self._quota_day_start_date = self._today
 
         # WP-Sensor initialisieren (last-Wert + first_seen_date)
-        if self.benchmark_heatpump_entity:
+        if self.benchmark_heatpump_entity and self._last_wp_kwh is None:
             state = self.hass.states.get(self.benchmark_heatpump_entity)
             if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
                 try:
@@ -1652,14 +3124,15 @@ class PVManagementFixController:
                         val = val / 1000
                     self._last_wp_kwh = val
                     if self._wp_first_seen_date is None:
-                        self._wp_first_seen_date = date.today()
+                        self._wp_first_seen_date = self._today
                 except (ValueError, TypeError):
                     pass
 
         # PV-Strings initialisieren
         for _, entity_id, power_entity, _ in self.pv_strings:
             state = self.hass.states.get(entity_id)
-            if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            if (entity_id not in self._string_last_kwh and state
+                    and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)):
                 try:
                     self._string_last_kwh[entity_id] = float(state.state)
                 except (ValueError, TypeError):
@@ -1675,11 +3148,11 @@ class PVManagementFixController:
                     except (ValueError, TypeError):
                         pass
         if self.pv_strings and self._string_first_seen_date is None:
-            self._string_first_seen_date = date.today()
+            self._string_first_seen_date = self._today
 
         # Benchmark-Snapshot auto-initialisieren (frischer Start)
         if self.benchmark_enabled and self._benchmark_start_date is None:
-            self._benchmark_start_date = date.today()
+            self._benchmark_start_date = self._today
             self._benchmark_start_self_consumption = self._total_self_consumption_kwh
             self._benchmark_start_grid_import = self._tracked_grid_import_kwh
             self._benchmark_start_feed_in = self._total_feed_in_kwh
@@ -1691,38 +3164,45 @@ class PVManagementFixController:
                 self._benchmark_start_feed_in,
             )
 
-        # Versuche zuerst vom Helper zu restoren (falls konfiguriert)
-        if self.restore_from_helper and self.amortisation_helper:
-            restored = await self._restore_from_helper()
-            if restored:
-                _LOGGER.info("Amortisation erfolgreich von Helper wiederhergestellt")
-
-        @callback
-        def delayed_init_check(_now: datetime) -> None:
-            if not self._restored and self._total_self_consumption_kwh == 0:
-                _LOGGER.info("Keine restored Daten, initialisiere von Sensoren")
-                self._initialize_from_sensors()
-
-        from homeassistant.helpers.event import async_call_later
-        async_call_later(self.hass, 60.0, delayed_init_check)
-
-        @callback
-        def state_listener(event: Event):
-            self._on_state_changed(event)
-
-        self._remove_listeners.append(
-            self.hass.bus.async_listen(EVENT_STATE_CHANGED, state_listener)
-        )
-
-        self._notify_entities()
-
     async def async_stop(self) -> None:
         """Stoppt das Tracking."""
+        self._started = False
+        # Gepufferte Werte noch übernehmen, damit keine Deltas verloren gehen
+        self._drain_ingest()
+        self._cancel_scheduled_flush()
+        self._cancel_periodic_refresh()
+        self._cancel_backfill()
+        await self.async_save_state()
+        self.rollups.close()
+        if self._unsub_hass_stop is not None:
+            self._unsub_hass_stop()
+            self._unsub_hass_stop = None
+        await self._async_final_helper_sync()
+        if self._unsub_state_changes is not None:
+            self._unsub_state_changes()
+            self._unsub_state_changes = None
+        self._subscribed_entity_ids = frozenset()
         for remove in self._remove_listeners:
             remove()
         self._remove_listeners.clear()
         self._entity_listeners.clear()
 
+    def reset_amortisation_tracking(self) -> None:
+        """Initialisiert die Amortisation neu aus den Sensoren (Reset via Settings)."""
+        self._total_self_consumption_kwh = 0.0
+        self._total_feed_in_kwh = 0.0
+        self._accumulated_savings_self = 0.0
+        self._accumulated_earnings_feed = 0.0
+        self._first_seen_date = None
+        self._initialize_from_sensors()
+        # Ab hier gezählt; ältere Tage fließen beim Tarif-Replay nicht mehr ein
+        since = time.time()
+        self._tracked_since["savings"] = since
+        self._tracked_since["earnings"] = since
+        self._last_pv_production_kwh = self._pv_production_kwh
+        self._last_grid_export_kwh = self._grid_export_kwh
+        self._notify_entities(immediate=True)
+
     def reset_grid_import_tracking(self) -> None:
         """Setzt das Strompreis-Tracking auf 0 zurück."""
         _LOGGER.info(
@@ -1731,12 +3211,82 @@ class PVManagementFixController:
         )
         self._tracked_grid_import_kwh = 0.0
         self._total_grid_import_cost = 0.0
-        self._daily_grid_import_kwh = 0.0
-        self._daily_grid_import_cost = 0.0
-        self._monthly_grid_import_kwh = 0.0
-        self._monthly_grid_import_cost = 0.0
+        self._tracked_since["import_cost"] = time.time()
+        self.rollups.clear(PERIOD_DAY, day_key(self._today), "grid_import_kwh", "import_cost_eur")
+        self.rollups.clear(PERIOD_MONTH, month_key(self._today), "grid_import_kwh", "import_cost_eur")
         self._last_grid_import_kwh = self._grid_import_kwh
-        self._notify_entities()
+        self._notify_entities(immediate=True)
+
+    def prepare_tariff_replay(self, periods: list[dict[str, Any]] | None = None) -> list[TariffPeriod]:
+        """Prüft die Perioden des Service replay_tariff, ohne etwas zu ändern.
+
+        periods: je Periode start/end (Datum, end exklusiv), fixed_price (ct/kWh netto),
+        markup_factor und feed_in_tariff (konfigurierte Einheit). Ohne Perioden gelten
+        die aktuellen statischen Preise für den ganzen Zeitraum.
+        """
+        if self._backfill_task is not None:
+            raise HomeAssistantError("Tarif-Replay nicht möglich, solange der Nachtrag läuft")
+        tariffs = [self._tariff_period(period) for period in periods] if periods else [self._current_tariff_period()]
+        if all(t.gross_price is None and t.feed_in_tariff is None for t in tariffs):
+            raise HomeAssistantError("Tarif-Replay: keine Preise angegeben (dynamische Preise ohne fixed_price/feed_in_tariff)")
+        try:
+            return validate_periods(tariffs)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    def replay_tariff(self, tariffs: list[TariffPeriod], dry_run: bool = False) -> dict[str, Any]:
+        """Bewertet die gespeicherten Rollups mit geprüften Perioden neu (prepare_tariff_replay).
+
+        Die Differenzen ab dem letzten Reset je Akkumulator fließen in die Akkumulatoren;
+        der Sockel der Erstinstallation ausserhalb der Rollups bleibt unverändert.
+        """
+        result = replay_tariffs(
+            self.rollups, tariffs, None if dry_run else self.energy_history,
+            apply=not dry_run, since=self._tracked_since,
+        )
+        result["dry_run"] = dry_run
+        if dry_run:
+            return result
+
+        _LOGGER.info(
+            "Tarif-Replay: %d Tage neu bewertet (Ersparnis %+.2f €, Einspeisung %+.2f €, Netzbezug %+.2f €)",
+            result["days"], result["savings_delta"], result["earnings_delta"], result["import_cost_delta"],
+        )
+        self._accumulated_savings_self += result["savings_delta"]
+        self._accumulated_earnings_feed += result["earnings_delta"]
+        self._total_grid_import_cost += result["import_cost_delta"]
+        self._reset_statistics()
+        self._publish_statistics()
+        self._notify_entities(immediate=True)
+        return result
+
+    def _tariff_period(self, data: dict[str, Any]) -> TariffPeriod:
+        """Service-Daten einer Periode → TariffPeriod in €/kWh (Brutto-Strompreis)."""
+        fixed_price = data.get("fixed_price")
+        feed_in_tariff = data.get("feed_in_tariff")
+        if fixed_price is None and "markup_factor" in data:
+            # Nur der Aufschlag korrigiert: gilt für den konfigurierten Fixpreis
+            if self.electricity_price_entity:
+                raise HomeAssistantError(
+                    "Tarif-Replay: markup_factor ohne fixed_price ist bei dynamischem Strompreis nicht möglich"
+                )
+            fixed_price = self.fixed_price * 100.0
+        return TariffPeriod(
+            data.get("start"),
+            data.get("end"),
+            None if fixed_price is None else fixed_price / 100.0 * data.get("markup_factor", self.markup_factor),
+            None if feed_in_tariff is None
+            else self._convert_price_to_eur(feed_in_tariff, self.feed_in_tariff_unit, auto_detect=False),
+        )
+
+    def _current_tariff_period(self) -> TariffPeriod:
+        """Aktuelle statische Preise für den ganzen Zeitraum (Sensor-Preise bleiben unverändert)."""
+        return TariffPeriod(
+            None,
+            None,
+            None if self.electricity_price_entity else self.fixed_price * self.markup_factor,
+            None if self.feed_in_tariff_entity else self._static_feed_in_tariff_eur,
+        )
 
     def reset_benchmark_tracking(self) -> None:
         """Setzt Benchmark/WP-Tracking zurück — Snapshot der aktuellen Werte."""
@@ -1746,11 +3296,11 @@ class PVManagementFixController:
         self._wp_first_seen_date = None
         self._last_wp_kwh = None
         # Benchmark-Startpunkt auf jetzt setzen
-        self._benchmark_start_date = date.today()
+        self._benchmark_start_date = self._today
         self._benchmark_start_self_consumption = self._total_self_consumption_kwh
         self._benchmark_start_grid_import = self._tracked_grid_import_kwh
         self._benchmark_start_feed_in = self._total_feed_in_kwh
-        self._notify_entities()
+        self._notify_entities(immediate=True)
 
     def reset_pv_strings_tracking(self) -> None:
         """Setzt PV-String-Tracking und Peaks zurück."""
@@ -1761,7 +3311,7 @@ class PVManagementFixController:
         self._string_peak_w.clear()
         self._string_daily_peak_w.clear()
         self._string_daily_peak_date = None
-        self._notify_entities()
+        self._notify_entities(immediate=True)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -1769,9 +3319,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     ctrl = PVManagementFixController(hass, entry)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {DATA_CTRL: ctrl}
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Zustand laden und Controller starten, bevor die Sensoren angelegt werden:
+    # der erste State-Write jeder Entity enthält bereits die korrekten Werte
+    await ctrl.async_load_state()
     await ctrl.async_start()
 
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     async def handle_reset_grid_import(call):
         """Handle reset_grid_import service call."""
         for entry_data in hass.data.get(DOMAIN, {}).values():
@@ -1782,6 +3336,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not hass.services.has_service(DOMAIN, "reset_grid_import"):
         hass.services.async_register(DOMAIN, "reset_grid_import", handle_reset_grid_import)
 
+    async def handle_replay_tariff(call: ServiceCall) -> dict[str, Any]:
+        """Handle replay_tariff service call."""
+        prepared = {}
+        for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
+            controller = entry_data.get(DATA_CTRL)
+            if controller:
+                # Erst alle Einträge prüfen, damit ein Fehler keinen halb angewendeten Replay hinterlässt
+                prepared[entry_id] = (controller, controller.prepare_tariff_replay(call.data.get("periods")))
+        return {
+            entry_id: controller.replay_tariff(tariffs, call.data["dry_run"])
+            for entry_id, (controller, tariffs) in prepared.items()
+        }
+
+    if not hass.services.has_service(DOMAIN, "replay_tariff"):
+        hass.services.async_register(
+            DOMAIN, "replay_tariff", handle_replay_tariff,
+            schema=REPLAY_TARIFF_SCHEMA, supports_response=SupportsResponse.OPTIONAL,
+        )
+
     entry.add_update_listener(_async_update_listener)
     return True
 
@@ -1803,42 +3376,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Entfernt den gespeicherten Zustand, wenn die Integration gelöscht wird."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
+    rollup_path = hass.config.path(".storage", f"{STORAGE_KEY}.{entry.entry_id}.{ROLLUP_FILE_SUFFIX}")
+    with suppress(FileNotFoundError):
+        await hass.async_add_executor_job(os.remove, rollup_path)
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handler für Options-Updates. Reload bei strukturellen Änderungen."""
-    try:
-        if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-            ctrl = hass.data[DOMAIN][entry.entry_id].get(DATA_CTRL)
-            if ctrl:
-                old_quota = ctrl.quota_enabled
-                old_batt_soc = ctrl.battery_soc_entity
-                old_batt_charge = ctrl.battery_charge_entity
-                old_batt_discharge = ctrl.battery_discharge_entity
-                old_benchmark = ctrl.benchmark_enabled
-                old_benchmark_hp = ctrl.benchmark_heatpump
-
-                opts = {**entry.data, **entry.options}
-                new_quota = opts.get(CONF_QUOTA_ENABLED, DEFAULT_QUOTA_ENABLED)
-                new_batt_soc = opts.get(CONF_BATTERY_SOC_ENTITY)
-                new_batt_charge = opts.get(CONF_BATTERY_CHARGE_ENTITY)
-                new_batt_discharge = opts.get(CONF_BATTERY_DISCHARGE_ENTITY)
-                new_benchmark = opts.get(CONF_BENCHMARK_ENABLED, DEFAULT_BENCHMARK_ENABLED)
-                new_benchmark_hp = opts.get(CONF_BENCHMARK_HEATPUMP, DEFAULT_BENCHMARK_HEATPUMP)
-
-                needs_reload = (
-                    old_quota != new_quota
-                    or old_batt_soc != new_batt_soc
-                    or old_batt_charge != new_batt_charge
-                    or old_batt_discharge != new_batt_discharge
-                    or old_benchmark != new_benchmark
-                    or old_benchmark_hp != new_benchmark_hp
-                )
+    """Handler für Options-Updates: am laufenden Controller übernehmen (kein Reload).
 
-                if needs_reload:
-                    _LOGGER.info("Strukturelle Änderung erkannt, Reload wird ausgeführt")
-                    await hass.config_entries.async_reload(entry.entry_id)
-                else:
-                    ctrl._load_options()
-                    ctrl._notify_entities()
-                    _LOGGER.info("PV Management Fixpreis Optionen aktualisiert")
+    Optionale Sensor-Gruppen (Quota, Batterie, Benchmark, WP, PV-Strings) werden
+    vom Sensor-Gruppen-Manager hinzugefügt bzw. entfernt; die Akkumulatoren im
+    Speicher bleiben erhalten.
+    """
+    try:
+        entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        ctrl = entry_data.get(DATA_CTRL) if entry_data else None
+        if ctrl is None:
+            return
+        ctrl._load_options()
+        ctrl._init_features()
+        ctrl._start_periodic_refresh()
+        sensor_groups = entry_data.get(DATA_SENSOR_GROUPS)
+        if sensor_groups is not None:
+            await sensor_groups.async_refresh()
+        ctrl._notify_entities(immediate=True)
+        _LOGGER.info("PV Management Fixpreis Optionen aktualisiert")
     except Exception as e:
         _LOGGER.error("Fehler beim Aktualisieren der Optionen: %s", e)
@@ -0,0 +1,78 @@
+"""Nachtrag aus den Langzeit-Statistiken des Recorders (Erstinstallation).
+
+Bei einer frischen Installation übernimmt der Controller die Lebensdauer-Zählerstände
+und bewertet sie mit dem heutigen Preis. Der Nachtrag liest danach die stündlichen
+Statistiken der Zähler (und Preis-Sensoren) seitenweise und bewertet jede Stunde
+mit ihrem historischen Preis. Die Funktionen hier blockieren (Datenbank) und
+laufen im Recorder-Executor; übernommen wird im Event-Loop (siehe Controller).
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+# Zähler-Schlüssel der Ergebnisse
+METER_PV = "pv"
+METER_EXPORT = "export"
+METER_IMPORT = "import"
+
+_ENERGY_UNITS = {"energy": "kWh"}
+
+
+def _start_ts(row: dict[str, Any]) -> float:
+    """Beginn einer Statistik-Zeile als Unix-Zeit (ältere HA-Versionen liefern datetime)."""
+    start = row["start"]
+    return start.timestamp() if isinstance(start, datetime) else float(start)
+
+
+def first_statistics_start(
+    hass: HomeAssistant, meters: dict[str, str], end: datetime
+) -> datetime | None:
+    """Beginn des ältesten Monats mit Statistiken eines der Zähler vor end (blockierend)."""
+    from homeassistant.components.recorder.statistics import statistics_during_period
+
+    stats = statistics_during_period(
+        hass, dt_util.utc_from_timestamp(0), end, set(meters), "month", _ENERGY_UNITS, {"change"}
+    )
+    starts = [_start_ts(rows[0]) for rows in stats.values() if rows]
+    if not starts:
+        return None
+    return dt_util.utc_from_timestamp(min(starts))
+
+
+def read_hours(
+    hass: HomeAssistant,
+    meters: dict[str, str],
+    prices: dict[str, str],
+    start: datetime,
+    end: datetime,
+) -> tuple[dict[float, dict[str, float]], dict[str, dict[float, float]]]:
+    """Stündliche Zähler-Änderungen (kWh) und Preis-Mittelwerte (Rohwert) in [start, end) (blockierend).
+
+    meters/prices: Statistik-ID -> Schlüssel. Ergebnis: {Stundenbeginn: {Zähler: kWh}}
+    und {Preis-Schlüssel: {Stundenbeginn: Mittelwert}}.
+    """
+    from homeassistant.components.recorder.statistics import statistics_during_period
+
+    hours: dict[float, dict[str, float]] = {}
+    stats = statistics_during_period(hass, start, end, set(meters), "hour", _ENERGY_UNITS, {"change"})
+    for statistic_id, rows in stats.items():
+        key = meters[statistic_id]
+        for row in rows:
+            change = row.get("change")
+            if change is not None:
+                hours.setdefault(_start_ts(row), {})[key] = change
+
+    means: dict[str, dict[float, float]] = {key: {} for key in prices.values()}
+    if prices:
+        stats = statistics_during_period(hass, start, end, set(prices), "hour", None, {"mean"})
+        for statistic_id, rows in stats.items():
+            series = means[prices[statistic_id]]
+            for row in rows:
+                mean = row.get("mean")
+                if mean is not None:
+                    series[_start_ts(row)] = mean
+    return hours, means
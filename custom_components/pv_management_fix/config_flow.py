@@ -42,6 +42,14 @@ from .const import (
     CONF_PV_STRING_3_POWER, CONF_PV_STRING_4_POWER,
     CONF_PV_STRING_1_KWP, CONF_PV_STRING_2_KWP,
     CONF_PV_STRING_3_KWP, CONF_PV_STRING_4_KWP,
+    CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, RANGE_UPDATE_INTERVAL,
+    CONF_DEADBAND_EUR, CONF_DEADBAND_KWH, CONF_DEADBAND_PERCENT,
+    DEFAULT_DEADBAND_EUR, DEFAULT_DEADBAND_KWH, DEFAULT_DEADBAND_PERCENT,
+    RANGE_DEADBAND_EUR, RANGE_DEADBAND_KWH, RANGE_DEADBAND_PERCENT,
+    CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW, RANGE_SAMPLE_WINDOW,
+    CONF_CHECKPOINT_INTERVAL, DEFAULT_CHECKPOINT_INTERVAL, RANGE_CHECKPOINT_INTERVAL,
+    CONF_HELPER_SYNC_INTERVAL, DEFAULT_HELPER_SYNC_INTERVAL, RANGE_HELPER_SYNC_INTERVAL,
+    CONF_PERIODIC_INTERVAL, DEFAULT_PERIODIC_INTERVAL, RANGE_PERIODIC_INTERVAL,
 )
 
 
@@ -172,6 +180,7 @@ class PVManagementFixOptionsFlow(config_entries.OptionsFlow):
                 "battery": "Batterie",
                 "benchmark": "Energie-Benchmark",
                 "pv_strings": "PV-Strings",
+                "performance": "Performance",
                 "reset": "Zurücksetzen",
             },
         )
@@ -485,6 +494,97 @@ class PVManagementFixOptionsFlow(config_entries.OptionsFlow):
             data_schema=vol.Schema(schema)
         )
 
+    async def async_step_performance(self, user_input=None):
+        """Aktualisierungsintervall und Schreiblast konfigurieren."""
+        if user_input is not None:
+            return await self._save_and_return_to_menu(user_input)
+
+        return self.async_show_form(
+            step_id="performance",
+            data_schema=vol.Schema({
+                vol.Required(CONF_UPDATE_INTERVAL, default=self._get_val(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_UPDATE_INTERVAL["min"],
+                            max=RANGE_UPDATE_INTERVAL["max"],
+                            step=RANGE_UPDATE_INTERVAL["step"],
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                vol.Required(CONF_SAMPLE_WINDOW, default=self._get_val(CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_SAMPLE_WINDOW["min"],
+                            max=RANGE_SAMPLE_WINDOW["max"],
+                            step=RANGE_SAMPLE_WINDOW["step"],
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                vol.Required(CONF_CHECKPOINT_INTERVAL, default=self._get_val(CONF_CHECKPOINT_INTERVAL, DEFAULT_CHECKPOINT_INTERVAL)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_CHECKPOINT_INTERVAL["min"],
+                            max=RANGE_CHECKPOINT_INTERVAL["max"],
+                            step=RANGE_CHECKPOINT_INTERVAL["step"],
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                vol.Required(CONF_HELPER_SYNC_INTERVAL, default=self._get_val(CONF_HELPER_SYNC_INTERVAL, DEFAULT_HELPER_SYNC_INTERVAL)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_HELPER_SYNC_INTERVAL["min"],
+                            max=RANGE_HELPER_SYNC_INTERVAL["max"],
+                            step=RANGE_HELPER_SYNC_INTERVAL["step"],
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                vol.Required(CONF_PERIODIC_INTERVAL, default=self._get_val(CONF_PERIODIC_INTERVAL, DEFAULT_PERIODIC_INTERVAL)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_PERIODIC_INTERVAL["min"],
+                            max=RANGE_PERIODIC_INTERVAL["max"],
+                            step=RANGE_PERIODIC_INTERVAL["step"],
+                            unit_of_measurement="min",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                vol.Required(CONF_DEADBAND_EUR, default=self._get_val(CONF_DEADBAND_EUR, DEFAULT_DEADBAND_EUR)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_DEADBAND_EUR["min"],
+                            max=RANGE_DEADBAND_EUR["max"],
+                            step=RANGE_DEADBAND_EUR["step"],
+                            unit_of_measurement="€",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                vol.Required(CONF_DEADBAND_KWH, default=self._get_val(CONF_DEADBAND_KWH, DEFAULT_DEADBAND_KWH)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_DEADBAND_KWH["min"],
+                            max=RANGE_DEADBAND_KWH["max"],
+                            step=RANGE_DEADBAND_KWH["step"],
+                            unit_of_measurement="kWh",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                vol.Required(CONF_DEADBAND_PERCENT, default=self._get_val(CONF_DEADBAND_PERCENT, DEFAULT_DEADBAND_PERCENT)):
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=RANGE_DEADBAND_PERCENT["min"],
+                            max=RANGE_DEADBAND_PERCENT["max"],
+                            step=RANGE_DEADBAND_PERCENT["step"],
+                            unit_of_measurement="%",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+            })
+        )
+
     async def async_step_reset(self, user_input=None):
         """Reset-Optionen."""
         _LOGGER = logging.getLogger(__name__)
@@ -494,15 +594,7 @@ class PVManagementFixOptionsFlow(config_entries.OptionsFlow):
             ctrl = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {}).get(DATA_CTRL)
             if ctrl and target:
                 if target == "amortisation":
-                    ctrl._total_self_consumption_kwh = 0.0
-                    ctrl._total_feed_in_kwh = 0.0
-                    ctrl._accumulated_savings_self = 0.0
-                    ctrl._accumulated_earnings_feed = 0.0
-                    ctrl._first_seen_date = None
-                    ctrl._initialize_from_sensors()
-                    ctrl._last_pv_production_kwh = ctrl._pv_production_kwh
-                    ctrl._last_grid_export_kwh = ctrl._grid_export_kwh
-                    ctrl._notify_entities()
+                    ctrl.reset_amortisation_tracking()
                     _LOGGER.info("Reset via Settings: Amortisation neu initialisiert")
                 elif target == "grid_import":
                     ctrl.reset_grid_import_tracking()
@@ -6,6 +6,7 @@ from homeassistant.const import Platform
 # --- Domain / Platforms -------------------------------------------------------
 DOMAIN: Final[str] = "pv_management_fix"
 DATA_CTRL: Final[str] = "ctrl"
+DATA_SENSOR_GROUPS: Final[str] = "sensor_groups"  # optional sensor groups of a live entry
 
 # Only Sensor and Button - no Switches (no battery management for fixed price)
 PLATFORMS: Final[tuple[Platform, ...]] = (
@@ -13,6 +14,10 @@ PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BUTTON,
 )
 
+# --- Storage (persistent controller state, one file per config entry) ---------
+STORAGE_VERSION: Final[int] = 1
+STORAGE_KEY: Final[str] = DOMAIN  # .storage/pv_management_fix.<entry_id>
+
 # --- Config keys (Setup) ------------------------------------------------------
 CONF_NAME: Final[str] = "name"
 CONF_PV_PRODUCTION_ENTITY: Final[str] = "pv_production_entity"
@@ -104,6 +109,104 @@ RANGE_QUOTA_METER: Final[dict] = {"min": 0.0, "max": 9999999.0, "step": 0.01}
 RANGE_QUOTA_RATE: Final[dict] = {"min": 0.0, "max": 10000.0, "step": 0.01}
 RANGE_BATTERY_CAPACITY: Final[dict] = {"min": 0.1, "max": 200.0, "step": 0.1}
 
+# --- Performance (Update scheduling) ------------------------------------------
+CONF_UPDATE_INTERVAL: Final[str] = "update_interval"
+DEFAULT_UPDATE_INTERVAL: Final[float] = 5.0  # s, sensors are written at most once per interval
+RANGE_UPDATE_INTERVAL: Final[dict] = {"min": 1.0, "max": 30.0, "step": 1.0}
+
+# Deadbands: a sensor skips its state write while the value moved less than this
+CONF_DEADBAND_EUR: Final[str] = "deadband_eur"
+CONF_DEADBAND_KWH: Final[str] = "deadband_kwh"
+CONF_DEADBAND_PERCENT: Final[str] = "deadband_percent"
+DEFAULT_DEADBAND_EUR: Final[float] = 0.0  # € (0 = write every visible change)
+DEFAULT_DEADBAND_KWH: Final[float] = 0.0  # kWh
+DEFAULT_DEADBAND_PERCENT: Final[float] = 0.0  # percentage points
+RANGE_DEADBAND_EUR: Final[dict] = {"min": 0.0, "max": 10.0, "step": 0.01}
+RANGE_DEADBAND_KWH: Final[dict] = {"min": 0.0, "max": 10.0, "step": 0.01}
+RANGE_DEADBAND_PERCENT: Final[dict] = {"min": 0.0, "max": 5.0, "step": 0.1}
+
+# Sampling window: PV/export/import updates arriving within this window are
+# processed as one consistent sample (0 = process every meter update directly)
+CONF_SAMPLE_WINDOW: Final[str] = "sample_window"
+DEFAULT_SAMPLE_WINDOW: Final[float] = 1.0  # s
+RANGE_SAMPLE_WINDOW: Final[dict] = {"min": 0.0, "max": 10.0, "step": 0.5}
+
+# Checkpoints: the controller state (accumulators + last meter readings) is written
+# at most once per interval, and right away once the unsaved savings or energy
+# exceed the delta thresholds. Bounds the loss on a hard kill of Home Assistant.
+CONF_CHECKPOINT_INTERVAL: Final[str] = "checkpoint_interval"
+DEFAULT_CHECKPOINT_INTERVAL: Final[float] = 30.0  # s
+RANGE_CHECKPOINT_INTERVAL: Final[dict] = {"min": 5.0, "max": 600.0, "step": 5.0}
+CHECKPOINT_DELTA_EUR: Final[float] = 0.10  # € of unsaved savings/earnings/import cost
+CHECKPOINT_DELTA_KWH: Final[float] = 1.0  # kWh of unsaved self consumption/feed-in/import
+
+# Amortisation helper sync: at most one input_number.set_value call in flight,
+# consecutive syncs at least this far apart (pending changes are coalesced)
+CONF_HELPER_SYNC_INTERVAL: Final[str] = "helper_sync_interval"
+DEFAULT_HELPER_SYNC_INTERVAL: Final[float] = 60.0  # s
+RANGE_HELPER_SYNC_INTERVAL: Final[dict] = {"min": 5.0, "max": 3600.0, "step": 5.0}
+
+# Refresh tiers: realtime sensors are written with the meter updates, analytic
+# sensors (annualisations, forecasts, scores) only by their tier's scheduler:
+# periodic every periodic_interval minutes, daily at the midnight rollover.
+CONF_PERIODIC_INTERVAL: Final[str] = "periodic_interval"
+DEFAULT_PERIODIC_INTERVAL: Final[float] = 15.0  # min
+RANGE_PERIODIC_INTERVAL: Final[dict] = {"min": 1.0, "max": 240.0, "step": 1.0}
+
+# Live history: in-memory ring buffer of the energy/money deltas per fixed interval
+# (history.py). 6 channels x 8 bytes per slot: ~1.6 MiB per year at 15 min slots.
+HISTORY_SLOT_SECONDS: Final[int] = 900  # 15 min
+HISTORY_RETENTION_DAYS: Final[int] = 31  # ~140 KiB
+
+# Persistent rollups: memory-mapped ring files of hourly/daily/monthly sums of the
+# same channels (rollup.py), stored next to the Store file as .storage/<key>.<entry_id>.rollup.
+# 56 bytes per record: ~1.9 MB at the default capacities.
+ROLLUP_FILE_SUFFIX: Final[str] = "rollup"
+ROLLUP_HOURS: Final[int] = 3 * 366 * 24  # 3 years
+ROLLUP_DAYS: Final[int] = 20 * 366  # 20 years
+ROLLUP_MONTHS: Final[int] = 50 * 12  # 50 years
+# Annual projections use the trailing year of daily rollups once they cover it
+ROLLUP_PROJECTION_DAYS: Final[int] = 365
+
+# External long-term statistics: completed hours of the hourly rollups are imported
+# into the recorder at every hour boundary as "<domain>:<name>_<suffix>" sum statistics.
+# Rollup channel -> (statistic id suffix, display name, unit; None = HA currency)
+STATISTICS_CHANNELS: Final[dict[str, tuple[str, str, str | None]]] = {
+    "savings_eur": ("savings", "Ersparnis Eigenverbrauch", None),
+    "earnings_eur": ("feed_in_earnings", "Einnahmen Einspeisung", None),
+    "import_cost_eur": ("import_cost", "Netzbezug Kosten", None),
+    "self_consumption_kwh": ("self_consumption", "Eigenverbrauch", "kWh"),
+}
+
+# Update groups: each sensor declares which groups it reads, the controller
+# records which groups an update touched and only notifies matching sensors.
+UPDATE_GROUP_ENERGY: Final[str] = "energy"  # meters, savings, daily/monthly, quota
+UPDATE_GROUP_PRICES: Final[str] = "prices"  # dynamic price / feed-in tariff sensors
+UPDATE_GROUP_BATTERY: Final[str] = "battery"
+UPDATE_GROUP_HEATPUMP: Final[str] = "heatpump"
+UPDATE_GROUP_STRINGS: Final[str] = "strings"  # PV string energy counters
+UPDATE_GROUP_STRING_POWER: Final[str] = "string_power"  # PV string peak tracking
+UPDATE_GROUP_CONFIG: Final[str] = "config"  # options only, refreshed on full updates
+UPDATE_GROUP_PERIODIC: Final[str] = "periodic"  # refresh tier, see CONF_PERIODIC_INTERVAL
+UPDATE_GROUP_DAILY: Final[str] = "daily"  # refresh tier, midnight rollover
+
+UPDATE_GROUPS_ALL: Final[frozenset] = frozenset({
+    UPDATE_GROUP_ENERGY,
+    UPDATE_GROUP_PRICES,
+    UPDATE_GROUP_BATTERY,
+    UPDATE_GROUP_HEATPUMP,
+    UPDATE_GROUP_STRINGS,
+    UPDATE_GROUP_STRING_POWER,
+    UPDATE_GROUP_CONFIG,
+    UPDATE_GROUP_PERIODIC,
+    UPDATE_GROUP_DAILY,
+})
+
+REFRESH_TIER_REALTIME: Final[str] = "realtime"
+REFRESH_TIER_PERIODIC: Final[str] = UPDATE_GROUP_PERIODIC
+REFRESH_TIER_DAILY: Final[str] = UPDATE_GROUP_DAILY
+REFRESH_TIER_GROUPS: Final[frozenset] = frozenset({UPDATE_GROUP_PERIODIC, UPDATE_GROUP_DAILY})
+
 # --- Benchmark ----------------------------------------------------------------
 CONF_BENCHMARK_ENABLED: Final[str] = "benchmark_enabled"
 CONF_BENCHMARK_HOUSEHOLD_SIZE: Final[str] = "benchmark_household_size"
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA_CTRL
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Diagnose-Daten — interne Buchhaltung, die bewusst nicht im Recorder landet."""
+    ctrl = hass.data[DOMAIN][entry.entry_id][DATA_CTRL]
+    return {
+        "options": {**entry.data, **entry.options},
+        "state": ctrl.get_state_for_storage(),
+        "ingest": dict(ctrl.ingest_stats),
+        "helper_sync": dict(ctrl.helper_sync_stats),
+        "tracked_entity_ids": sorted(ctrl.tracked_entity_ids),
+        "energy_history": ctrl.energy_history.summary(),
+        "rollups": ctrl.rollups.summary(),
+        "backfill": ctrl.backfill_progress,
+        "price_history_samples": {
+            kind: len(history) for kind, history in ctrl._price_history.items()
+        },
+    }
@@ -0,0 +1,135 @@
+"""Ringpuffer der Energie-Deltas in festen Intervallen (Live-Historie des Controllers).
+
+Je Kanal ein array('d') mit fester Slot-Anzahl: Anhängen ist O(1), der Speicher
+hängt nur von der Aufbewahrung ab. Bei 15-Minuten-Slots sind das
+6 Kanäle × 8 Byte × 35 040 Slots ≈ 1,6 MiB pro Jahr Historie
+(Standard 31 Tage ≈ 140 KiB).
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable
+
+# Kanäle: Energie in kWh, Geld in €
+HISTORY_CHANNELS: tuple[str, ...] = (
+    "self_consumption_kwh",
+    "feed_in_kwh",
+    "grid_import_kwh",
+    "savings_eur",
+    "earnings_eur",
+    "import_cost_eur",
+)
+
+
+class EnergyHistory:
+    """Ringpuffer der Deltas je Intervall; Slot = Unix-Zeit // slot_seconds."""
+
+    def __init__(self, slot_seconds: int, slots: int) -> None:
+        self.slot_seconds = slot_seconds
+        self.slots = slots
+        self._channels: dict[str, array] = {
+            channel: array("d", bytes(8 * slots)) for channel in HISTORY_CHANNELS
+        }
+        # Absolute Nummer des neuesten Slots (None = noch leer)
+        self._head: int | None = None
+
+    @property
+    def nbytes(self) -> int:
+        """Belegter Speicher der Puffer in Byte."""
+        return sum(values.itemsize * len(values) for values in self._channels.values())
+
+    def _advance(self, slot: int) -> None:
+        """Schiebt den Kopf auf slot vor und leert die dabei übersprungenen Slots."""
+        head = self._head
+        if head is not None and slot <= head:
+            return
+        if head is None or slot - head >= self.slots:
+            if head is not None:
+                for values in self._channels.values():
+                    values[:] = array("d", bytes(8 * self.slots))
+        else:
+            for absolute in range(head + 1, slot + 1):
+                index = absolute % self.slots
+                for values in self._channels.values():
+                    values[index] = 0.0
+        self._head = slot
+
+    def add(self, timestamp: float, **deltas: float) -> None:
+        """Addiert Deltas in den Slot von timestamp (O(1), amortisiert über Lücken).
+
+        Verspätete Werte landen im passenden älteren Slot, solange er noch im
+        Puffer liegt; ältere werden verworfen.
+        """
+        slot = int(timestamp // self.slot_seconds)
+        self._advance(slot)
+        if self._head - slot >= self.slots:
+            return
+        index = slot % self.slots
+        for channel, delta in deltas.items():
+            if delta:
+                self._channels[channel][index] += delta
+
+    def add_spread(self, start: float, end: float, **deltas: float) -> None:
+        """Verteilt Deltas zeitanteilig auf die Slots zwischen start und end (Downtime)."""
+        if end <= start:
+            self.add(end, **deltas)
+            return
+        span = end - start
+        first = int(start // self.slot_seconds)
+        last = int(end // self.slot_seconds)
+        # Nur der Teil der Lücke, der noch in den Puffer passt
+        first = max(first, last - self.slots + 1)
+        for slot in range(first, last + 1):
+            slot_start = max(start, slot * self.slot_seconds)
+            slot_end = min(end, (slot + 1) * self.slot_seconds)
+            share = (slot_end - slot_start) / span
+            if share > 0:
+                self.add(slot * self.slot_seconds, **{k: v * share for k, v in deltas.items()})
+
+    def _slot_range(self, start: float, end: float) -> range:
+        """Absolute Slots in [start, end), begrenzt auf den Pufferinhalt."""
+        if self._head is None:
+            return range(0)
+        first = max(int(start // self.slot_seconds), self._head - self.slots + 1)
+        last = min(int(-(-end // self.slot_seconds)) - 1, self._head)
+        return range(first, last + 1)
+
+    def series(self, channel: str, start: float, end: float) -> list[tuple[float, float]]:
+        """(Slot-Beginn, Wert) je Slot in [start, end)."""
+        values = self._channels[channel]
+        return [
+            (slot * self.slot_seconds, values[slot % self.slots])
+            for slot in self._slot_range(start, end)
+        ]
+
+    def total(self, channel: str, start: float, end: float) -> float:
+        """Summe eines Kanals über alle Slots in [start, end)."""
+        values = self._channels[channel]
+        return sum(values[slot % self.slots] for slot in self._slot_range(start, end))
+
+    def reprice(self, prices: Callable[[float], tuple[float | None, float | None]]) -> None:
+        """Rechnet die Geld-Kanäle aller Slots neu (Tarif-Replay).
+
+        prices(Slot-Beginn) liefert (Brutto-Strompreis, Einspeisetarif) in €/kWh;
+        None lässt den jeweiligen Kanal unverändert.
+        """
+        if self._head is None:
+            return
+        channels = self._channels
+        for slot in range(self._head - self.slots + 1, self._head + 1):
+            index = slot % self.slots
+            price, tariff = prices(slot * self.slot_seconds)
+            if price is not None:
+                channels["savings_eur"][index] = channels["self_consumption_kwh"][index] * price
+                channels["import_cost_eur"][index] = channels["grid_import_kwh"][index] * price
+            if tariff is not None:
+                channels["earnings_eur"][index] = channels["feed_in_kwh"][index] * tariff
+
+    def summary(self) -> dict[str, Any]:
+        """Kurzbeschreibung für die Diagnose."""
+        return {
+            "slot_seconds": self.slot_seconds,
+            "slots": self.slots,
+            "bytes": self.nbytes,
+            "newest_slot_start": self._head * self.slot_seconds if self._head is not None else None,
+        }
@@ -0,0 +1,251 @@
+"""Neubewertung der gespeicherten Rollups mit einer Tarif-Definition (Tarif-Replay).
+
+Korrigierte Preise (Fixpreis, Aufschlagfaktor, Einspeisetarif) gelten sonst nur für
+neue Deltas. Das Replay rechnet die Geld-Kanäle der Stunden- und Tages-Records aus
+den gespeicherten kWh neu, überträgt die Differenzen der Tage auf die Monate und
+liefert die Summe je Kanal für die Akkumulatoren.
+
+Mit NumPy (optional, keine Requirement) vektorisiert direkt auf dem Mapping,
+sonst Record für Record in reinem Python; beide Wege rechnen identisch.
+"""
+from __future__ import annotations
+
+import struct
+from datetime import date
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .history import HISTORY_CHANNELS, EnergyHistory
+from .rollup import PERIOD_DAY, PERIOD_HOUR, PERIOD_MONTH, RollupStore, hour_key, month_key
+
+try:
+    import numpy as np
+except ImportError:  # Fallback in reinem Python
+    np = None
+
+_SELF = HISTORY_CHANNELS.index("self_consumption_kwh")
+_FEED = HISTORY_CHANNELS.index("feed_in_kwh")
+_IMPORT = HISTORY_CHANNELS.index("grid_import_kwh")
+_SAVINGS = HISTORY_CHANNELS.index("savings_eur")
+_EARNINGS = HISTORY_CHANNELS.index("earnings_eur")
+_COST = HISTORY_CHANNELS.index("import_cost_eur")
+_RECORD = struct.Struct("<q" + "d" * len(HISTORY_CHANNELS))
+# Akkumulatoren in der Reihenfolge der Geld-Kanäle (Ersparnis, Einspeisung, Netzbezug)
+ACCUMULATORS: tuple[str, ...] = ("savings", "earnings", "import_cost")
+# Offene Perioden-Grenzen als Schlüssel
+_KEY_MIN = -(2**62)
+_KEY_MAX = 2**62
+
+
+class TariffPeriod(NamedTuple):
+    """Tarif ab start (inklusive) bis end (exklusive), Ortszeit; None = offen bzw. unverändert."""
+
+    start: date | None
+    end: date | None
+    gross_price: float | None  # €/kWh brutto: Ersparnis Eigenverbrauch und Netzbezug
+    feed_in_tariff: float | None  # €/kWh
+
+
+def _day_bound(day: date | None, default: int) -> int:
+    return default if day is None else day.toordinal()
+
+
+def _hour_bound(day: date | None, default: int) -> int:
+    return default if day is None else hour_key(dt_util.start_of_local_day(day).timestamp())
+
+
+def _month_of_day(key: int) -> int:
+    return month_key(date.fromordinal(key))
+
+
+def _bounds(periods: list[TariffPeriod], convert) -> tuple[list[int], list[int], list[float], list[float]]:
+    """Sortierte Grenzen und Preise (nan = unverändert) je Periode."""
+    starts = [convert(p.start, _KEY_MIN) for p in periods]
+    ends = [convert(p.end, _KEY_MAX) for p in periods]
+    gross = [float("nan") if p.gross_price is None else p.gross_price for p in periods]
+    tariffs = [float("nan") if p.feed_in_tariff is None else p.feed_in_tariff for p in periods]
+    return starts, ends, gross, tariffs
+
+
+def validate_periods(periods: list[TariffPeriod]) -> list[TariffPeriod]:
+    """Sortiert die Perioden nach Beginn; ValueError bei leeren oder überlappenden Perioden."""
+    ordered = sorted(periods, key=lambda p: _day_bound(p.start, _KEY_MIN))
+    for period in ordered:
+        if period.start is not None and period.end is not None and period.end <= period.start:
+            raise ValueError(f"Tarif-Periode endet vor ihrem Beginn: {period.start} - {period.end}")
+    for earlier, later in zip(ordered, ordered[1:]):
+        if _day_bound(earlier.end, _KEY_MAX) > _day_bound(later.start, _KEY_MIN):
+            raise ValueError(f"Tarif-Perioden überlappen: ab {earlier.start} und ab {later.start}")
+    return ordered
+
+
+# -----------------------------------------------------------------------------
+# Ring-Replay: NumPy und reines Python
+# -----------------------------------------------------------------------------
+
+
+def _replay_ring_numpy(view, capacity: int, bounds, apply: bool) -> tuple[list[int], list[tuple[float, float, float]]]:
+    starts, ends, gross, tariffs = (np.asarray(values) for values in bounds)
+    records = np.frombuffer(view, dtype=_NP_RECORD, count=capacity)
+    keys = records["key"]
+    channels = records["channels"]
+    index = np.searchsorted(starts, keys, side="right") - 1
+    period = np.clip(index, 0, None)
+    inside = (keys > 0) & (keys % capacity == np.arange(capacity)) & (index >= 0) & (keys < ends[period])
+    price = gross[period]
+    tariff = tariffs[period]
+    repriced = inside & ~np.isnan(price)
+    refed = inside & ~np.isnan(tariff)
+    savings = np.where(repriced, channels[:, _SELF] * price, channels[:, _SAVINGS])
+    cost = np.where(repriced, channels[:, _IMPORT] * price, channels[:, _COST])
+    earnings = np.where(refed, channels[:, _FEED] * tariff, channels[:, _EARNINGS])
+    changed = repriced | refed
+    deltas = np.stack(
+        (savings - channels[:, _SAVINGS], earnings - channels[:, _EARNINGS], cost - channels[:, _COST]),
+        axis=1,
+    )[changed]
+    changed_keys = keys[changed].tolist()
+    if apply:
+        channels[:, _SAVINGS] = savings
+        channels[:, _EARNINGS] = earnings
+        channels[:, _COST] = cost
+    return changed_keys, [tuple(row) for row in deltas.tolist()]
+
+
+def _replay_ring_python(view, capacity: int, bounds, apply: bool) -> tuple[list[int], list[tuple[float, float, float]]]:
+    starts, ends, gross, tariffs = bounds
+    changed_keys: list[int] = []
+    deltas: list[tuple[float, float, float]] = []
+    for index in range(capacity):
+        offset = index * _RECORD.size
+        record = list(_RECORD.unpack_from(view, offset))
+        key = record[0]
+        if key <= 0 or key % capacity != index:
+            continue
+        period = _bisect(starts, key)
+        if period < 0 or key >= ends[period]:
+            continue
+        price, tariff = gross[period], tariffs[period]
+        values = record[1:]
+        savings, earnings, cost = values[_SAVINGS], values[_EARNINGS], values[_COST]
+        if price == price:  # nicht nan
+            savings, cost = values[_SELF] * price, values[_IMPORT] * price
+        if tariff == tariff:
+            earnings = values[_FEED] * tariff
+        if price != price and tariff != tariff:
+            continue
+        changed_keys.append(key)
+        deltas.append((savings - values[_SAVINGS], earnings - values[_EARNINGS], cost - values[_COST]))
+        if apply:
+            record[1 + _SAVINGS], record[1 + _EARNINGS], record[1 + _COST] = savings, earnings, cost
+            _RECORD.pack_into(view, offset, *record)
+    return changed_keys, deltas
+
+
+def _bisect(starts: list[int], key: int) -> int:
+    """Index der letzten Periode mit Beginn <= key (-1 wenn keine)."""
+    low, high = 0, len(starts)
+    while low < high:
+        mid = (low + high) // 2
+        if starts[mid] <= key:
+            low = mid + 1
+        else:
+            high = mid
+    return low - 1
+
+
+if np is not None:
+    _NP_RECORD = np.dtype([("key", "<i8"), ("channels", "<f8", (len(HISTORY_CHANNELS),))])
+    _replay_ring = _replay_ring_numpy
+else:
+    _replay_ring = _replay_ring_python
+
+
+# -----------------------------------------------------------------------------
+# Einstieg
+# -----------------------------------------------------------------------------
+
+
+def _price_lookup(periods: list[TariffPeriod]):
+    """prices(Unix-Zeit) -> (Brutto-Preis, Tarif) für die Live-Historie."""
+    starts, ends, gross, tariffs = _bounds(periods, _hour_bound)
+
+    def prices(timestamp: float) -> tuple[float | None, float | None]:
+        key = hour_key(timestamp)
+        period = _bisect(starts, key)
+        if period < 0 or key >= ends[period]:
+            return None, None
+        price, tariff = gross[period], tariffs[period]
+        return (price if price == price else None), (tariff if tariff == tariff else None)
+
+    return prices
+
+
+def _accumulator_delta(
+    index: int,
+    since: float | None,
+    days: list[int],
+    day_deltas: list[tuple[float, float, float]],
+    hours: list[int],
+    hour_deltas: list[tuple[float, float, float]],
+) -> float:
+    """Differenz eines Akkumulators: nur Energie ab dessen letztem Reset (since).
+
+    Ganze Tage nach dem Reset-Tag; am Reset-Tag selbst die vollen Stunden ab since
+    (die angebrochene Stunde enthält noch Energie von vor dem Reset).
+    """
+    if since is None:
+        return sum(delta[index] for delta in day_deltas)
+    reset_day = dt_util.as_local(dt_util.utc_from_timestamp(since)).date()
+    first_hour = -int(-since // 3600)
+    next_day = _hour_bound(date.fromordinal(reset_day.toordinal() + 1), _KEY_MAX)
+    total = sum(delta[index] for key, delta in zip(days, day_deltas) if key > reset_day.toordinal())
+    total += sum(delta[index] for key, delta in zip(hours, hour_deltas) if first_hour <= key < next_day)
+    return total
+
+
+def replay_tariffs(
+    store: RollupStore,
+    periods: list[TariffPeriod],
+    history: EnergyHistory | None = None,
+    apply: bool = True,
+    since: dict[str, float | None] | None = None,
+) -> dict[str, Any]:
+    """Bewertet Stunden, Tage, Monate (und die Live-Historie) mit den Perioden neu.
+
+    apply=False rechnet nur. Alle Records werden neu bewertet; die Differenzen für
+    die Akkumulatoren zählen nur Energie ab deren letztem Reset (since: Akkumulator
+    "savings"/"earnings"/"import_cost" -> Unix-Zeit, None = seit Beginn).
+    """
+    periods = validate_periods(periods)
+    since = since or {}
+    with store.ring(PERIOD_HOUR) as view:
+        hours, hour_deltas = _replay_ring(view, store.capacity(PERIOD_HOUR), _bounds(periods, _hour_bound), apply)
+    with store.ring(PERIOD_DAY) as view:
+        days, day_deltas = _replay_ring(view, store.capacity(PERIOD_DAY), _bounds(periods, _day_bound), apply)
+
+    # Monate: Summe der Tages-Differenzen je Monat
+    month_deltas: dict[int, list[float]] = {}
+    for key, delta in zip(days, day_deltas):
+        total = month_deltas.setdefault(_month_of_day(key), [0.0, 0.0, 0.0])
+        for i, value in enumerate(delta):
+            total[i] += value
+    if apply:
+        for key, (savings, earnings, cost) in month_deltas.items():
+            store.add_to(PERIOD_MONTH, key, savings_eur=savings, earnings_eur=earnings, import_cost_eur=cost)
+        if history is not None:
+            history.reprice(_price_lookup(periods))
+
+    return {
+        "engine": "python" if _replay_ring is _replay_ring_python else "numpy",
+        "hours": len(hours),
+        "days": len(days),
+        "months": len(month_deltas),
+        "first_day": date.fromordinal(min(days)).isoformat() if days else None,
+        "last_day": date.fromordinal(max(days)).isoformat() if days else None,
+        **{
+            f"{name}_delta": _accumulator_delta(index, since.get(name), days, day_deltas, hours, hour_deltas)
+            for index, name in enumerate(ACCUMULATORS)
+        },
+    }
@@ -0,0 +1,311 @@
+"""Persistente Stunden-/Tages-/Monatswerte in einer memory-mapped Datei.
+
+Die Datei liegt unter .storage und besteht aus einem Header und drei Ringen
+fester Records (Stunde, Tag, Monat). Jeder Record enthält den Periodenschlüssel
+und die Summen der Kanäle aus history.py:
+
+    <q  Schlüssel (Stunde = Unix-Zeit // 3600, Tag = date.toordinal() in Ortszeit,
+        Monat = Jahr * 12 + Monat - 1)
+    6d  Kanäle (kWh bzw. €)
+
+Nach dem festen Header folgt die Schreibmarke: Zeitpunkt des neuesten add und
+die Summen aller je per add geschriebenen Deltas. Der Checkpoint des Controllers
+merkt sich die Summen; nach einem harten Abbruch zeigt die Differenz, was die
+Rollups schon über den Checkpoint hinaus enthalten (siehe Downtime-Recovery).
+Dahinter steht die zuletzt nachgetragene Stunde des Statistik-Nachtrags; sie
+zählt nicht zur Schreibmarke und verhindert, dass eine Seite nach einem Abbruch
+vor dem Speichern des Cursors doppelt eingeht.
+
+Position im Ring = Schlüssel % Kapazität; stimmt der gespeicherte Schlüssel
+nicht, ist der Record leer (auch eine mit Nullen gefüllte Datei ist gültig).
+Beim Start wird die Datei nur gemappt, nicht geparst; Updates schreiben direkt
+in die gemappten Seiten. Standard (3 Jahre Stunden, 20 Jahre Tage,
+50 Jahre Monate): 34 272 Records × 56 Byte ≈ 1,9 MB.
+
+open und flush blockieren und laufen im Executor.
+"""
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+from datetime import date
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .history import HISTORY_CHANNELS
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIOD_HOUR = "hour"
+PERIOD_DAY = "day"
+PERIOD_MONTH = "month"
+PERIODS: tuple[str, ...] = (PERIOD_HOUR, PERIOD_DAY, PERIOD_MONTH)
+
+_MAGIC = b"PVRU"
+_VERSION = 2
+# Magic, Version, Record-Größe, Kapazitäten (Stunde/Tag/Monat), ältester Tag
+_HEADER = struct.Struct("<4sHHIIIq")
+_HEADER_SIZE = 128
+_RECORD = struct.Struct("<q" + "d" * len(HISTORY_CHANNELS))
+_ORIGIN_OFFSET = _HEADER.size - 8
+# Schreibmarke: Zeitpunkt des neuesten add, Summen je Kanal
+_MARK = struct.Struct("<d" + "d" * len(HISTORY_CHANNELS))
+_MARK_OFFSET = _HEADER.size
+# Beginn der zuletzt nachgetragenen Stunde (Unix-Zeit, 0 = keine)
+_BACKFILL_OFFSET = _MARK_OFFSET + _MARK.size
+_CHANNEL_INDEX = {channel: i for i, channel in enumerate(HISTORY_CHANNELS)}
+
+
+def hour_key(timestamp: float) -> int:
+    """Stunden-Schlüssel (UTC-Stunden seit Epoch)."""
+    return int(timestamp // 3600)
+
+
+def day_key(day: date) -> int:
+    """Tages-Schlüssel (Ordinal des lokalen Datums)."""
+    return day.toordinal()
+
+
+def month_key(day: date) -> int:
+    """Monats-Schlüssel (fortlaufende Monatsnummer)."""
+    return day.year * 12 + day.month - 1
+
+
+def _local_date(timestamp: float) -> date:
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+
+
+class RollupStore:
+    """Ringe fester Records je Periode; bis open() im Speicher (bytearray)."""
+
+    def __init__(self, hours: int, days: int, months: int) -> None:
+        self._capacity = {PERIOD_HOUR: hours, PERIOD_DAY: days, PERIOD_MONTH: months}
+        self._offset: dict[str, int] = {}
+        offset = _HEADER_SIZE
+        for period in PERIODS:
+            self._offset[period] = offset
+            offset += self._capacity[period] * _RECORD.size
+        self.size = offset
+        self.path: str | None = None
+        self._mm: mmap.mmap | None = None
+        self._buf: bytearray | mmap.mmap = bytearray(self.size)
+        self._write_header(self._buf)
+
+    # -------------------------------------------------------------------------
+    # Datei (blockierend, im Executor aufrufen)
+    # -------------------------------------------------------------------------
+
+    def _write_header(self, buf) -> None:
+        _HEADER.pack_into(
+            buf, 0, _MAGIC, _VERSION, _RECORD.size,
+            self._capacity[PERIOD_HOUR], self._capacity[PERIOD_DAY], self._capacity[PERIOD_MONTH], 0,
+        )
+
+    def _header_matches(self, buf) -> bool:
+        magic, version, record_size, hours, days, months, _ = _HEADER.unpack_from(buf, 0)
+        return (
+            magic == _MAGIC and version == _VERSION and record_size == _RECORD.size
+            and (hours, days, months)
+            == (self._capacity[PERIOD_HOUR], self._capacity[PERIOD_DAY], self._capacity[PERIOD_MONTH])
+        )
+
+    def open(self, path: str) -> None:
+        """Mappt die Datei (legt sie bei Bedarf an); bisherige Werte im Speicher werden verworfen."""
+        self.flush()
+        self.close()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fresh = os.fstat(fd).st_size != self.size
+            if not fresh:
+                fresh = not self._header_matches(os.pread(fd, _HEADER.size, 0))
+            if fresh:
+                if os.fstat(fd).st_size:
+                    _LOGGER.warning("Rollup-Datei %s hat ein anderes Format und wird neu angelegt", path)
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, self.size)
+            mm = mmap.mmap(fd, self.size)
+        finally:
+            os.close(fd)
+        if fresh:
+            self._write_header(mm)
+        self._mm = mm
+        self._buf = mm
+        self.path = path
+
+    def flush(self) -> None:
+        """Schreibt geänderte Seiten auf die Platte (nach close() ohne Wirkung)."""
+        mm = self._mm
+        if mm is None or mm.closed:
+            return
+        try:
+            mm.flush()
+        except ValueError:
+            # Während des Flush im Executor geschlossen (close() im Event-Loop)
+            pass
+
+    def close(self) -> None:
+        """Gibt das Mapping frei (vorher flush); die Werte bleiben als Kopie lesbar."""
+        if self._mm is None:
+            return
+        mm, self._mm = self._mm, None
+        self._buf = bytearray(mm)
+        mm.close()
+
+    # -------------------------------------------------------------------------
+    # Records
+    # -------------------------------------------------------------------------
+
+    def _position(self, period: str, key: int) -> int:
+        return self._offset[period] + (key % self._capacity[period]) * _RECORD.size
+
+    def get(self, period: str, key: int) -> dict[str, float] | None:
+        """Kanäle eines Records oder None wenn (noch) leer / überschrieben."""
+        record = _RECORD.unpack_from(self._buf, self._position(period, key))
+        if record[0] != key:
+            return None
+        return dict(zip(HISTORY_CHANNELS, record[1:]))
+
+    def value(self, period: str, key: int, channel: str) -> float:
+        """Einzelner Kanal eines Records (0.0 wenn leer)."""
+        pos = self._position(period, key)
+        if struct.unpack_from("<q", self._buf, pos)[0] != key:
+            return 0.0
+        return struct.unpack_from("<d", self._buf, pos + 8 + 8 * _CHANNEL_INDEX[channel])[0]
+
+    def _update(self, period: str, key: int, deltas: dict[str, float], replace: bool = False) -> None:
+        pos = self._position(period, key)
+        record = list(_RECORD.unpack_from(self._buf, pos))
+        if record[0] != key:
+            record = [key] + [0.0] * len(HISTORY_CHANNELS)
+        for channel, delta in deltas.items():
+            index = 1 + _CHANNEL_INDEX[channel]
+            record[index] = delta if replace else record[index] + delta
+        _RECORD.pack_into(self._buf, pos, *record)
+        if period == PERIOD_DAY:
+            origin = self.origin_day
+            if origin is None or key < origin:
+                struct.pack_into("<q", self._buf, _ORIGIN_OFFSET, key)
+
+    def add(self, timestamp: float, **deltas: float) -> None:
+        """Addiert Deltas in Stunde, Tag und Monat von timestamp."""
+        deltas = {channel: delta for channel, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        day = _local_date(timestamp)
+        self._update(PERIOD_HOUR, hour_key(timestamp), deltas)
+        self._update(PERIOD_DAY, day_key(day), deltas)
+        self._update(PERIOD_MONTH, month_key(day), deltas)
+        self._advance_mark(timestamp, deltas)
+
+    def _advance_mark(self, timestamp: float, deltas: dict[str, float]) -> None:
+        mark = list(_MARK.unpack_from(self._buf, _MARK_OFFSET))
+        mark[0] = max(mark[0], timestamp)
+        for channel, delta in deltas.items():
+            mark[1 + _CHANNEL_INDEX[channel]] += delta
+        _MARK.pack_into(self._buf, _MARK_OFFSET, *mark)
+
+    def add_spread(self, start: float, end: float, **deltas: float) -> None:
+        """Verteilt Deltas zeitanteilig auf die Stunden zwischen start und end (Downtime)."""
+        if end <= start:
+            self.add(end, **deltas)
+            return
+        span = end - start
+        first = max(hour_key(start), hour_key(end) - self._capacity[PERIOD_HOUR] + 1)
+        for hour in range(first, hour_key(end) + 1):
+            hour_start = max(start, hour * 3600)
+            share = (min(end, (hour + 1) * 3600) - hour_start) / span
+            if share > 0:
+                self.add(hour_start, **{k: v * share for k, v in deltas.items()})
+        self._advance_mark(end, {})
+
+    def add_backfill(self, timestamp: float, **deltas: float) -> bool:
+        """Addiert eine nachgetragene Stunde genau einmal; False wenn sie schon enthalten ist.
+
+        Stunden müssen aufsteigend kommen. Die Schreibmarke bleibt unverändert.
+        """
+        start = hour_key(timestamp) * 3600
+        if start <= self.backfill_until:
+            return False
+        deltas = {channel: delta for channel, delta in deltas.items() if delta}
+        if deltas:
+            day = _local_date(timestamp)
+            self._update(PERIOD_HOUR, hour_key(timestamp), deltas)
+            self._update(PERIOD_DAY, day_key(day), deltas)
+            self._update(PERIOD_MONTH, month_key(day), deltas)
+        struct.pack_into("<d", self._buf, _BACKFILL_OFFSET, start)
+        return True
+
+    @property
+    def backfill_until(self) -> float:
+        """Beginn der zuletzt nachgetragenen Stunde (Unix-Zeit, 0 = keine)."""
+        return struct.unpack_from("<d", self._buf, _BACKFILL_OFFSET)[0]
+
+    def reset_backfill(self) -> None:
+        """Vergisst die nachgetragenen Stunden (neuer Nachtrag)."""
+        struct.pack_into("<d", self._buf, _BACKFILL_OFFSET, 0.0)
+
+    @property
+    def written_until(self) -> float:
+        """Zeitpunkt des neuesten add (Unix-Zeit, 0 = nie)."""
+        return _MARK.unpack_from(self._buf, _MARK_OFFSET)[0]
+
+    def written(self) -> dict[str, float]:
+        """Summen aller per add geschriebenen Deltas je Kanal (Abgleich mit dem Checkpoint)."""
+        return dict(zip(HISTORY_CHANNELS, _MARK.unpack_from(self._buf, _MARK_OFFSET)[1:]))
+
+    def add_to(self, period: str, key: int, **deltas: float) -> None:
+        """Addiert Deltas auf einen bestehenden Record einer Periode (leere bleiben leer)."""
+        if self.get(period, key) is not None:
+            self._update(period, key, deltas)
+
+    def ring(self, period: str) -> memoryview:
+        """Schreibbarer Blick auf alle Records einer Periode (Replay); vor close() freigeben."""
+        start = self._offset[period]
+        return memoryview(self._buf)[start:start + self._capacity[period] * _RECORD.size]
+
+    def capacity(self, period: str) -> int:
+        """Anzahl Records im Ring einer Periode."""
+        return self._capacity[period]
+
+    def seed(self, period: str, key: int, **values: float) -> bool:
+        """Setzt Werte eines leeren Records (Migration); False wenn bereits belegt."""
+        if self.get(period, key) is not None:
+            return False
+        self._update(period, key, values, replace=True)
+        return True
+
+    def clear(self, period: str, key: int, *channels: str) -> None:
+        """Setzt einzelne Kanäle eines Records auf 0."""
+        if self.get(period, key) is not None:
+            self._update(period, key, dict.fromkeys(channels, 0.0), replace=True)
+
+    def total(self, period: str, first: int, last: int, channel: str) -> float:
+        """Summe eines Kanals über die Schlüssel first..last (inklusive)."""
+        first = max(first, last - self._capacity[period] + 1)
+        return sum(self.value(period, key, channel) for key in range(first, last + 1))
+
+    @property
+    def origin_day(self) -> int | None:
+        """Ältester je geschriebene Tages-Schlüssel (Beginn der Abdeckung)."""
+        origin = struct.unpack_from("<q", self._buf, _ORIGIN_OFFSET)[0]
+        return origin or None
+
+    def covers_day(self, key: int, newest: int) -> bool:
+        """True wenn die Tages-Records von key bis newest vollständig im Ring liegen."""
+        origin = self.origin_day
+        return origin is not None and origin <= key and newest - key < self._capacity[PERIOD_DAY]
+
+    def summary(self) -> dict[str, Any]:
+        """Kurzbeschreibung für die Diagnose."""
+        origin = self.origin_day
+        return {
+            "path": self.path,
+            "mapped": self._mm is not None,
+            "bytes": self.size,
+            "capacity": dict(self._capacity),
+            "origin_day": date.fromordinal(origin).isoformat() if origin else None,
+        }
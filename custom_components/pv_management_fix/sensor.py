@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
-from typing import Any
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Callable, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.restore_state import RestoreEntity
-
-from .const import DOMAIN, DATA_CTRL, CONF_NAME
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DOMAIN, DATA_CTRL, DATA_SENSOR_GROUPS, CONF_NAME,
+    UPDATE_GROUP_ENERGY, UPDATE_GROUP_PRICES, UPDATE_GROUP_BATTERY, UPDATE_GROUP_HEATPUMP,
+    UPDATE_GROUP_STRINGS, UPDATE_GROUP_STRING_POWER, UPDATE_GROUP_CONFIG,
+    CONF_DEADBAND_EUR, CONF_DEADBAND_KWH, CONF_DEADBAND_PERCENT,
+    REFRESH_TIER_REALTIME, REFRESH_TIER_PERIODIC, REFRESH_TIER_DAILY,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,9 +34,24 @@ DEVICE_BATTERY = "battery"
 DEVICE_BENCHMARK = "benchmark"
 DEVICE_PV_STRINGS = "pv_strings"
 
-
+# Sensor families for the optional write deadband (unit -> deadband option key).
+# Prices (€/kWh, ct/kWh) are intentionally not part of the € family.
+DEADBAND_FAMILIES: dict[str, str] = {
+    "€": CONF_DEADBAND_EUR,
+    "€/Tag": CONF_DEADBAND_EUR,
+    "€/Monat": CONF_DEADBAND_EUR,
+    "€/Jahr": CONF_DEADBAND_EUR,
+    "kWh": CONF_DEADBAND_KWH,
+    "kWh/Tag": CONF_DEADBAND_KWH,
+    "kWh/Jahr": CONF_DEADBAND_KWH,
+    "%": CONF_DEADBAND_PERCENT,
+    "%/Year": CONF_DEADBAND_PERCENT,
+}
+
+
+@cache
 def get_device_info(name: str, device_type: str = DEVICE_MAIN) -> DeviceInfo:
-    """Creates DeviceInfo for different device types."""
+    """Creates DeviceInfo for different device types (shared by all sensors of a device)."""
     if device_type == DEVICE_PRICES or device_type == DEVICE_QUOTA:
         return DeviceInfo(
             identifiers={(DOMAIN, f"{name}_prices")},
@@ -70,936 +93,1203 @@ def get_device_info(name: str, device_type: str = DEVICE_MAIN) -> DeviceInfo:
         )
 
 
-async def async_setup_entry(
-    hass: HomeAssistant, entry: ConfigEntry, async_add_entities
-):
-    """Setup sensors."""
-    ctrl = hass.data[DOMAIN][entry.entry_id][DATA_CTRL]
-    name = entry.data.get(CONF_NAME, "PV Fixpreis")
-
-    entities = [
-        # === AMORTISATION (Main purpose) ===
-        AmortisationPercentSensor(ctrl, name),
-        TotalSavingsSensor(ctrl, name),
-        RemainingCostSensor(ctrl, name),
-        StatusSensor(ctrl, name),
-        EstimatedPaybackDateSensor(ctrl, name),
-        EstimatedRemainingDaysSensor(ctrl, name),
-
-        # === ENERGY ===
-        SelfConsumptionSensor(ctrl, name),
-        FeedInSensor(ctrl, name),
-        SelfConsumptionRatioSensor(ctrl, name),
-        AutarkyRateSensor(ctrl, name),
-
-        # === FINANCIAL ===
-        SavingsSelfConsumptionSensor(ctrl, name),
-        EarningsFeedInSensor(ctrl, name),
-
-        # === STATISTICS ===
-        AverageDailySavingsSensor(ctrl, name),
-        AverageMonthlySavingsSensor(ctrl, name),
-        AverageYearlySavingsSensor(ctrl, name),
-        DaysSinceInstallationSensor(ctrl, name),
-
-        # === ENVIRONMENT ===
-        CO2SavedSensor(ctrl, name),
-
-        # === DIAGNOSTICS ===
-        FixedPriceSensor(ctrl, name),
-        GrossPriceSensor(ctrl, name),  # EUR/kWh for Energy Dashboard
-        CurrentFeedInTariffSensor(ctrl, name),
-        PVProductionSensor(ctrl, name),
-        InstallationCostSensor(ctrl, name),
-        ConfigurationDiagnosticSensor(ctrl, name, entry),
-
-        # === DAILY ELECTRICITY COSTS ===
-        DailyFeedInSensor(ctrl, name),
-        DailyGridImportSensor(ctrl, name),
-        DailyNetElectricityCostSensor(ctrl, name),
-
-        # === ROI ===
-        ROISensor(ctrl, name),
-        AnnualROISensor(ctrl, name),
-    ]
-
-    # === ELECTRICITY QUOTA (only if enabled) ===
-    if ctrl.quota_enabled:
-        entities.extend([
-            QuotaRemainingSensor(ctrl, name),
-            QuotaConsumedPercentSensor(ctrl, name),
-            QuotaDailyBudgetSensor(ctrl, name),
-            QuotaForecastSensor(ctrl, name),
-            QuotaDaysRemainingSensor(ctrl, name),
-            QuotaTodayRemainingSensor(ctrl, name),
-            QuotaStatusSensor(ctrl, name),
-        ])
-
-    # === BENCHMARK (only if enabled) ===
-    if ctrl.benchmark_enabled:
-        entities.extend([
-            BenchmarkAvgSensor(ctrl, name),
-            BenchmarkOwnSensor(ctrl, name),
-            BenchmarkGridImportSensor(ctrl, name),
-            BenchmarkAnnualPVSensor(ctrl, name),
-            BenchmarkComparisonSensor(ctrl, name),
-            BenchmarkCO2Sensor(ctrl, name),
-            BenchmarkScoreSensor(ctrl, name),
-            BenchmarkRatingSensor(ctrl, name),
-        ])
-        # Specific yield only if PV strings configured (for peak sum)
-        if ctrl.pv_strings:
-            entities.append(BenchmarkSpecificYieldSensor(ctrl, name))
-        if ctrl.benchmark_heatpump:
-            entities.extend([
-                BenchmarkHeatpumpAvgSensor(ctrl, name),
-                BenchmarkHeatpumpOwnSensor(ctrl, name),
-                BenchmarkHeatpumpComparisonSensor(ctrl, name),
-                BenchmarkHouseholdSensor(ctrl, name),
-            ])
-
-    # === BATTERY (only if at least one entity is configured) ===
-    if ctrl.battery_soc_entity or ctrl.battery_charge_entity or ctrl.battery_discharge_entity:
-        entities.extend([
-            BatterySOCSensor(ctrl, name),
-            BatteryChargeTotalSensor(ctrl, name),
-            BatteryDischargeTotalSensor(ctrl, name),
-            BatteryEfficiencySensor(ctrl, name),
-            BatteryCyclesSensor(ctrl, name),
-        ])
-
-    # === PV STRINGS (optional) ===
-    if ctrl.pv_strings:
-        for i, (string_name, string_entity, power_entity, installed_kwp) in enumerate(ctrl.pv_strings):
-            entities.extend([
-                PVStringSensor(ctrl, name, i, string_name, string_entity, power_entity, installed_kwp, "production"),
-                PVStringSensor(ctrl, name, i, string_name, string_entity, power_entity, installed_kwp, "daily"),
-                PVStringSensor(ctrl, name, i, string_name, string_entity, power_entity, installed_kwp, "percentage"),
-            ])
-            if power_entity:
-                entities.extend([
-                    PVStringSensor(ctrl, name, i, string_name, string_entity, power_entity, installed_kwp, "peak"),
-                    PVStringSensor(ctrl, name, i, string_name, string_entity, power_entity, installed_kwp, "daily_peak"),
-                ])
-            # Specific yield + Performance Ratio (needs kWp or Power entity)
-            if installed_kwp > 0 or power_entity:
-                entities.append(PVStringSensor(ctrl, name, i, string_name, string_entity, power_entity, installed_kwp, "specific_yield"))
-            if power_entity and installed_kwp > 0:
-                entities.append(PVStringSensor(ctrl, name, i, string_name, string_entity, power_entity, installed_kwp, "performance_ratio"))
-        entities.append(TotalDailyProductionSensor(ctrl, name))
-        if any(p for _, _, p, _ in ctrl.pv_strings):
-            entities.append(TotalPeakSensor(ctrl, name))
-            entities.append(TotalDailyPeakSensor(ctrl, name))
-
-    async_add_entities(entities)
-
-
-class BaseEntity(SensorEntity):
-    """Base class for all sensors."""
-
-    _attr_should_poll = False
-    _attr_has_entity_name = True
+@cache
+def _unique_id_prefix(name: str) -> str:
+    # Do not change unique_id generation logic to prevent breaking changes for existing users
+    uid_name = "".join(c if c.isalnum() else "_" for c in name).lower()
+    return f"{DOMAIN}_{uid_name}"
 
-    def __init__(
-        self,
-        ctrl,
-        name: str,
-        key: str,
-        unit=None,
-        icon=None,
-        state_class=None,
-        device_class=None,
-        entity_category=None,
-        device_type: str = DEVICE_MAIN,
-    ):
-        self.ctrl = ctrl
-        self._base_name = name
-        self._attr_name = key
-        # Do not change unique_id generation logic to prevent breaking changes for existing users
-        uid_name = "".join(c if c.isalnum() else "_" for c in name).lower()
-        self._attr_unique_id = f"{DOMAIN}_{uid_name}_{key.lower().replace(' ', '_')}"
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._attr_device_class = device_class
-        self._attr_entity_category = entity_category
-        self._attr_device_info = get_device_info(name, device_type)
-        self._removed = False
 
-    @property
-    def available(self) -> bool:
-        """Sensor is only available when saved data is restored."""
-        return getattr(self.ctrl, "_restored", True)
-
-    async def async_added_to_hass(self):
-        self._removed = False
-        self.ctrl.register_entity_listener(self._on_ctrl_update)
-
-    async def async_will_remove_from_hass(self):
-        self._removed = True
-        self.ctrl.unregister_entity_listener(self._on_ctrl_update)
-
-    @callback
-    def _on_ctrl_update(self):
-        if not self._removed and self.hass:
-            self.async_write_ha_state()
-
-
-class PVStringSensor(BaseEntity):
-    """Generic sensor for PV String comparison."""
-
-    def __init__(self, ctrl, name: str, string_index: int, string_name: str, entity_id: str, power_entity_id: str | None, installed_kwp: float, sensor_type: str):
-        self._string_entity_id = entity_id
-        self._power_entity_id = power_entity_id
-        self._installed_kwp = installed_kwp
-        self._sensor_type = sensor_type
-
-        # NOTE: Keys are kept in German to maintain unique_id stability
-        uid_suffix_map = {
-            "production": "Produktion",
-            "daily": "Tagesproduktion",
-            "peak": "Peak",
-            "daily_peak": "Peak Heute",
-            "percentage": "Anteil",
-            "specific_yield": "Spez. Ertrag",
-            "performance_ratio": "Performance Ratio",
-        }
-        props_map = {
-            "production": ("kWh", "mdi:solar-panel", SensorStateClass.TOTAL_INCREASING),
-            "daily": ("kWh/Tag", "mdi:weather-sunny", SensorStateClass.MEASUREMENT),
-            "peak": ("kW", "mdi:solar-power-variant", SensorStateClass.MEASUREMENT),
-            "daily_peak": ("kW", "mdi:solar-power-variant-outline", SensorStateClass.MEASUREMENT),
-            "percentage": ("%", "mdi:chart-pie", SensorStateClass.MEASUREMENT),
-            "specific_yield": ("kWh/kWp", "mdi:solar-power-variant-outline", SensorStateClass.MEASUREMENT),
-            "performance_ratio": ("%", "mdi:gauge", SensorStateClass.MEASUREMENT),
-        }
-        uid_suffix = uid_suffix_map[sensor_type]
-        unit, icon, state_class = props_map[sensor_type]
-        key = f"{string_name} {uid_suffix}"
-
-        super().__init__(ctrl, name, key, unit=unit, icon=icon, state_class=state_class, device_type=DEVICE_PV_STRINGS)
-
-    @property
-    def native_value(self):
-        if self._sensor_type == "production":
-            val = self.ctrl.get_string_production_kwh(self._string_entity_id)
-            return round(val, 2) if val else 0.0
-        elif self._sensor_type == "daily":
-            val = self.ctrl.get_string_daily_kwh(self._string_entity_id)
-            return round(val, 2) if val is not None else None
-        elif self._sensor_type == "peak":
-            val = self.ctrl.get_string_peak_kw(self._power_entity_id)
-            return val
-        elif self._sensor_type == "daily_peak":
-            val = self.ctrl.get_string_daily_peak_kw(self._power_entity_id)
-            return val
-        elif self._sensor_type == "specific_yield":
-            kwp = self._installed_kwp
-            if kwp <= 0 and self._power_entity_id:
-                peak_kw = self.ctrl.get_string_peak_kw(self._power_entity_id)
-                kwp = peak_kw if peak_kw else 0.0
-            return self.ctrl.get_string_specific_yield(self._string_entity_id, kwp)
-        elif self._sensor_type == "performance_ratio":
-            return self.ctrl.get_string_performance_ratio(self._power_entity_id, self._installed_kwp)
-        else:  # percentage
-            val = self.ctrl.get_string_percentage(self._string_entity_id)
-            return round(val, 1) if val is not None else None
-
-
-class TotalDailyProductionSensor(BaseEntity):
-    """Average daily production of all PV strings."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(ctrl, name, "Gesamt Tagesproduktion", unit="kWh/Tag", icon="mdi:weather-sunny",
-                         state_class=SensorStateClass.MEASUREMENT, device_type=DEVICE_PV_STRINGS)
-
-    @property
-    def native_value(self):
-        return self.ctrl.get_total_daily_production_kwh()
-
-
-class TotalPeakSensor(BaseEntity):
-    """Total Peak of all PV strings."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(ctrl, name, "Gesamt Peak", unit="kW", icon="mdi:solar-power-variant",
-                         state_class=SensorStateClass.MEASUREMENT, device_type=DEVICE_PV_STRINGS)
-
-    @property
-    def native_value(self):
-        return self.ctrl.get_total_peak_kw()
-
-
-class TotalDailyPeakSensor(BaseEntity):
-    """Total Peak today of all PV strings."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(ctrl, name, "Gesamt Peak Heute", unit="kW", icon="mdi:solar-power-variant-outline",
-                         state_class=SensorStateClass.MEASUREMENT, device_type=DEVICE_PV_STRINGS)
-
-    @property
-    def native_value(self):
-        return self.ctrl.get_total_daily_peak_kw()
+def sensor_unique_id(name: str, key: str) -> str:
+    """unique_id of a sensor of the entry called name (also used by the legacy migration)."""
+    return f"{_unique_id_prefix(name)}_{key.lower().replace(' ', '_')}"
 
 
 # =============================================================================
-# MAIN SENSORS
+# ENTITY DESCRIPTIONS
 # =============================================================================
 
 
-class AmortisationPercentSensor(BaseEntity):
-    """Amortization in percent."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amortisation",
-            unit="%",
-            icon="mdi:percent-circle",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.amortisation_percent, 2)
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "total_savings": f"{self.ctrl.total_savings:.2f}€",
-            "installation_cost": f"{self.ctrl.installation_cost:.2f}€",
-            "remaining": f"{self.ctrl.remaining_cost:.2f}€",
-            "is_amortised": self.ctrl.is_amortised,
-        }
-
-
-class TotalSavingsSensor(BaseEntity, RestoreEntity):
-    """Total savings in currency."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Gesamtersparnis",
-            unit="€",
-            icon="mdi:cash-plus",
-            state_class=SensorStateClass.TOTAL,
-            device_class=SensorDeviceClass.MONETARY,
-        )
-
-    async def async_added_to_hass(self):
-        await super().async_added_to_hass()
-
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in ("unknown", "unavailable"):
-            attrs = last_state.attributes or {}
-
-            def safe_float(val, default=0.0):
-                try:
-                    return float(val) if val is not None else default
-                except (ValueError, TypeError):
-                    return default
-
-            restore_data = {
-                "total_self_consumption_kwh": safe_float(attrs.get("tracked_self_consumption_kwh")),
-                "total_feed_in_kwh": safe_float(attrs.get("tracked_feed_in_kwh")),
-                "accumulated_savings_self": safe_float(attrs.get("accumulated_savings_self")),
-                "accumulated_earnings_feed": safe_float(attrs.get("accumulated_earnings_feed")),
-                "first_seen_date": attrs.get("first_seen_date"),
-                "tracked_grid_import_kwh": safe_float(attrs.get("tracked_grid_import_kwh")),
-                "total_grid_import_cost": safe_float(attrs.get("total_grid_import_cost")),
-                "tracked_wp_kwh": safe_float(attrs.get("tracked_wp_kwh")),
-                "wp_first_seen_date": attrs.get("wp_first_seen_date"),
-                "string_tracked_kwh": attrs.get("string_tracked_kwh", {}),
-                "string_first_seen_date": attrs.get("string_first_seen_date"),
-                "string_peak_w": attrs.get("string_peak_w", {}),
-                "daily_grid_import_kwh": safe_float(attrs.get("daily_grid_import_kwh")),
-                "daily_grid_import_cost": safe_float(attrs.get("daily_grid_import_cost")),
-                "daily_feed_in_earnings": safe_float(attrs.get("daily_feed_in_earnings")),
-                "daily_feed_in_kwh": safe_float(attrs.get("daily_feed_in_kwh")),
-                "daily_reset_date": attrs.get("daily_reset_date"),
-                "quota_day_start_meter": safe_float(attrs.get("quota_day_start_meter")),
-                "monthly_grid_import_kwh": safe_float(attrs.get("monthly_grid_import_kwh")),
-                "monthly_grid_import_cost": safe_float(attrs.get("monthly_grid_import_cost")),
-                "monthly_reset_month": attrs.get("monthly_reset_month"),
-                "monthly_reset_year": attrs.get("monthly_reset_year"),
-                "benchmark_start_date": attrs.get("benchmark_start_date"),
-                "benchmark_start_self_consumption": safe_float(attrs.get("benchmark_start_self_consumption")),
-                "benchmark_start_grid_import": safe_float(attrs.get("benchmark_start_grid_import")),
-                "benchmark_start_feed_in": safe_float(attrs.get("benchmark_start_feed_in")),
-            }
-
-            self.ctrl.restore_state(restore_data)
-            self.async_write_ha_state()
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.total_savings, 2)
+@dataclass(frozen=True, kw_only=True)
+class PVSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor. The key is the (German) entity name and part of the unique_id."""
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return {
-            "savings_self_consumption": f"{self.ctrl.savings_self_consumption:.2f}€",
-            "earnings_feed_in": f"{self.ctrl.earnings_feed_in:.2f}€",
-            "tracked_self_consumption_kwh": round(self.ctrl._total_self_consumption_kwh, 4),
-            "tracked_feed_in_kwh": round(self.ctrl._total_feed_in_kwh, 4),
-            "accumulated_savings_self": round(self.ctrl._accumulated_savings_self, 4),
-            "accumulated_earnings_feed": round(self.ctrl._accumulated_earnings_feed, 4),
-            "first_seen_date": self.ctrl._first_seen_date.isoformat() if self.ctrl._first_seen_date else None,
-            "tracked_grid_import_kwh": round(self.ctrl._tracked_grid_import_kwh, 4),
-            "total_grid_import_cost": round(self.ctrl._total_grid_import_cost, 4),
-            "tracked_wp_kwh": round(self.ctrl._tracked_wp_kwh, 4),
-            "wp_first_seen_date": self.ctrl._wp_first_seen_date.isoformat() if self.ctrl._wp_first_seen_date else None,
-            "string_tracked_kwh": self.ctrl._string_tracked_kwh,
-            "string_first_seen_date": self.ctrl._string_first_seen_date.isoformat() if self.ctrl._string_first_seen_date else None,
-            "string_peak_w": self.ctrl._string_peak_w,
-            "string_daily_peak_w": self.ctrl._string_daily_peak_w,
-            "string_daily_peak_date": self.ctrl._string_daily_peak_date.isoformat() if self.ctrl._string_daily_peak_date else None,
-            "daily_grid_import_kwh": round(self.ctrl._daily_grid_import_kwh, 4),
-            "daily_grid_import_cost": round(self.ctrl._daily_grid_import_cost, 4),
-            "daily_feed_in_earnings": round(self.ctrl._daily_feed_in_earnings, 4),
-            "daily_feed_in_kwh": round(self.ctrl._daily_feed_in_kwh, 4),
-            "daily_reset_date": date.today().isoformat(),
-            "quota_day_start_meter": self.ctrl._quota_day_start_meter,
-            "monthly_grid_import_kwh": round(self.ctrl._monthly_grid_import_kwh, 4),
-            "monthly_grid_import_cost": round(self.ctrl._monthly_grid_import_cost, 4),
-            "monthly_reset_month": date.today().month,
-            "monthly_reset_year": date.today().year,
-            "benchmark_start_date": self.ctrl._benchmark_start_date.isoformat() if self.ctrl._benchmark_start_date else None,
-            "benchmark_start_self_consumption": round(self.ctrl._benchmark_start_self_consumption, 4),
-            "benchmark_start_grid_import": round(self.ctrl._benchmark_start_grid_import, 4),
-            "benchmark_start_feed_in": round(self.ctrl._benchmark_start_feed_in, 4),
-            "calculation_method": "incremental (fixed price)",
-        }
+    value_fn: Callable[[Any], Any]
+    icon_fn: Callable[[Any], str] | None = None
+    attrs_fn: Callable[[Any], dict[str, Any]] | None = None
+    # Rebuild the attributes only after one of the update groups changed
+    cache_attributes: bool = False
+    # Live-only attributes, see the attribute policy in BaseEntity
+    unrecorded_attributes: frozenset[str] = frozenset()
+    # Controller update groups this sensor reads (only these trigger a state write)
+    update_groups: frozenset[str] = frozenset({UPDATE_GROUP_ENERGY})
+    # Realtime sensors follow their update groups; periodic and daily sensors are
+    # only written by the controller's tier scheduler (and on full updates)
+    refresh_tier: str = REFRESH_TIER_REALTIME
+    device_type: str = DEVICE_MAIN
 
 
-class RemainingCostSensor(BaseEntity):
-    """Remaining amount until amortization."""
+class PVString(NamedTuple):
+    """One configured PV string as stored in the controller."""
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Restbetrag",
-            unit="€",
-            icon="mdi:cash-minus",
-            state_class=None,
-            device_class=SensorDeviceClass.MONETARY,
-        )
+    name: str
+    entity_id: str
+    power_entity_id: str | None
+    installed_kwp: float
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.remaining_cost, 2)
 
-    @property
-    def icon(self) -> str:
-        if self.ctrl.is_amortised:
-            return "mdi:cash-check"
-        return "mdi:cash-minus"
+@dataclass(frozen=True, kw_only=True)
+class PVStringSensorEntityDescription(PVSensorEntityDescription):
+    """Describes a per-string sensor. The key is the suffix after the string name."""
 
+    value_fn: Callable[[Any, PVString], Any]
+    exists_fn: Callable[[PVString], bool] = lambda string: True
+    device_type: str = DEVICE_PV_STRINGS
 
-class StatusSensor(BaseEntity):
-    """Status text (e.g., '45.2% amortized')."""
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Status",
-            icon="mdi:solar-power-variant",
-        )
+def _round(value: float | None, digits: int) -> float | None:
+    return None if value is None else round(value, digits)
 
-    @property
-    def native_value(self) -> str:
-        return self.ctrl.status_text
 
-    @property
-    def icon(self) -> str:
-        if self.ctrl.is_amortised:
-            return "mdi:party-popper"
-        elif self.ctrl.amortisation_percent >= 75:
-            return "mdi:trending-up"
-        elif self.ctrl.amortisation_percent >= 50:
-            return "mdi:solar-power-variant"
+def _status_icon(ctrl) -> str:
+    if ctrl.is_amortised:
+        return "mdi:party-popper"
+    elif ctrl.amortisation_percent >= 75:
+        return "mdi:trending-up"
+    elif ctrl.amortisation_percent >= 50:
+        return "mdi:solar-power-variant"
+    else:
+        return "mdi:solar-panel"
+
+
+def _status_attributes(ctrl) -> dict[str, Any]:
+    attrs = {
+        "percent": f"{ctrl.amortisation_percent:.1f}%",
+        "total_savings": f"{ctrl.total_savings:.2f}€",
+        "remaining": f"{ctrl.remaining_cost:.2f}€",
+    }
+    if ctrl.is_amortised:
+        profit = ctrl.total_savings - ctrl.installation_cost
+        attrs["profit"] = f"{profit:.2f}€"
+    return attrs
+
+
+def _remaining_days_attributes(ctrl) -> dict[str, Any]:
+    remaining = ctrl.estimated_remaining_days
+    if remaining is None:
+        return {"status": "Calculation not possible"}
+
+    years = remaining // 365
+    months = (remaining % 365) // 30
+    days = remaining % 30
+
+    parts = []
+    if years > 0:
+        parts.append(f"{years} year{'s' if years > 1 else ''}")
+    if months > 0:
+        parts.append(f"{months} month{'s' if months > 1 else ''}")
+    if days > 0 or not parts:
+        parts.append(f"{days} day{'s' if days != 1 else ''}")
+
+    return {
+        "formatted": ", ".join(parts),
+        "years": years,
+        "months": months,
+        "days": days,
+    }
+
+
+def _co2_attributes(ctrl) -> dict[str, Any]:
+    kg = ctrl.co2_saved_kg
+    return {
+        "tonnes": f"{kg / 1000:.2f} t",
+        "trees_equivalent": int(kg / 21),
+        "car_km_equivalent": int(kg / 0.12),
+    }
+
+
+def _recovered_energy_attributes(ctrl) -> dict[str, Any]:
+    gap = ctrl.last_gap or {}
+    return {
+        "last_gap_start": gap.get("start"),
+        "last_gap_end": gap.get("end"),
+        "last_gap_kwh": gap.get("kwh"),
+        "last_gap_eur": gap.get("eur"),
+    }
+
+
+def _quota_forecast_icon(ctrl) -> str:
+    forecast = ctrl.quota_forecast_kwh
+    if forecast is None:
+        return "mdi:crystal-ball"
+    if forecast <= ctrl.quota_yearly_kwh:
+        return "mdi:trending-down"
+    return "mdi:trending-up"
+
+
+def _quota_forecast_attributes(ctrl) -> dict[str, Any]:
+    forecast = ctrl.quota_forecast_kwh
+    attrs = {
+        "quota_kwh": ctrl.quota_yearly_kwh,
+    }
+    if forecast is not None:
+        diff = forecast - ctrl.quota_yearly_kwh
+        attrs["forecast_diff_kwh"] = round(diff, 0)
+        if diff > 0:
+            attrs["evaluation"] = f"Expected {diff:.0f} kWh over quota"
         else:
-            return "mdi:solar-panel"
-
-    @property
-    def extra_state_attributes(self):
-        attrs = {
-            "percent": f"{self.ctrl.amortisation_percent:.1f}%",
-            "total_savings": f"{self.ctrl.total_savings:.2f}€",
-            "remaining": f"{self.ctrl.remaining_cost:.2f}€",
-        }
-        if self.ctrl.is_amortised:
-            profit = self.ctrl.total_savings - self.ctrl.installation_cost
-            attrs["profit"] = f"{profit:.2f}€"
-        return attrs
-
-
-# =============================================================================
-# ENERGY SENSORS
-# =============================================================================
-
-
-class SelfConsumptionSensor(BaseEntity):
-    """Self consumption in kWh."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Eigenverbrauch",
-            unit="kWh",
-            icon="mdi:home-lightning-bolt",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.self_consumption_kwh, 2)
-
-
-class FeedInSensor(BaseEntity):
-    """Grid export in kWh."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Einspeisung",
-            unit="kWh",
-            icon="mdi:transmission-tower-export",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.feed_in_kwh, 2)
-
-
-class PVProductionSensor(BaseEntity):
-    """PV production in kWh."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "PV Produktion",
-            unit="kWh",
-            icon="mdi:solar-power",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.pv_production_kwh, 2)
-
-
-# =============================================================================
-# FINANCIAL SENSORS
-# =============================================================================
-
-
-class SavingsSelfConsumptionSensor(BaseEntity):
-    """Savings through self consumption."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Ersparnis Eigenverbrauch",
-            unit="€",
-            icon="mdi:piggy-bank",
-            state_class=SensorStateClass.TOTAL,
-            device_class=SensorDeviceClass.MONETARY,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.savings_self_consumption, 2)
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "self_consumption_kwh": f"{self.ctrl.self_consumption_kwh:.2f} kWh",
-            "fixed_price": f"{self.ctrl.fixed_price_ct:.2f} ct/kWh",
+            attrs["evaluation"] = f"Expected {abs(diff):.0f} kWh under quota"
+    return attrs
+
+
+def _quota_period_attributes(ctrl) -> dict[str, Any]:
+    start = ctrl.quota_start_date
+    end = ctrl.quota_end_date
+    return {
+        "period_start": start.isoformat() if start else None,
+        "period_end": end.isoformat() if end else None,
+        "days_elapsed": ctrl.quota_days_elapsed,
+        "days_total": ctrl.quota_days_total,
+    }
+
+
+def _battery_icon(ctrl) -> str:
+    soc = ctrl.battery_soc
+    if soc is None:
+        return "mdi:battery-unknown"
+    if soc >= 95:
+        return "mdi:battery"
+    if soc < 5:
+        return "mdi:battery-outline"
+    # 5..94 % -> mdi:battery-10 .. mdi:battery-90 (rounded to the nearest ten)
+    return f"mdi:battery-{int((soc + 5) // 10) * 10}"
+
+
+def _benchmark_score_icon(ctrl) -> str:
+    score = ctrl.benchmark_efficiency_score
+    if score is None:
+        return "mdi:star-outline"
+    if score >= 60:
+        return "mdi:star-circle"
+    if score >= 30:
+        return "mdi:star-half-full"
+    return "mdi:star-outline"
+
+
+def _string_specific_yield(ctrl, string: PVString) -> float | None:
+    kwp = string.installed_kwp
+    if kwp <= 0 and string.power_entity_id:
+        peak_kw = ctrl.get_string_peak_kw(string.power_entity_id)
+        kwp = peak_kw if peak_kw else 0.0
+    return ctrl.get_string_specific_yield(string.entity_id, kwp)
+
+
+# === AMORTISATION, ENERGY, FINANCIAL, STATISTICS, ENVIRONMENT, DIAGNOSTICS, DAILY COSTS, ROI ===
+MAIN_SENSORS: tuple[PVSensorEntityDescription, ...] = (
+    PVSensorEntityDescription(
+        key="Amortisation",
+        native_unit_of_measurement="%",
+        icon="mdi:percent-circle",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: round(ctrl.amortisation_percent, 2),
+        attrs_fn=lambda ctrl: {
+            "total_savings": f"{ctrl.total_savings:.2f}€",
+            "installation_cost": f"{ctrl.installation_cost:.2f}€",
+            "remaining": f"{ctrl.remaining_cost:.2f}€",
+            "is_amortised": ctrl.is_amortised,
+        },
+        unrecorded_attributes=frozenset({"total_savings", "installation_cost", "remaining"}),
+    ),
+    PVSensorEntityDescription(
+        key="Amort Restbetrag",
+        native_unit_of_measurement="€",
+        device_class=SensorDeviceClass.MONETARY,
+        value_fn=lambda ctrl: round(ctrl.remaining_cost, 2),
+        icon_fn=lambda ctrl: "mdi:cash-check" if ctrl.is_amortised else "mdi:cash-minus",
+    ),
+    PVSensorEntityDescription(
+        key="Amort Status",
+        value_fn=lambda ctrl: ctrl.status_text,
+        icon_fn=_status_icon,
+        attrs_fn=_status_attributes,
+        unrecorded_attributes=frozenset({"percent", "total_savings", "remaining", "profit"}),
+    ),
+    PVSensorEntityDescription(
+        key="Amort Datum",
+        device_class=SensorDeviceClass.DATE,
+        value_fn=lambda ctrl: ctrl.estimated_payback_date,
+        icon_fn=lambda ctrl: "mdi:calendar-check" if ctrl.is_amortised else "mdi:calendar-question",
+        refresh_tier=REFRESH_TIER_DAILY,
+    ),
+    PVSensorEntityDescription(
+        key="Amort Restlaufzeit",
+        native_unit_of_measurement="Tage",
+        icon="mdi:timer-sand",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: ctrl.estimated_remaining_days,
+        attrs_fn=_remaining_days_attributes,
+        cache_attributes=True,
+        refresh_tier=REFRESH_TIER_DAILY,
+    ),
+    PVSensorEntityDescription(
+        key="Eigenverbrauch",
+        native_unit_of_measurement="kWh",
+        icon="mdi:home-lightning-bolt",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=SensorDeviceClass.ENERGY,
+        value_fn=lambda ctrl: round(ctrl.self_consumption_kwh, 2),
+    ),
+    PVSensorEntityDescription(
+        key="Einspeisung",
+        native_unit_of_measurement="kWh",
+        icon="mdi:transmission-tower-export",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=SensorDeviceClass.ENERGY,
+        value_fn=lambda ctrl: round(ctrl.feed_in_kwh, 2),
+    ),
+    PVSensorEntityDescription(
+        key="Eigenverbrauchsquote",
+        native_unit_of_measurement="%",
+        icon="mdi:home-percent",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: round(ctrl.self_consumption_ratio, 1),
+    ),
+    PVSensorEntityDescription(
+        key="Autarkiegrad",
+        native_unit_of_measurement="%",
+        icon="mdi:home-battery",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.autarky_rate, 1),
+    ),
+    PVSensorEntityDescription(
+        key="Ersparnis Eigenverbrauch",
+        native_unit_of_measurement="€",
+        icon="mdi:piggy-bank",
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        value_fn=lambda ctrl: round(ctrl.savings_self_consumption, 2),
+        attrs_fn=lambda ctrl: {
+            "self_consumption_kwh": f"{ctrl.self_consumption_kwh:.2f} kWh",
+            "fixed_price": f"{ctrl.fixed_price_ct:.2f} ct/kWh",
             "calculation": "Self Consumption × Fixed Price",
-        }
-
+        },
+        unrecorded_attributes=frozenset({"self_consumption_kwh"}),
+    ),
+    PVSensorEntityDescription(
+        key="Einnahmen Einspeisung",
+        native_unit_of_measurement="€",
+        icon="mdi:cash-plus",
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        value_fn=lambda ctrl: round(ctrl.earnings_feed_in, 2),
+        attrs_fn=lambda ctrl: {
+            "feed_in_kwh": f"{ctrl.feed_in_kwh:.2f} kWh",
+            "current_tariff": f"{ctrl.current_feed_in_tariff:.4f} €/kWh",
+        },
+        unrecorded_attributes=frozenset({"feed_in_kwh"}),
+        update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_PRICES}),
+    ),
+    PVSensorEntityDescription(
+        key="Amort Ersparnis/Tag",
+        native_unit_of_measurement="€/Tag",
+        icon="mdi:calendar-today",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: round(ctrl.average_daily_savings, 2),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+    ),
+    PVSensorEntityDescription(
+        key="Amort Ersparnis/Monat",
+        native_unit_of_measurement="€/Monat",
+        icon="mdi:calendar-month",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: round(ctrl.average_monthly_savings, 2),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+    ),
+    PVSensorEntityDescription(
+        key="Amort Ersparnis/Jahr",
+        native_unit_of_measurement="€/Jahr",
+        icon="mdi:calendar",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: round(ctrl.average_yearly_savings, 2),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+    ),
+    PVSensorEntityDescription(
+        key="Amort Tage",
+        native_unit_of_measurement="Tage",
+        icon="mdi:calendar-clock",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda ctrl: ctrl.days_since_installation,
+        refresh_tier=REFRESH_TIER_DAILY,
+    ),
+    PVSensorEntityDescription(
+        key="CO2 Ersparnis",
+        native_unit_of_measurement="kg",
+        icon="mdi:molecule-co2",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda ctrl: round(ctrl.co2_saved_kg, 1),
+        attrs_fn=_co2_attributes,
+        unrecorded_attributes=frozenset({"tonnes", "trees_equivalent", "car_km_equivalent"}),
+    ),
+    PVSensorEntityDescription(
+        key="Preis Fix",
+        native_unit_of_measurement="ct/kWh",
+        icon="mdi:currency-eur",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda ctrl: round(ctrl.fixed_price_ct, 2),
+        update_groups=frozenset({UPDATE_GROUP_CONFIG}),
+        device_type=DEVICE_PRICES,
+    ),
+    # EUR/kWh for Energy Dashboard
+    PVSensorEntityDescription(
+        key="Preis Brutto",
+        native_unit_of_measurement="EUR/kWh",
+        icon="mdi:currency-eur",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: round(ctrl.gross_price, 4),
+        update_groups=frozenset({UPDATE_GROUP_PRICES}),
+        device_type=DEVICE_PRICES,
+    ),
+    PVSensorEntityDescription(
+        key="Preis Einspeisung",
+        native_unit_of_measurement="€/kWh",
+        icon="mdi:currency-eur",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda ctrl: round(ctrl.current_feed_in_tariff, 4),
+        update_groups=frozenset({UPDATE_GROUP_PRICES}),
+        device_type=DEVICE_PRICES,
+    ),
+    PVSensorEntityDescription(
+        key="PV Produktion",
+        native_unit_of_measurement="kWh",
+        icon="mdi:solar-power",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=SensorDeviceClass.ENERGY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda ctrl: round(ctrl.pv_production_kwh, 2),
+    ),
+    PVSensorEntityDescription(
+        key="Amort Kosten",
+        native_unit_of_measurement="€",
+        icon="mdi:cash",
+        device_class=SensorDeviceClass.MONETARY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda ctrl: round(ctrl.installation_cost, 2),
+        update_groups=frozenset({UPDATE_GROUP_CONFIG}),
+    ),
+    # Energy added after restarts from the downtime between checkpoint and start
+    PVSensorEntityDescription(
+        key="Nachgetragene Energie",
+        native_unit_of_measurement="kWh",
+        icon="mdi:backup-restore",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda ctrl: round(ctrl.recovered_kwh, 2),
+        attrs_fn=_recovered_energy_attributes,
+    ),
+    PVSensorEntityDescription(
+        key="Tages Einspeisung",
+        native_unit_of_measurement="€",
+        icon="mdi:transmission-tower-export",
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        value_fn=lambda ctrl: round(ctrl.daily_feed_in_earnings, 2),
+        attrs_fn=lambda ctrl: {
+            "amount_kwh": round(ctrl.daily_feed_in_kwh, 2),
+            "tariff_ct": f"{ctrl.current_feed_in_tariff * 100:.2f}",
+        },
+        unrecorded_attributes=frozenset({"amount_kwh"}),
+        update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_PRICES}),
+        device_type=DEVICE_PRICES,
+    ),
+    PVSensorEntityDescription(
+        key="Tages Netzbezug",
+        native_unit_of_measurement="€",
+        icon="mdi:transmission-tower-import",
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        value_fn=lambda ctrl: round(ctrl.daily_grid_import_cost, 2),
+        attrs_fn=lambda ctrl: {
+            "amount_kwh": round(ctrl.daily_grid_import_kwh, 2),
+            "average_ct": round(ctrl.daily_average_price_ct, 2) if ctrl.daily_average_price_ct else None,
+        },
+        unrecorded_attributes=frozenset({"amount_kwh", "average_ct"}),
+        device_type=DEVICE_PRICES,
+    ),
+    # Net electricity cost today (import minus export)
+    PVSensorEntityDescription(
+        key="Tages Stromkosten",
+        native_unit_of_measurement="€",
+        icon="mdi:cash-register",
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        value_fn=lambda ctrl: round(ctrl.daily_net_electricity_cost, 2),
+        attrs_fn=lambda ctrl: {
+            "import_eur": round(ctrl.daily_grid_import_cost, 2),
+            "export_eur": round(ctrl.daily_feed_in_earnings, 2),
+        },
+        unrecorded_attributes=frozenset({"import_eur", "export_eur"}),
+        device_type=DEVICE_PRICES,
+    ),
+    PVSensorEntityDescription(
+        key="ROI",
+        native_unit_of_measurement="%",
+        icon="mdi:chart-line",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.roi_percent, 2),
+    ),
+    PVSensorEntityDescription(
+        key="ROI pro Jahr",
+        native_unit_of_measurement="%/Year",
+        icon="mdi:chart-timeline-variant",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.annual_roi_percent, 2),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+    ),
+)
 
-class EarningsFeedInSensor(BaseEntity):
-    """Earnings through feed-in."""
+TOTAL_SAVINGS_SENSOR = PVSensorEntityDescription(
+    key="Gesamtersparnis",
+    native_unit_of_measurement="€",
+    icon="mdi:cash-plus",
+    state_class=SensorStateClass.TOTAL,
+    device_class=SensorDeviceClass.MONETARY,
+    value_fn=lambda ctrl: round(ctrl.total_savings, 2),
+    attrs_fn=lambda ctrl: {
+        "savings_self_consumption": f"{ctrl.savings_self_consumption:.2f}€",
+        "earnings_feed_in": f"{ctrl.earnings_feed_in:.2f}€",
+        "first_seen_date": ctrl._first_seen_date.isoformat() if ctrl._first_seen_date else None,
+        "calculation_method": "incremental (fixed price)",
+    },
+    cache_attributes=True,
+    unrecorded_attributes=frozenset({"savings_self_consumption", "earnings_feed_in"}),
+)
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Einnahmen Einspeisung",
-            unit="€",
-            icon="mdi:cash-plus",
-            state_class=SensorStateClass.TOTAL,
-            device_class=SensorDeviceClass.MONETARY,
-        )
+CONFIGURATION_SENSOR = PVSensorEntityDescription(
+    key="Konfiguration",
+    icon="mdi:cog",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    value_fn=lambda ctrl: None,  # computed from the monitored entities' health
+    unrecorded_attributes=frozenset({"backfill"}),
+    update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_PRICES}),
+)
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.earnings_feed_in, 2)
+QUOTA_SENSORS: tuple[PVSensorEntityDescription, ...] = (
+    PVSensorEntityDescription(
+        key="Kontingent Verbleibend",
+        native_unit_of_measurement="kWh",
+        icon="mdi:lightning-bolt",
+        value_fn=lambda ctrl: round(ctrl.quota_remaining_kwh, 1),
+        attrs_fn=lambda ctrl: {
+            "yearly_quota_kwh": ctrl.quota_yearly_kwh,
+            "consumed_kwh": round(ctrl.quota_consumed_kwh, 1),
+            "monthly_rate_eur": ctrl.quota_monthly_rate if ctrl.quota_monthly_rate > 0 else None,
+        },
+        unrecorded_attributes=frozenset({"consumed_kwh"}),
+        device_type=DEVICE_QUOTA,
+    ),
+    PVSensorEntityDescription(
+        key="Kontingent Verbrauch",
+        native_unit_of_measurement="%",
+        icon="mdi:gauge",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: round(ctrl.quota_consumed_percent, 1),
+        device_type=DEVICE_QUOTA,
+    ),
+    PVSensorEntityDescription(
+        key="Kontingent Tagesbudget",
+        native_unit_of_measurement="kWh/Tag",
+        icon="mdi:calendar-today",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.quota_daily_budget_kwh, 1),
+        device_type=DEVICE_QUOTA,
+    ),
+    # Projected consumption at period end
+    PVSensorEntityDescription(
+        key="Kontingent Prognose",
+        native_unit_of_measurement="kWh",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.quota_forecast_kwh, 0),
+        icon_fn=_quota_forecast_icon,
+        attrs_fn=_quota_forecast_attributes,
+        cache_attributes=True,
+        unrecorded_attributes=frozenset({"forecast_diff_kwh", "evaluation"}),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_QUOTA,
+    ),
+    PVSensorEntityDescription(
+        key="Kontingent Restlaufzeit",
+        native_unit_of_measurement="Tage",
+        icon="mdi:calendar-clock",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: ctrl.quota_days_remaining,
+        attrs_fn=_quota_period_attributes,
+        refresh_tier=REFRESH_TIER_DAILY,
+        device_type=DEVICE_QUOTA,
+    ),
+    # How much may still be consumed today
+    PVSensorEntityDescription(
+        key="Kontingent Heute Verbleibend",
+        native_unit_of_measurement="kWh",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.quota_today_remaining_kwh, 1),
+        icon_fn=lambda ctrl: (
+            "mdi:clock-alert" if (ctrl.quota_today_remaining_kwh or 0) < 0 else "mdi:clock-check"
+        ),
+        attrs_fn=lambda ctrl: {
+            "daily_budget_kwh": _round(ctrl.quota_daily_budget_kwh, 1),
+            "consumed_today_kwh": round(ctrl.daily_grid_import_kwh, 1),
+        },
+        unrecorded_attributes=frozenset({"consumed_today_kwh"}),
+        device_type=DEVICE_QUOTA,
+    ),
+    PVSensorEntityDescription(
+        key="Kontingent Status",
+        value_fn=lambda ctrl: ctrl.quota_status_text,
+        icon_fn=lambda ctrl: "mdi:text-box-check" if ctrl.quota_reserve_kwh >= 0 else "mdi:text-box-remove",
+        device_type=DEVICE_QUOTA,
+    ),
+)
 
-    @property
-    def extra_state_attributes(self):
-        return {
-            "feed_in_kwh": f"{self.ctrl.feed_in_kwh:.2f} kWh",
-            "current_tariff": f"{self.ctrl.current_feed_in_tariff:.4f} €/kWh",
-        }
+BATTERY_SENSORS: tuple[PVSensorEntityDescription, ...] = (
+    PVSensorEntityDescription(
+        key="Ladestand",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.battery_soc, 1),
+        icon_fn=_battery_icon,
+        update_groups=frozenset({UPDATE_GROUP_BATTERY}),
+        device_type=DEVICE_BATTERY,
+    ),
+    PVSensorEntityDescription(
+        key="Ladung Gesamt",
+        native_unit_of_measurement="kWh",
+        icon="mdi:battery-charging",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=SensorDeviceClass.ENERGY,
+        value_fn=lambda ctrl: _round(ctrl.battery_charge_total, 2),
+        update_groups=frozenset({UPDATE_GROUP_BATTERY}),
+        device_type=DEVICE_BATTERY,
+    ),
+    PVSensorEntityDescription(
+        key="Entladung Gesamt",
+        native_unit_of_measurement="kWh",
+        icon="mdi:battery-arrow-down",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_class=SensorDeviceClass.ENERGY,
+        value_fn=lambda ctrl: _round(ctrl.battery_discharge_total, 2),
+        update_groups=frozenset({UPDATE_GROUP_BATTERY}),
+        device_type=DEVICE_BATTERY,
+    ),
+    PVSensorEntityDescription(
+        key="Effizienz",
+        native_unit_of_measurement="%",
+        icon="mdi:battery-heart-variant",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.battery_efficiency, 1),
+        update_groups=frozenset({UPDATE_GROUP_BATTERY}),
+        device_type=DEVICE_BATTERY,
+    ),
+    # Estimated full cycles
+    PVSensorEntityDescription(
+        key="Zyklen",
+        native_unit_of_measurement="Cycles",
+        icon="mdi:battery-sync",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda ctrl: _round(ctrl.battery_cycles_estimate, 1),
+        update_groups=frozenset({UPDATE_GROUP_BATTERY}),
+        device_type=DEVICE_BATTERY,
+    ),
+)
 
+BENCHMARK_SENSORS: tuple[PVSensorEntityDescription, ...] = (
+    # Reference consumption
+    PVSensorEntityDescription(
+        key="Haus Durchschnitt",
+        native_unit_of_measurement="kWh/Jahr",
+        icon="mdi:home-group",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: ctrl.benchmark_avg_consumption_kwh,
+        update_groups=frozenset({UPDATE_GROUP_CONFIG}),
+        device_type=DEVICE_BENCHMARK,
+    ),
+    # Total consumption including heat pump, extrapolated
+    PVSensorEntityDescription(
+        key="Gesamtverbrauch",
+        native_unit_of_measurement="kWh/Jahr",
+        icon="mdi:home-lightning-bolt",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_own_annual_consumption_kwh, 0),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    PVSensorEntityDescription(
+        key="Netz Bezug",
+        native_unit_of_measurement="kWh/Jahr",
+        icon="mdi:transmission-tower-import",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_annual_grid_import_kwh, 0),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    PVSensorEntityDescription(
+        key="PV Produktion",
+        native_unit_of_measurement="kWh/Jahr",
+        icon="mdi:solar-power",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_annual_pv_production_kwh, 0),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    # Own consumption vs. average in %
+    PVSensorEntityDescription(
+        key="Haus Vergleich",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_consumption_vs_avg, 1),
+        icon_fn=lambda ctrl: (
+            "mdi:alert" if (ctrl.benchmark_consumption_vs_avg or 0) > 0 else "mdi:check-circle"
+        ),
+        update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_HEATPUMP}),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    PVSensorEntityDescription(
+        key="PV CO2 Vermieden",
+        native_unit_of_measurement="kg/Jahr",
+        icon="mdi:molecule-co2",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_co2_avoided_kg, 1),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    # Efficiency score, 0-100 points
+    PVSensorEntityDescription(
+        key="Effizienz Score",
+        native_unit_of_measurement="Points",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: ctrl.benchmark_efficiency_score,
+        icon_fn=_benchmark_score_icon,
+        update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_HEATPUMP, UPDATE_GROUP_STRING_POWER}),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    PVSensorEntityDescription(
+        key="Bewertung",
+        icon="mdi:trophy",
+        value_fn=lambda ctrl: ctrl.benchmark_rating,
+        update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_HEATPUMP, UPDATE_GROUP_STRING_POWER}),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+)
 
-# =============================================================================
-# EFFICIENCY SENSORS
-# =============================================================================
+# Specific yield in kWh/kWp, only with PV strings (for the peak sum)
+BENCHMARK_SPECIFIC_YIELD_SENSOR = PVSensorEntityDescription(
+    key="PV Ertrag",
+    native_unit_of_measurement="kWh/kWp",
+    icon="mdi:solar-power-variant-outline",
+    state_class=SensorStateClass.MEASUREMENT,
+    value_fn=lambda ctrl: _round(ctrl.benchmark_specific_yield, 0),
+    update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_STRING_POWER}),
+    refresh_tier=REFRESH_TIER_PERIODIC,
+    device_type=DEVICE_BENCHMARK,
+)
 
+HEATPUMP_SENSORS: tuple[PVSensorEntityDescription, ...] = (
+    PVSensorEntityDescription(
+        key="WP Durchschnitt",
+        native_unit_of_measurement="kWh/Jahr",
+        icon="mdi:heat-pump",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: ctrl.benchmark_avg_heatpump_kwh,
+        update_groups=frozenset({UPDATE_GROUP_CONFIG}),
+        device_type=DEVICE_BENCHMARK,
+    ),
+    PVSensorEntityDescription(
+        key="WP Verbrauch",
+        native_unit_of_measurement="kWh/Jahr",
+        icon="mdi:heat-pump-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_own_heatpump_kwh, 0),
+        update_groups=frozenset({UPDATE_GROUP_HEATPUMP}),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    PVSensorEntityDescription(
+        key="WP Vergleich",
+        native_unit_of_measurement="%",
+        icon="mdi:heat-pump",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_heatpump_vs_avg, 1),
+        update_groups=frozenset({UPDATE_GROUP_HEATPUMP}),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+    # Household consumption without heat pump, extrapolated
+    PVSensorEntityDescription(
+        key="Haus Verbrauch",
+        native_unit_of_measurement="kWh/Jahr",
+        icon="mdi:home-lightning-bolt-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: _round(ctrl.benchmark_household_consumption_kwh, 0),
+        update_groups=frozenset({UPDATE_GROUP_ENERGY, UPDATE_GROUP_HEATPUMP}),
+        refresh_tier=REFRESH_TIER_PERIODIC,
+        device_type=DEVICE_BENCHMARK,
+    ),
+)
 
-class SelfConsumptionRatioSensor(BaseEntity):
-    """Self consumption ratio in percent."""
+# NOTE: Keys are kept in German to maintain unique_id stability
+PV_STRING_SENSORS: tuple[PVStringSensorEntityDescription, ...] = (
+    PVStringSensorEntityDescription(
+        key="Produktion",
+        native_unit_of_measurement="kWh",
+        icon="mdi:solar-panel",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda ctrl, string: round(ctrl.get_string_production_kwh(string.entity_id) or 0.0, 2),
+        update_groups=frozenset({UPDATE_GROUP_STRINGS}),
+    ),
+    PVStringSensorEntityDescription(
+        key="Tagesproduktion",
+        native_unit_of_measurement="kWh/Tag",
+        icon="mdi:weather-sunny",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl, string: _round(ctrl.get_string_daily_kwh(string.entity_id), 2),
+        update_groups=frozenset({UPDATE_GROUP_STRINGS}),
+    ),
+    PVStringSensorEntityDescription(
+        key="Anteil",
+        native_unit_of_measurement="%",
+        icon="mdi:chart-pie",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl, string: _round(ctrl.get_string_percentage(string.entity_id), 1),
+        update_groups=frozenset({UPDATE_GROUP_STRINGS}),
+    ),
+    PVStringSensorEntityDescription(
+        key="Peak",
+        native_unit_of_measurement="kW",
+        icon="mdi:solar-power-variant",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl, string: ctrl.get_string_peak_kw(string.power_entity_id),
+        exists_fn=lambda string: bool(string.power_entity_id),
+        update_groups=frozenset({UPDATE_GROUP_STRING_POWER}),
+    ),
+    PVStringSensorEntityDescription(
+        key="Peak Heute",
+        native_unit_of_measurement="kW",
+        icon="mdi:solar-power-variant-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl, string: ctrl.get_string_daily_peak_kw(string.power_entity_id),
+        exists_fn=lambda string: bool(string.power_entity_id),
+        update_groups=frozenset({UPDATE_GROUP_STRING_POWER}),
+    ),
+    # Needs kWp or a power entity
+    PVStringSensorEntityDescription(
+        key="Spez. Ertrag",
+        native_unit_of_measurement="kWh/kWp",
+        icon="mdi:solar-power-variant-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_string_specific_yield,
+        exists_fn=lambda string: string.installed_kwp > 0 or bool(string.power_entity_id),
+        update_groups=frozenset({UPDATE_GROUP_STRINGS, UPDATE_GROUP_STRING_POWER}),
+    ),
+    PVStringSensorEntityDescription(
+        key="Performance Ratio",
+        native_unit_of_measurement="%",
+        icon="mdi:gauge",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl, string: ctrl.get_string_performance_ratio(string.power_entity_id, string.installed_kwp),
+        exists_fn=lambda string: bool(string.power_entity_id) and string.installed_kwp > 0,
+        update_groups=frozenset({UPDATE_GROUP_STRING_POWER}),
+    ),
+)
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Eigenverbrauchsquote",
-            unit="%",
-            icon="mdi:home-percent",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
+PV_STRING_TOTAL_PRODUCTION_SENSOR = PVSensorEntityDescription(
+    key="Gesamt Tagesproduktion",
+    native_unit_of_measurement="kWh/Tag",
+    icon="mdi:weather-sunny",
+    state_class=SensorStateClass.MEASUREMENT,
+    value_fn=lambda ctrl: ctrl.get_total_daily_production_kwh(),
+    update_groups=frozenset({UPDATE_GROUP_STRINGS}),
+    device_type=DEVICE_PV_STRINGS,
+)
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.self_consumption_ratio, 1)
+# Only if at least one string has a power entity
+PV_STRING_TOTAL_PEAK_SENSORS: tuple[PVSensorEntityDescription, ...] = (
+    PVSensorEntityDescription(
+        key="Gesamt Peak",
+        native_unit_of_measurement="kW",
+        icon="mdi:solar-power-variant",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: ctrl.get_total_peak_kw(),
+        update_groups=frozenset({UPDATE_GROUP_STRING_POWER}),
+        device_type=DEVICE_PV_STRINGS,
+    ),
+    PVSensorEntityDescription(
+        key="Gesamt Peak Heute",
+        native_unit_of_measurement="kW",
+        icon="mdi:solar-power-variant-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda ctrl: ctrl.get_total_daily_peak_kw(),
+        update_groups=frozenset({UPDATE_GROUP_STRING_POWER}),
+        device_type=DEVICE_PV_STRINGS,
+    ),
+)
 
 
-class AutarkyRateSensor(BaseEntity):
-    """Autarky rate in percent."""
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities
+):
+    """Setup sensors."""
+    ctrl = hass.data[DOMAIN][entry.entry_id][DATA_CTRL]
+    name = entry.data.get(CONF_NAME, "PV Fixpreis")
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Autarkiegrad",
-            unit="%",
-            icon="mdi:home-battery",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
+    configuration = ConfigurationDiagnosticSensor(ctrl, name, entry)
+    entities: list[SensorEntity] = [
+        TotalSavingsSensor(ctrl, name, TOTAL_SAVINGS_SENSOR),
+        configuration,
+    ]
+    entities.extend(PVManagementSensor(ctrl, name, description) for description in MAIN_SENSORS)
 
-    @property
-    def native_value(self) -> float | None:
-        rate = self.ctrl.autarky_rate
-        if rate is None:
-            return None
-        return round(rate, 1)
+    # === OPTIONAL GROUPS (quota, benchmark, heat pump, battery, PV strings) ===
+    sensor_groups = SensorGroupManager(ctrl, name, async_add_entities, configuration)
+    entities.extend(sensor_groups.initial_entities())
+    hass.data[DOMAIN][entry.entry_id][DATA_SENSOR_GROUPS] = sensor_groups
 
+    async_add_entities(entities)
 
-# =============================================================================
-# STATISTICS SENSORS
-# =============================================================================
 
+def _quota_sensors(ctrl, name: str) -> list[SensorEntity]:
+    """Electricity quota (only if enabled)."""
+    if not ctrl.quota_enabled:
+        return []
+    return [PVManagementSensor(ctrl, name, description) for description in QUOTA_SENSORS]
 
-class AverageDailySavingsSensor(BaseEntity):
-    """Average daily savings."""
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Ersparnis/Tag",
-            unit="€/Tag",
-            icon="mdi:calendar-today",
-            state_class=SensorStateClass.MEASUREMENT,
+def _benchmark_sensors(ctrl, name: str) -> list[SensorEntity]:
+    """Energy benchmark (only if enabled)."""
+    if not ctrl.benchmark_enabled:
+        return []
+    descriptions = list(BENCHMARK_SENSORS)
+    if ctrl.pv_strings:
+        descriptions.append(BENCHMARK_SPECIFIC_YIELD_SENSOR)
+    return [PVManagementSensor(ctrl, name, description) for description in descriptions]
+
+
+def _heatpump_sensors(ctrl, name: str) -> list[SensorEntity]:
+    """Heat pump benchmark (only with benchmark + heat pump enabled)."""
+    if not (ctrl.benchmark_enabled and ctrl.benchmark_heatpump):
+        return []
+    return [PVManagementSensor(ctrl, name, description) for description in HEATPUMP_SENSORS]
+
+
+def _battery_sensors(ctrl, name: str) -> list[SensorEntity]:
+    """Battery (only if at least one entity is configured)."""
+    if not (ctrl.battery_soc_entity or ctrl.battery_charge_entity or ctrl.battery_discharge_entity):
+        return []
+    return [PVManagementSensor(ctrl, name, description) for description in BATTERY_SENSORS]
+
+
+def _pv_string_sensors(ctrl, name: str) -> list[SensorEntity]:
+    """PV strings (optional)."""
+    entities: list[SensorEntity] = []
+    if not ctrl.pv_strings:
+        return entities
+    strings = [PVString(*string) for string in ctrl.pv_strings]
+    for string in strings:
+        entities.extend(
+            PVStringSensor(ctrl, name, description, string)
+            for description in PV_STRING_SENSORS
+            if description.exists_fn(string)
         )
+    entities.append(PVManagementSensor(ctrl, name, PV_STRING_TOTAL_PRODUCTION_SENSOR))
+    if any(string.power_entity_id for string in strings):
+        entities.extend(PVManagementSensor(ctrl, name, description) for description in PV_STRING_TOTAL_PEAK_SENSORS)
+    return entities
+
+
+# Optional sensor groups: (key, signature of the options the group is built from, builder).
+# A group is only rebuilt when its signature changes; entity options that sensors
+# read live from the controller (e.g. battery entity ids) are not part of it.
+OPTIONAL_SENSOR_GROUPS: tuple[tuple[str, Callable[[Any], Any], Callable[[Any, str], list]], ...] = (
+    ("quota", lambda ctrl: bool(ctrl.quota_enabled), _quota_sensors),
+    ("benchmark", lambda ctrl: bool(ctrl.pv_strings) if ctrl.benchmark_enabled else None, _benchmark_sensors),
+    ("heatpump", lambda ctrl: bool(ctrl.benchmark_enabled and ctrl.benchmark_heatpump), _heatpump_sensors),
+    ("battery", lambda ctrl: bool(ctrl.battery_soc_entity or ctrl.battery_charge_entity
+                                  or ctrl.battery_discharge_entity), _battery_sensors),
+    ("pv_strings", lambda ctrl: tuple(ctrl.pv_strings), _pv_string_sensors),
+)
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.average_daily_savings, 2)
 
+class SensorGroupManager:
+    """Adds and removes the optional sensor groups on a live controller (no entry reload).
 
-class AverageMonthlySavingsSensor(BaseEntity):
-    """Average monthly savings."""
+    Also moves the configuration sensor's health subscription to changed meters.
+    """
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Ersparnis/Monat",
-            unit="€/Monat",
-            icon="mdi:calendar-month",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
+    def __init__(
+        self, ctrl, name: str, async_add_entities, configuration: ConfigurationDiagnosticSensor
+    ) -> None:
+        self._ctrl = ctrl
+        self._name = name
+        self._async_add_entities = async_add_entities
+        self._configuration = configuration
+        self._active: dict[str, tuple[Any, list[SensorEntity]]] = {}
+
+    def initial_entities(self) -> list[SensorEntity]:
+        """Builds all optional groups for the platform setup."""
+        entities: list[SensorEntity] = []
+        for key, signature, build in OPTIONAL_SENSOR_GROUPS:
+            group = build(self._ctrl, self._name)
+            self._active[key] = (signature(self._ctrl), group)
+            entities.extend(group)
+        return entities
+
+    async def async_refresh(self) -> None:
+        """Rebuilds every group whose options changed; all other entities stay untouched."""
+        if self._configuration.hass is not None:
+            self._configuration.async_track_monitored()
+        added: list[SensorEntity] = []
+        for key, signature, build in OPTIONAL_SENSOR_GROUPS:
+            new_signature = signature(self._ctrl)
+            old_signature, old_group = self._active.get(key, (None, []))
+            if new_signature == old_signature:
+                continue
+            for entity in old_group:
+                if entity.hass is not None:
+                    await entity.async_remove()
+            group = build(self._ctrl, self._name)
+            self._active[key] = (new_signature, group)
+            added.extend(group)
+            _LOGGER.debug("Sensor group %s rebuilt: %d -> %d entities", key, len(old_group), len(group))
+        if added:
+            self._async_add_entities(added)
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.average_monthly_savings, 2)
 
+class BaseEntity(SensorEntity):
+    """Base class for all sensors, driven by a PVSensorEntityDescription."""
 
-class AverageYearlySavingsSensor(BaseEntity):
-    """Average yearly savings."""
+    entity_description: PVSensorEntityDescription
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+    # Attribute policy: attributes are recorded by default. Values that change with
+    # every update and merely repeat another sensor's state are live-only
+    # (unrecorded_attributes of the description). Internal bookkeeping (tracked totals,
+    # ingest counters) is never an attribute and is only available via the config
+    # entry diagnostics.
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Ersparnis/Jahr",
-            unit="€/Jahr",
-            icon="mdi:calendar",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
+    def __init__(self, ctrl, name: str, description: PVSensorEntityDescription, key: str | None = None):
+        self.ctrl = ctrl
+        self.entity_description = description
+        key = key or description.key
+        self._attr_name = key
+        self._attr_unique_id = sensor_unique_id(name, key)
+        self._attr_device_info = get_device_info(name, description.device_type)
+        # Tier sensors only listen to their scheduler, not to the data groups they read
+        if description.refresh_tier == REFRESH_TIER_REALTIME:
+            self._update_groups = description.update_groups
+        else:
+            self._update_groups = frozenset({description.refresh_tier})
+        self._removed = False
+        self._deadband_key = DEADBAND_FAMILIES.get(description.native_unit_of_measurement)
+        self._last_published: tuple | None = None
+        # Attribute cache, valid while the controller version of our update groups is unchanged
+        self._attrs_cache: dict[str, Any] | None = None
+        self._attrs_version = -1
 
     @property
-    def native_value(self) -> float:
-        return round(self.ctrl.average_yearly_savings, 2)
-
-
-class DaysSinceInstallationSensor(BaseEntity):
-    """Days since installation."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Tage",
-            unit="Tage",
-            icon="mdi:calendar-clock",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-        )
+    def available(self) -> bool:
+        """Sensor is available once the controller state is known (restored or initialised)."""
+        return self.ctrl.ready
 
     @property
-    def native_value(self) -> int:
-        return self.ctrl.days_since_installation
-
-
-# =============================================================================
-# FORECAST SENSORS
-# =============================================================================
-
-
-class EstimatedRemainingDaysSensor(BaseEntity):
-    """Estimated remaining days until amortization."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Restlaufzeit",
-            unit="Tage",
-            icon="mdi:timer-sand",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
+    def native_value(self):
+        return self.entity_description.value_fn(self.ctrl)
 
     @property
-    def native_value(self) -> int | None:
-        return self.ctrl.estimated_remaining_days
+    def icon(self) -> str | None:
+        if self.entity_description.icon_fn is not None:
+            return self.entity_description.icon_fn(self.ctrl)
+        return self.entity_description.icon
 
     @property
-    def extra_state_attributes(self):
-        remaining = self.ctrl.estimated_remaining_days
-        if remaining is None:
-            return {"status": "Calculation not possible"}
-
-        years = remaining // 365
-        months = (remaining % 365) // 30
-        days = remaining % 30
-
-        parts = []
-        if years > 0:
-            parts.append(f"{years} year{'s' if years > 1 else ''}")
-        if months > 0:
-            parts.append(f"{months} month{'s' if months > 1 else ''}")
-        if days > 0 or not parts:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        description = self.entity_description
+        if description.attrs_fn is None:
+            return None
+        if description.cache_attributes:
+            return self._cached_attributes(lambda: description.attrs_fn(self.ctrl))
+        return description.attrs_fn(self.ctrl)
 
-        return {
-            "formatted": ", ".join(parts),
-            "years": years,
-            "months": months,
-            "days": days,
-        }
+    async def async_added_to_hass(self):
+        self._removed = False
+        self.ctrl.register_entity_listener(self._on_ctrl_update, self._update_groups)
 
+    async def async_will_remove_from_hass(self):
+        self._removed = True
+        self.ctrl.unregister_entity_listener(self._on_ctrl_update)
 
-class EstimatedPaybackDateSensor(BaseEntity):
-    """Estimated payback date."""
+    def _cached_attributes(self, build: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Returns the attribute dict, rebuilt only after one of our update groups changed."""
+        version = self.ctrl.groups_version(self._update_groups)
+        if version != self._attrs_version:
+            self._attrs_cache = build()
+            self._attrs_version = version
+        return self._attrs_cache
+
+    def _publish_fingerprint(self) -> tuple:
+        """Everything visible in the state machine: value, attributes, availability, icon."""
+        attrs = self.extra_state_attributes
+        return (self.native_value, dict(attrs) if attrs else None, self.available, self.icon)
+
+    def _is_significant(self, fingerprint: tuple) -> bool:
+        """True if the new fingerprint differs enough from the last published one.
+
+        Within the family deadband only availability and icon changes are written;
+        attributes follow with the next significant value change.
+        """
+        last = self._last_published
+        if last is None:
+            return True
+        if fingerprint == last:
+            return False
+        deadband = self.ctrl.deadbands.get(self._deadband_key, 0.0) if self._deadband_key else 0.0
+        if deadband <= 0 or fingerprint[2:] != last[2:]:
+            return True
+        new, old = fingerprint[0], last[0]
+        if not isinstance(new, (int, float)) or not isinstance(old, (int, float)):
+            return True
+        return abs(new - old) >= deadband
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Datum",
-            icon="mdi:calendar-check",
-            device_class=SensorDeviceClass.DATE,
+    @callback
+    def _on_ctrl_update(self):
+        if self._removed or not self.hass:
+            return
+        fingerprint = self._publish_fingerprint()
+        if not self._is_significant(fingerprint):
+            return
+        self._last_published = fingerprint
+        self.async_write_ha_state()
+
+
+class PVManagementSensor(BaseEntity):
+    """Generic sensor, fully described by its entity description."""
+
+    # Unrecorded attributes are class-wide in Home Assistant. Attribute names are either
+    # live-only in every description or in none, so the union is exact per sensor.
+    _unrecorded_attributes = frozenset().union(
+        *(
+            description.unrecorded_attributes
+            for descriptions in (MAIN_SENSORS, QUOTA_SENSORS, BATTERY_SENSORS, BENCHMARK_SENSORS, HEATPUMP_SENSORS)
+            for description in descriptions
         )
+    )
 
-    @property
-    def native_value(self) -> date | None:
-        return self.ctrl.estimated_payback_date
-
-    @property
-    def icon(self) -> str:
-        if self.ctrl.is_amortised:
-            return "mdi:calendar-check"
-        return "mdi:calendar-question"
-
-
-# =============================================================================
-# ENVIRONMENT SENSORS
-# =============================================================================
 
+class PVStringSensor(BaseEntity):
+    """Per-string sensor; the key is prefixed with the string name."""
 
-class CO2SavedSensor(BaseEntity):
-    """Saved CO2 emissions."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "CO2 Ersparnis",
-            unit="kg",
-            icon="mdi:molecule-co2",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-        )
+    entity_description: PVStringSensorEntityDescription
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.co2_saved_kg, 1)
+    def __init__(self, ctrl, name: str, description: PVStringSensorEntityDescription, string: PVString):
+        super().__init__(ctrl, name, description, key=f"{string.name} {description.key}")
+        self._string = string
 
     @property
-    def extra_state_attributes(self):
-        kg = self.ctrl.co2_saved_kg
-        return {
-            "tonnes": f"{kg / 1000:.2f} t",
-            "trees_equivalent": int(kg / 21),
-            "car_km_equivalent": int(kg / 0.12),
-        }
-
+    def native_value(self):
+        return self.entity_description.value_fn(self.ctrl, self._string)
 
-# =============================================================================
-# CONFIGURATION SENSORS (DIAGNOSTICS)
-# =============================================================================
 
+class TotalSavingsSensor(BaseEntity):
+    """Total savings in currency.
 
-class FixedPriceSensor(BaseEntity):
-    """Configured fixed price."""
+    The attribute snapshot of older versions is migrated by the controller
+    (async_load_state) before the platforms are set up.
+    """
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Preis Fix",
-            unit="ct/kWh",
-            icon="mdi:currency-eur",
-            state_class=SensorStateClass.MEASUREMENT,
-            entity_category=EntityCategory.DIAGNOSTIC,
-            device_type=DEVICE_PRICES,
-        )
+    _unrecorded_attributes = TOTAL_SAVINGS_SENSOR.unrecorded_attributes
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.fixed_price_ct, 2)
-
-
-class GrossPriceSensor(BaseEntity):
-    """Gross electricity price for Energy Dashboard (EUR/kWh)."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Preis Brutto",
-            unit="EUR/kWh",
-            icon="mdi:currency-eur",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_PRICES,
-        )
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.gross_price, 4)
-
-
-class CurrentFeedInTariffSensor(BaseEntity):
-    """Current feed-in tariff."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Preis Einspeisung",
-            unit="€/kWh",
-            icon="mdi:currency-eur",
-            state_class=SensorStateClass.MEASUREMENT,
-            entity_category=EntityCategory.DIAGNOSTIC,
-            device_type=DEVICE_PRICES,
-        )
+class ConfigurationDiagnosticSensor(BaseEntity):
+    """Diagnostic sensor showing all configured sensors."""
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.current_feed_in_tariff, 4)
-
-
-class InstallationCostSensor(BaseEntity):
-    """Installation costs of PV system."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Amort Kosten",
-            unit="€",
-            icon="mdi:cash",
-            device_class=SensorDeviceClass.MONETARY,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
+    _unrecorded_attributes = CONFIGURATION_SENSOR.unrecorded_attributes
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.installation_cost, 2)
+    def __init__(self, ctrl, name: str, entry: ConfigEntry):
+        super().__init__(ctrl, name, CONFIGURATION_SENSOR)
+        self._entry = entry
+        # Health of the monitored entities, only refreshed on their state changes
+        self._monitored: tuple[str | None, ...] = ()
+        self._health: dict[str, str] = {}
+        self._health_version = 0
+        self._unsub_health = None
 
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.async_track_monitored()
 
-class ConfigurationDiagnosticSensor(BaseEntity):
-    """Diagnostic sensor showing all configured sensors."""
+    async def async_will_remove_from_hass(self):
+        await super().async_will_remove_from_hass()
+        if self._unsub_health is not None:
+            self._unsub_health()
+            self._unsub_health = None
 
-    def __init__(self, ctrl, name: str, entry: ConfigEntry):
-        super().__init__(
-            ctrl,
-            name,
-            "Konfiguration",
-            icon="mdi:cog",
-            entity_category=EntityCategory.DIAGNOSTIC,
+    @callback
+    def async_track_monitored(self) -> None:
+        """(Re)subscribes to the monitored entities when the configuration changed (options update)."""
+        monitored = (
+            self.ctrl.pv_production_entity,
+            self.ctrl.grid_export_entity,
+            self.ctrl.grid_import_entity,
+            self.ctrl.consumption_entity,
         )
-        self._entry = entry
+        if monitored == self._monitored:
+            return
+        if self._unsub_health is not None:
+            self._unsub_health()
+            self._unsub_health = None
+        self._monitored = monitored
+        entity_ids = [entity_id for entity_id in monitored if entity_id]
+        if entity_ids:
+            self._unsub_health = async_track_state_change_event(
+                self.hass, entity_ids, self._on_monitored_change
+            )
+        self._health = {entity_id: self._get_entity_status(entity_id) for entity_id in entity_ids}
+        self._health_version += 1
 
-    def _get_entity_status(self, entity_id: str | None) -> dict[str, Any]:
+    @callback
+    def _on_monitored_change(self, event: Event) -> None:
+        """Only a change of the status class (OK/unavailable/...) is written."""
+        entity_id = event.data["entity_id"]
+        status = self._get_entity_status(entity_id)
+        if self._health.get(entity_id) == status:
+            return
+        self._health[entity_id] = status
+        self._health_version += 1
+        self._on_ctrl_update()
+
+    def _get_entity_status(self, entity_id: str | None) -> str:
         """Gets status of an entity."""
         if not entity_id:
-            return {"configured": False, "entity_id": None, "state": None, "status": "not configured"}
+            return "not configured"
 
         state = self.hass.states.get(entity_id)
         if state is None:
-            return {"configured": True, "entity_id": entity_id, "state": None, "status": "not found"}
+            return "not found"
         elif state.state in ("unavailable", "unknown"):
-            return {"configured": True, "entity_id": entity_id, "state": state.state, "status": "unavailable"}
+            return "unavailable"
         else:
-            return {"configured": True, "entity_id": entity_id, "state": state.state, "status": "OK"}
+            return "OK"
+
+    def _status(self, entity_id: str | None) -> str:
+        return self._health.get(entity_id, "not found") if entity_id else "not configured"
 
     @property
     def native_value(self) -> str:
         issues = 0
         for entity_id in [self.ctrl.pv_production_entity, self.ctrl.grid_export_entity]:
-            if entity_id:
-                status = self._get_entity_status(entity_id)
-                if status["status"] != "OK":
-                    issues += 1
+            if entity_id and self._status(entity_id) != "OK":
+                issues += 1
         if issues == 0:
             return "OK"
         else:
@@ -1007,26 +1297,28 @@ class ConfigurationDiagnosticSensor(BaseEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        pv_status = self._get_entity_status(self.ctrl.pv_production_entity)
-        export_status = self._get_entity_status(self.ctrl.grid_export_entity)
-        import_status = self._get_entity_status(self.ctrl.grid_import_entity)
-        consumption_status = self._get_entity_status(self.ctrl.consumption_entity)
-
+        version = self.ctrl.groups_version(self._update_groups) + self._health_version
+        if version != self._attrs_version:
+            self._attrs_cache = self._build_attributes()
+            self._attrs_version = version
+        return self._attrs_cache
+
+    def _build_attributes(self) -> dict[str, Any]:
+        ctrl = self.ctrl
         return {
-            "pv_production_entity": pv_status["entity_id"],
-            "pv_production_status": pv_status["status"],
-            "grid_export_entity": export_status["entity_id"],
-            "grid_export_status": export_status["status"],
-            "grid_import_entity": import_status["entity_id"],
-            "grid_import_status": import_status["status"],
-            "consumption_entity": consumption_status["entity_id"],
-            "consumption_status": consumption_status["status"],
-            "fixed_price_ct": f"{self.ctrl.fixed_price_ct:.2f}",
-            "feed_in_tariff_eur": f"{self.ctrl.current_feed_in_tariff:.4f}",
-            "tracked_self_consumption_kwh": round(self.ctrl._total_self_consumption_kwh, 4),
-            "tracked_feed_in_kwh": round(self.ctrl._total_feed_in_kwh, 4),
-            "first_seen_date": self.ctrl._first_seen_date.isoformat() if self.ctrl._first_seen_date else None,
-            "days_tracked": self.ctrl.days_since_installation,
+            "pv_production_entity": ctrl.pv_production_entity or None,
+            "pv_production_status": self._status(ctrl.pv_production_entity),
+            "grid_export_entity": ctrl.grid_export_entity or None,
+            "grid_export_status": self._status(ctrl.grid_export_entity),
+            "grid_import_entity": ctrl.grid_import_entity or None,
+            "grid_import_status": self._status(ctrl.grid_import_entity),
+            "consumption_entity": ctrl.consumption_entity or None,
+            "consumption_status": self._status(ctrl.consumption_entity),
+            "fixed_price_ct": f"{ctrl.fixed_price_ct:.2f}",
+            "feed_in_tariff_eur": f"{ctrl.current_feed_in_tariff:.4f}",
+            "first_seen_date": ctrl._first_seen_date.isoformat() if ctrl._first_seen_date else None,
+            "days_tracked": ctrl.days_since_installation,
+            "backfill": ctrl.backfill_progress,
         }
 
     @property
@@ -1035,823 +1327,3 @@ class ConfigurationDiagnosticSensor(BaseEntity):
             return "mdi:check-circle"
         else:
             return "mdi:alert-circle"
-
-
-# =============================================================================
-# DAILY ELECTRICITY COSTS
-# =============================================================================
-
-
-class DailyFeedInSensor(BaseEntity):
-    """Feed-in today: Earnings and Amount."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Tages Einspeisung",
-            unit="€",
-            icon="mdi:transmission-tower-export",
-            state_class=SensorStateClass.TOTAL,
-            device_class=SensorDeviceClass.MONETARY,
-            device_type=DEVICE_PRICES,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.daily_feed_in_earnings, 2)
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        return {
-            "amount_kwh": round(self.ctrl.daily_feed_in_kwh, 2),
-            "tariff_ct": f"{self.ctrl.current_feed_in_tariff * 100:.2f}",
-        }
-
-
-class DailyGridImportSensor(BaseEntity):
-    """Grid import today: Costs and Amount."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Tages Netzbezug",
-            unit="€",
-            icon="mdi:transmission-tower-import",
-            state_class=SensorStateClass.TOTAL,
-            device_class=SensorDeviceClass.MONETARY,
-            device_type=DEVICE_PRICES,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.daily_grid_import_cost, 2)
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        avg = self.ctrl.daily_average_price_ct
-        return {
-            "amount_kwh": round(self.ctrl.daily_grid_import_kwh, 2),
-            "average_ct": round(avg, 2) if avg else None,
-        }
-
-
-class DailyNetElectricityCostSensor(BaseEntity):
-    """Net electricity cost today (Import minus Export)."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Tages Stromkosten",
-            unit="€",
-            icon="mdi:cash-register",
-            state_class=SensorStateClass.TOTAL,
-            device_class=SensorDeviceClass.MONETARY,
-            device_type=DEVICE_PRICES,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.daily_net_electricity_cost, 2)
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        return {
-            "import_eur": round(self.ctrl.daily_grid_import_cost, 2),
-            "export_eur": round(self.ctrl.daily_feed_in_earnings, 2),
-        }
-
-
-# =============================================================================
-# ELECTRICITY QUOTA SENSORS
-# =============================================================================
-
-
-class QuotaRemainingSensor(BaseEntity):
-    """Quota Remaining - Main sensor."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Verbleibend",
-            unit="kWh",
-            icon="mdi:lightning-bolt",
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.quota_remaining_kwh, 1)
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        return {
-            "yearly_quota_kwh": self.ctrl.quota_yearly_kwh,
-            "consumed_kwh": round(self.ctrl.quota_consumed_kwh, 1),
-            "monthly_rate_eur": self.ctrl.quota_monthly_rate if self.ctrl.quota_monthly_rate > 0 else None,
-        }
-
-
-class QuotaConsumedPercentSensor(BaseEntity):
-    """Quota Consumed - Percent of yearly quota."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Verbrauch",
-            unit="%",
-            icon="mdi:gauge",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.quota_consumed_percent, 1)
-
-
-class QuotaReserveSensor(BaseEntity):
-    """Quota Reserve - positive = under budget, negative = over."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Reserve",
-            unit="kWh",
-            icon="mdi:shield-check",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.quota_reserve_kwh, 1)
-
-    @property
-    def icon(self) -> str:
-        reserve = self.ctrl.quota_reserve_kwh
-        if reserve >= 0:
-            return "mdi:shield-check"
-        return "mdi:shield-alert"
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        return {
-            "expected_kwh": round(self.ctrl.quota_expected_kwh, 1),
-            "consumed_kwh": round(self.ctrl.quota_consumed_kwh, 1),
-        }
-
-
-class QuotaDailyBudgetSensor(BaseEntity):
-    """Quota Daily Budget - how much per day allowed."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Tagesbudget",
-            unit="kWh/Tag",
-            icon="mdi:calendar-today",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        budget = self.ctrl.quota_daily_budget_kwh
-        if budget is None:
-            return None
-        return round(budget, 1)
-
-
-class QuotaForecastSensor(BaseEntity):
-    """Quota Forecast - projected consumption at period end."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Prognose",
-            unit="kWh",
-            icon="mdi:crystal-ball",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        forecast = self.ctrl.quota_forecast_kwh
-        if forecast is None:
-            return None
-        return round(forecast, 0)
-
-    @property
-    def icon(self) -> str:
-        forecast = self.ctrl.quota_forecast_kwh
-        if forecast is None:
-            return "mdi:crystal-ball"
-        if forecast <= self.ctrl.quota_yearly_kwh:
-            return "mdi:trending-down"
-        return "mdi:trending-up"
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        forecast = self.ctrl.quota_forecast_kwh
-        attrs = {
-            "quota_kwh": self.ctrl.quota_yearly_kwh,
-        }
-        if forecast is not None:
-            diff = forecast - self.ctrl.quota_yearly_kwh
-            attrs["forecast_diff_kwh"] = round(diff, 0)
-            if diff > 0:
-                attrs["evaluation"] = f"Expected {diff:.0f} kWh over quota"
-            else:
-                attrs["evaluation"] = f"Expected {abs(diff):.0f} kWh under quota"
-        return attrs
-
-
-class QuotaDaysRemainingSensor(BaseEntity):
-    """Quota Remaining Days - days left in period."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Restlaufzeit",
-            unit="Tage",
-            icon="mdi:calendar-clock",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> int:
-        return self.ctrl.quota_days_remaining
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        start = self.ctrl.quota_start_date
-        end = self.ctrl.quota_end_date
-        return {
-            "period_start": start.isoformat() if start else None,
-            "period_end": end.isoformat() if end else None,
-            "days_elapsed": self.ctrl.quota_days_elapsed,
-            "days_total": self.ctrl.quota_days_total,
-        }
-
-
-class QuotaTodayRemainingSensor(BaseEntity):
-    """Quota Today Remaining - how much allowed to consume today."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Heute Verbleibend",
-            unit="kWh",
-            icon="mdi:clock-check",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.quota_today_remaining_kwh
-        if val is None:
-            return None
-        return round(val, 1)
-
-    @property
-    def icon(self) -> str:
-        val = self.ctrl.quota_today_remaining_kwh
-        if val is None:
-            return "mdi:clock-check"
-        if val >= 0:
-            return "mdi:clock-check"
-        return "mdi:clock-alert"
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        budget = self.ctrl.quota_daily_budget_kwh
-        return {
-            "daily_budget_kwh": round(budget, 1) if budget is not None else None,
-            "consumed_today_kwh": round(self.ctrl.daily_grid_import_kwh, 1),
-        }
-
-
-class QuotaStatusSensor(BaseEntity):
-    """Quota Status - Text summary."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Status",
-            icon="mdi:text-box-check",
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> str:
-        return self.ctrl.quota_status_text
-
-    @property
-    def icon(self) -> str:
-        reserve = self.ctrl.quota_reserve_kwh
-        if reserve >= 0:
-            return "mdi:text-box-check"
-        return "mdi:text-box-remove"
-
-
-# =============================================================================
-# BATTERY SENSORS
-# =============================================================================
-
-
-class BatterySOCSensor(BaseEntity):
-    """Battery State of Charge."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Ladestand",
-            unit="%",
-            icon="mdi:battery-50",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BATTERY,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        soc = self.ctrl.battery_soc
-        if soc is None:
-            return None
-        return round(soc, 1)
-
-    @property
-    def icon(self) -> str:
-        soc = self.ctrl.battery_soc
-        if soc is None:
-            return "mdi:battery-unknown"
-        if soc >= 95:
-            return "mdi:battery"
-        elif soc >= 85:
-            return "mdi:battery-90"
-        elif soc >= 75:
-            return "mdi:battery-80"
-        elif soc >= 65:
-            return "mdi:battery-70"
-        elif soc >= 55:
-            return "mdi:battery-60"
-        elif soc >= 45:
-            return "mdi:battery-50"
-        elif soc >= 35:
-            return "mdi:battery-40"
-        elif soc >= 25:
-            return "mdi:battery-30"
-        elif soc >= 15:
-            return "mdi:battery-20"
-        elif soc >= 5:
-            return "mdi:battery-10"
-        else:
-            return "mdi:battery-outline"
-
-
-class BatteryChargeTotalSensor(BaseEntity):
-    """Battery Total Charge."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Ladung Gesamt",
-            unit="kWh",
-            icon="mdi:battery-charging",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-            device_type=DEVICE_BATTERY,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.battery_charge_total
-        if val is None:
-            return None
-        return round(val, 2)
-
-
-class BatteryDischargeTotalSensor(BaseEntity):
-    """Battery Total Discharge."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Entladung Gesamt",
-            unit="kWh",
-            icon="mdi:battery-arrow-down",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-            device_type=DEVICE_BATTERY,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.battery_discharge_total
-        if val is None:
-            return None
-        return round(val, 2)
-
-
-class BatteryEfficiencySensor(BaseEntity):
-    """Battery Efficiency."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Effizienz",
-            unit="%",
-            icon="mdi:battery-heart-variant",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BATTERY,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.battery_efficiency
-        if val is None:
-            return None
-        return round(val, 1)
-
-
-class BatteryCyclesSensor(BaseEntity):
-    """Battery Cycles (estimated)."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Zyklen",
-            unit="Cycles",
-            icon="mdi:battery-sync",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_type=DEVICE_BATTERY,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.battery_cycles_estimate
-        if val is None:
-            return None
-        return round(val, 1)
-
-
-# =============================================================================
-# ROI SENSORS
-# =============================================================================
-
-
-class ROISensor(BaseEntity):
-    """Return on Investment."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "ROI",
-            unit="%",
-            icon="mdi:chart-line",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.roi_percent
-        if val is None:
-            return None
-        return round(val, 2)
-
-
-class AnnualROISensor(BaseEntity):
-    """Annual ROI."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "ROI pro Jahr",
-            unit="%/Year",
-            icon="mdi:chart-timeline-variant",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.annual_roi_percent
-        if val is None:
-            return None
-        return round(val, 2)
-
-
-# =============================================================================
-# BENCHMARK SENSORS
-# =============================================================================
-
-
-class BenchmarkAvgSensor(BaseEntity):
-    """Benchmark Average - Reference consumption."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Haus Durchschnitt",
-            unit="kWh/Jahr",
-            icon="mdi:home-group",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> int:
-        return self.ctrl.benchmark_avg_consumption_kwh
-
-
-class BenchmarkOwnSensor(BaseEntity):
-    """Benchmark Total Consumption - including HP, extrapolated."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Gesamtverbrauch",
-            unit="kWh/Jahr",
-            icon="mdi:home-lightning-bolt",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_own_annual_consumption_kwh
-        if val is None:
-            return None
-        return round(val, 0)
-
-
-class BenchmarkHouseholdSensor(BaseEntity):
-    """Household consumption without HP, extrapolated."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Haus Verbrauch",
-            unit="kWh/Jahr",
-            icon="mdi:home-lightning-bolt-outline",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_household_consumption_kwh
-        if val is None:
-            return None
-        return round(val, 0)
-
-
-class BenchmarkGridImportSensor(BaseEntity):
-    """Annual grid import extrapolated."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Netz Bezug",
-            unit="kWh/Jahr",
-            icon="mdi:transmission-tower-import",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_annual_grid_import_kwh
-        if val is None:
-            return None
-        return round(val, 0)
-
-
-class BenchmarkAnnualPVSensor(BaseEntity):
-    """Extrapolated annual PV production."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "PV Produktion",
-            unit="kWh/Jahr",
-            icon="mdi:solar-power",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_annual_pv_production_kwh
-        if val is None:
-            return None
-        return round(val, 0)
-
-
-class BenchmarkSpecificYieldSensor(BaseEntity):
-    """Specific Yield in kWh/kWp."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "PV Ertrag",
-            unit="kWh/kWp",
-            icon="mdi:solar-power-variant-outline",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_specific_yield
-        if val is None:
-            return None
-        return round(val, 0)
-
-
-class BenchmarkComparisonSensor(BaseEntity):
-    """Benchmark Comparison - Own vs Average in %."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Haus Vergleich",
-            unit="%",
-            icon="mdi:check-circle",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_consumption_vs_avg
-        if val is None:
-            return None
-        return round(val, 1)
-
-    @property
-    def icon(self) -> str:
-        val = self.ctrl.benchmark_consumption_vs_avg
-        if val is None:
-            return "mdi:check-circle"
-        if val <= 0:
-            return "mdi:check-circle"
-        return "mdi:alert"
-
-
-class BenchmarkCO2Sensor(BaseEntity):
-    """Benchmark CO2 Avoided."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "PV CO2 Vermieden",
-            unit="kg/Jahr",
-            icon="mdi:molecule-co2",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_co2_avoided_kg
-        if val is None:
-            return None
-        return round(val, 1)
-
-
-class BenchmarkScoreSensor(BaseEntity):
-    """Benchmark Efficiency Score - 0-100 points."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Effizienz Score",
-            unit="Points",
-            icon="mdi:star-circle",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> int | None:
-        return self.ctrl.benchmark_efficiency_score
-
-    @property
-    def icon(self) -> str:
-        score = self.ctrl.benchmark_efficiency_score
-        if score is None:
-            return "mdi:star-outline"
-        if score >= 60:
-            return "mdi:star-circle"
-        if score >= 30:
-            return "mdi:star-half-full"
-        return "mdi:star-outline"
-
-
-class BenchmarkRatingSensor(BaseEntity):
-    """Benchmark Rating - Textual evaluation."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Bewertung",
-            icon="mdi:trophy",
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> str | None:
-        return self.ctrl.benchmark_rating
-
-
-class BenchmarkHeatpumpAvgSensor(BaseEntity):
-    """Benchmark HP Average."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "WP Durchschnitt",
-            unit="kWh/Jahr",
-            icon="mdi:heat-pump",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> int | None:
-        return self.ctrl.benchmark_avg_heatpump_kwh
-
-
-class BenchmarkHeatpumpOwnSensor(BaseEntity):
-    """Benchmark HP Own Consumption extrapolated."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "WP Verbrauch",
-            unit="kWh/Jahr",
-            icon="mdi:heat-pump-outline",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_own_heatpump_kwh
-        if val is None:
-            return None
-        return round(val, 0)
-
-
-class BenchmarkHeatpumpComparisonSensor(BaseEntity):
-    """Benchmark HP Comparison in %."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "WP Vergleich",
-            unit="%",
-            icon="mdi:heat-pump",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_BENCHMARK,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        val = self.ctrl.benchmark_heatpump_vs_avg
-        if val is None:
-            return None
-        return round(val, 1)
\ No newline at end of file